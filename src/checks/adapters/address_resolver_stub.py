@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from checks.application.ports.fias_client import NormalizedAddress
 from checks.domain.value_objects.address import (
     AddressNormalized,
     AddressRaw,
@@ -25,3 +26,12 @@ class AddressResolverStub:
         normalized = normalize_address(raw)
         normalized.source = 'stub'
         return normalized
+
+    @staticmethod
+    async def normalize_with_fias(
+        raw: AddressRaw,
+        found: NormalizedAddress | None,
+    ) -> AddressNormalized:
+        """Ignore the FIAS outcome and normalize with domain rules."""
+
+        return await AddressResolverStub.normalize(raw)
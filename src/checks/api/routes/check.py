@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import inspect
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
@@ -23,7 +22,10 @@ from checks.presentation.api.v1.serialization.input.checks import (
     LegacyCheckIn,
 )
 from checks.presentation.api.v1.serialization.output.checks import RiskCardOut
-from shared.kernel.kad_arbitr_client_factory import build_kad_arbitr_client
+from shared.kernel.check_single_flight_factory import (
+    get_check_single_flight,
+)
+from shared.kernel.kad_arbitr_client_factory import get_kad_arbitr_client
 from shared.kernel.repositories import check_cache_repo, check_results_repo
 from shared.kernel.settings import get_settings
 from sources.kad_arbitr.use_cases.resolve_cases_for_participant import (
@@ -36,13 +38,14 @@ router = APIRouter()
 def _build_use_case(request: Request) -> CheckAddressUseCase:
     """Создать use-case с тестовыми адаптерами."""
     settings = get_settings()
-    address_resolver = build_address_resolver(settings)
-    signals_provider = SignalsProviderStub({})
     fias_client = getattr(request.app.state, 'fias_client', None)
 
     if fias_client is None:
         raise RuntimeError('FIAS client is not configured.')
 
+    address_resolver = build_address_resolver(settings, fias_client)
+    signals_provider = SignalsProviderStub({})
+
     address_risk_use_case = AddressRiskCheckUseCase(
         address_resolver=address_resolver,
         signals_provider=signals_provider,
@@ -56,6 +59,7 @@ def _build_use_case(request: Request) -> CheckAddressUseCase:
         fias_mode=settings.FIAS_MODE,
         cache_version=settings.CHECK_CACHE_VERSION,
         settings=settings,
+        single_flight=get_check_single_flight(settings),
     )
 
 
@@ -115,20 +119,13 @@ async def internal_kad_arbitr_search(
     """Выполнить ручной запрос kad.arbitr.ru."""
 
     settings = get_settings()
-    client = build_kad_arbitr_client(settings=settings)
+    client = get_kad_arbitr_client(settings=settings)
     resolver = ResolveKadArbitrCasesForParticipant(client=client)
-    try:
-        result = await resolver.execute(
-            participant=participant,
-            participant_type=participant_type,
-            max_pages=max_pages,
-        )
-    finally:
-        close_method = getattr(client, 'close', None)
-        if callable(close_method):
-            result_close = close_method()
-            if inspect.isawaitable(result_close):
-                await result_close
+    result = await resolver.execute(
+        participant=participant,
+        participant_type=participant_type,
+        max_pages=max_pages,
+    )
 
     return {
         'participant': participant,
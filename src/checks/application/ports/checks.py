@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from contextlib import AbstractAsyncContextManager
 from typing import Protocol
 from uuid import UUID
 
+from checks.application.ports.fias_client import NormalizedAddress
 from checks.domain.entities.check_cache import CachedCheckEntry
 from checks.domain.entities.check_result import CheckResultSnapshot
 from checks.domain.value_objects.address import (
@@ -12,6 +14,7 @@ from checks.domain.value_objects.address import (
     AddressRaw,
 )
 from risks.domain.entities.risk_card import RiskSignal
+from sources.domain.entities import ListingNormalized
 
 
 class AddressResolverPort(Protocol):
@@ -20,6 +23,31 @@ class AddressResolverPort(Protocol):
     async def normalize(self, raw: AddressRaw) -> AddressNormalized:
         """Асинхронно нормализовать сырой адрес."""
 
+    async def normalize_with_fias(
+        self,
+        raw: AddressRaw,
+        found: NormalizedAddress | None,
+    ) -> AddressNormalized:
+        """Нормализовать адрес с уже известным исходом запроса в ФИАС.
+
+        found равен None, если ФИАС адрес не нашёл или не ответил.
+        Резолверы, не использующие ФИАС, нормализуют адрес как обычно.
+        """
+
+        return await self.normalize(raw)
+
+
+class ListingResolverPort(Protocol):
+    """Порт получения объявления по URL."""
+
+    def canonical_key(self, url_text: str) -> str | None:
+        """Вернуть ключ «источник:id» для URL или None."""
+
+        return None
+
+    async def execute(self, url_text: str) -> ListingNormalized:
+        """Вернуть нормализованное объявление для URL."""
+
 
 class SignalsProviderPort(Protocol):
     """Агрегирующий провайдер сигналов риска."""
@@ -47,8 +75,40 @@ class CheckCacheRepoPort(Protocol):
     async def get(self, key: str) -> CachedCheckEntry | None:
         """Вернуть кэшированную запись."""
 
-    async def set(self, key: str, check_id: UUID) -> None:
-        """Сохранить запись для указанного ключа."""
+    async def get_snapshot(
+        self,
+        key: str,
+    ) -> tuple[CachedCheckEntry, CheckResultSnapshot | None] | None:
+        """Вернуть запись кэша вместе со снимком проверки.
+
+        Кэш, не хранящий снимки, отдаёт запись без снимка: его
+        дочитывают из репозитория результатов.
+        """
+
+        entry = await self.get(key)
+        if entry is None:
+            return None
+        return entry, None
+
+    async def set(
+        self,
+        key: str,
+        check_id: UUID,
+        *,
+        snapshot: CheckResultSnapshot | None = None,
+    ) -> None:
+        """Сохранить запись для указанного ключа.
+
+        snapshot — уже сохранённый снимок этой проверки; кэш может
+        держать его рядом с записью, чтобы не дочитывать при попадании.
+        """
 
     async def cleanup(self) -> None:
         """Удалить протухшие записи."""
+
+
+class CheckLockPort(Protocol):
+    """Порт межпроцессной блокировки вычисления проверки."""
+
+    def hold(self, key: str) -> AbstractAsyncContextManager[bool]:
+        """Удерживать блокировку ключа, вернуть признак захвата."""
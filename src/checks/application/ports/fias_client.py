@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Protocol
@@ -30,8 +31,27 @@ class NormalizedAddress:
     updated_at: datetime | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class FiasBatchResult:
+    """Результат нормализации одного запроса из пакета.
+
+    error содержит исход неудачи (not_found, blocked, upstream_error)
+    или имя исключения; при успехе он пуст.
+    """
+
+    query: str
+    address: NormalizedAddress | None
+    error: str | None = None
+
+
 class FiasClient(Protocol):
     """Контракт клиента ФИАС."""
 
     async def normalize_address(self, query: str) -> NormalizedAddress | None:
         """Вернуть нормализованный адрес или None при неудаче."""
+
+    async def normalize_many(
+        self,
+        queries: Sequence[str],
+    ) -> list[FiasBatchResult]:
+        """Нормализовать пакет запросов с результатом на каждый вход."""
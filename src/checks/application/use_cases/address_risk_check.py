@@ -8,6 +8,9 @@ from checks.application.ports.checks import (
     AddressResolverPort,
     SignalsProviderPort,
 )
+from checks.application.use_cases.check_address_context import (
+    AddressCheckContext,
+)
 from checks.domain.value_objects.address import (
     AddressNormalized,
     AddressRaw,
@@ -41,10 +44,18 @@ class AddressRiskCheckUseCase:
         self._address_resolver = address_resolver
         self._signals_provider = signals_provider
 
-    async def execute(self, raw_address: AddressRaw) -> AddressRiskCheckResult:
+    async def execute(
+        self,
+        raw_address: AddressRaw,
+        *,
+        context: AddressCheckContext | None = None,
+    ) -> AddressRiskCheckResult:
         """Выполнить полный цикл нормализации и построения риска."""
 
-        normalized = await self._address_resolver.normalize(raw_address)
+        if context is None:
+            normalized = await self._address_resolver.normalize(raw_address)
+        else:
+            normalized = await self._normalize_in_context(context)
         signals_tuple = await self._signals_provider.collect(normalized)
         risk_card = build_risk_card(signals_tuple)
         return AddressRiskCheckResult(
@@ -52,3 +63,25 @@ class AddressRiskCheckUseCase:
             signals=list(signals_tuple),
             risk_card=risk_card,
         )
+
+    async def _normalize_in_context(
+        self,
+        context: AddressCheckContext,
+    ) -> AddressNormalized:
+        """Нормализовать адрес один раз, переиспользуя ответ ФИАС."""
+
+        if context.normalized is not None:
+            return context.normalized
+
+        if context.fias_resolved:
+            context.normalized = (
+                await self._address_resolver.normalize_with_fias(
+                    context.raw,
+                    context.fias_address,
+                )
+            )
+        else:
+            context.normalized = await self._address_resolver.normalize(
+                context.raw,
+            )
+        return context.normalized
@@ -14,6 +14,9 @@ from checks.application.use_cases.address_risk_check import (
     AddressRiskCheckResult,
     AddressRiskCheckUseCase,
 )
+from checks.application.use_cases.check_address_context import (
+    AddressCheckContext,
+)
 from checks.application.use_cases.check_address_flow import (
     process_address,
     process_url,
@@ -25,6 +28,9 @@ from checks.application.use_cases.check_address_results import (
 from checks.application.use_cases.check_address_signals import (
     build_single_signal,
 )
+from checks.application.use_cases.check_address_single_flight import (
+    CheckSingleFlight,
+)
 from checks.application.use_cases.check_address_sources import (
     build_gis_gkh_payload,
     build_rosreestr_payload,
@@ -34,7 +40,6 @@ from checks.domain.constants.enums.domain import QueryType
 from checks.domain.entities.check_result import CheckResultSnapshot
 from checks.domain.value_objects.address import (
     AddressNormalized,
-    normalize_address_raw,
 )
 from checks.domain.value_objects.query import CheckQuery
 from checks.infrastructure.listing_resolver_container import (
@@ -58,6 +63,7 @@ class CheckAddressUseCase:
         '_fias_mode',
         '_cache_version',
         '_settings',
+        '_single_flight',
     )
 
     def __init__(
@@ -70,6 +76,7 @@ class CheckAddressUseCase:
         fias_mode: str,
         cache_version: str,
         settings: Settings | None = None,
+        single_flight: CheckSingleFlight | None = None,
     ):
         """Create use-case instance with required ports."""
 
@@ -80,6 +87,7 @@ class CheckAddressUseCase:
         self._fias_mode = fias_mode
         self._cache_version = cache_version
         self._settings = settings
+        self._single_flight = single_flight
 
     async def execute(self, raw_query: str) -> dict[str, Any]:
         """Выполнить проверку по строке адреса (устаревший формат)."""
@@ -180,6 +188,7 @@ class CheckAddressUseCase:
             check_results_repo=self._check_results_repo,
             fias_mode=self._fias_mode,
             cache_version=self._cache_version,
+            single_flight=self._single_flight,
         )
 
     async def _process_url(self, url_text: str) -> tuple[
@@ -214,6 +223,7 @@ class CheckAddressUseCase:
             check_results_repo=self._check_results_repo,
             fias_mode=self._fias_mode,
             cache_version=self._cache_version,
+            single_flight=self._single_flight,
         )
 
     @staticmethod
@@ -240,13 +250,13 @@ class CheckAddressUseCase:
 
     async def _run_address_risk_check(
         self,
-        raw_address: str,
+        context: AddressCheckContext,
     ) -> tuple[AddressRiskCheckResult, tuple[RiskSignal, ...]]:
         """Запустить сценарий риск-проверки адреса."""
 
-        normalized_raw = normalize_address_raw(raw_address)
         result = await self._address_risk_check_use_case.execute(
-            normalized_raw,
+            context.raw,
+            context=context,
         )
         return result, tuple(result.signals)
 
@@ -278,7 +288,7 @@ class CheckAddressUseCase:
 
     async def _fetch_fias_data(
         self,
-        query: str,
+        context: AddressCheckContext,
     ) -> tuple[
         dict[str, Any] | None,
         dict[str, Any] | None,
@@ -294,8 +304,9 @@ class CheckAddressUseCase:
         return await fetch_fias_data(
             fias_client=self._fias_client,
             fias_mode=self._fias_mode,
-            query=query,
+            query=context.value,
             settings=self._settings,
+            context=context,
         )
 
     async def _build_rosreestr_payload(
@@ -37,9 +37,11 @@ async def get_cached_snapshot(
 ) -> tuple[CheckResultSnapshot | None, UUID | None]:
     """Вернуть снапшот проверки и идентификатор, если он есть."""
 
-    entry = await cache_repo.get(key)
-    if not entry:
+    found = await cache_repo.get_snapshot(key)
+    if found is None:
         return None, None
 
-    snapshot = await results_repo.get(entry.check_id)
+    entry, snapshot = found
+    if snapshot is None:
+        snapshot = await results_repo.get(entry.check_id)
     return snapshot, entry.check_id if snapshot else None
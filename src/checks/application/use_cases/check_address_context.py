@@ -0,0 +1,46 @@
+"""Контекст нормализации адреса в рамках одной проверки."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from checks.application.ports.fias_client import NormalizedAddress
+from checks.domain.value_objects.address import (
+    AddressNormalized,
+    AddressRaw,
+    normalize_address_raw,
+)
+
+
+@dataclass(slots=True)
+class AddressCheckContext:
+    """Адрес проверки, нормализуемый один раз на запрос.
+
+    raw задаёт ключ кэша и сохраняемый ввод. Ответ ФИАС записывает
+    fetch_fias_data, и риск-проверка строит AddressNormalized из него,
+    не обращаясь к ФИАС повторно. Сам AddressNormalized тоже хранится
+    здесь после первого расчёта.
+    """
+
+    raw: AddressRaw
+    fias_address: NormalizedAddress | None = None
+    fias_resolved: bool = False
+    normalized: AddressNormalized | None = None
+
+    @classmethod
+    def from_text(cls, text: str) -> AddressCheckContext:
+        """Проверить и обернуть сырой адрес."""
+
+        return cls(raw=normalize_address_raw(text))
+
+    @property
+    def value(self) -> str:
+        """Очищенная строка адреса."""
+
+        return self.raw.value
+
+    def record_fias(self, address: NormalizedAddress | None) -> None:
+        """Запомнить исход запроса в ФИАС, включая промах и сбой."""
+
+        self.fias_address = address
+        self.fias_resolved = True
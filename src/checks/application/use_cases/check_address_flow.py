@@ -12,6 +12,7 @@ from checks.application.helpers.url_extraction import (
 from checks.application.ports.checks import (
     CheckCacheRepoPort,
     CheckResultsRepoPort,
+    ListingResolverPort,
 )
 from checks.application.use_cases.address_risk_check import (
     AddressRiskCheckResult,
@@ -20,6 +21,9 @@ from checks.application.use_cases.check_address_cache import (
     build_cache_key,
     get_cached_snapshot,
 )
+from checks.application.use_cases.check_address_context import (
+    AddressCheckContext,
+)
 from checks.application.use_cases.check_address_listing import (
     try_resolve_listing,
 )
@@ -33,17 +37,19 @@ from checks.application.use_cases.check_address_signals import (
     merge_signals,
     sanitize_input_value,
 )
+from checks.application.use_cases.check_address_single_flight import (
+    CheckSingleFlight,
+)
 from checks.domain.constants.enums.domain import QueryType
 from checks.domain.entities.check_result import CheckResultSnapshot
 from checks.domain.helpers.address_heuristics import is_address_like
-from checks.domain.value_objects.address import normalize_address_raw
 from checks.domain.value_objects.query import CheckQuery
 from checks.domain.value_objects.url import UrlRaw
 from risks.application.scoring import build_risk_card
 from risks.domain.entities.risk_card import RiskSignal
 
 FetchFiasData = Callable[
-    [str],
+    [AddressCheckContext],
     Awaitable[
         tuple[
             dict[str, Any] | None,
@@ -56,118 +62,59 @@ FetchFiasData = Callable[
     ],
 ]
 RunRiskCheck = Callable[
-    [str],
+    [AddressCheckContext],
     Awaitable[tuple[AddressRiskCheckResult, tuple[RiskSignal, ...]]],
 ]
 StoreResult = Callable[
     ...,
     Awaitable[tuple[CheckResultSnapshot, UUID]],
 ]
-
-
-async def process_address(
-    *,
-    text: str,
-    fetch_fias_data: FetchFiasData,
-    run_address_risk_check: RunRiskCheck,
-    store_check_result: StoreResult,
-    check_cache_repo: CheckCacheRepoPort,
-    check_results_repo: CheckResultsRepoPort,
-    fias_mode: str,
-    cache_version: str,
-) -> tuple[
+CheckFlowResult = tuple[
     CheckResultSnapshot | None,
     UUID | None,
     AddressRiskCheckResult | None,
     tuple[RiskSignal, ...],
     dict[str, Any],
-]:
-    """Обработать адресный запрос с учётом кэша."""
+]
 
-    if not is_address_like(text):
-        signals = (
-            build_single_signal(
-                code='query_not_address_like',
-                evidence=('heuristic:address_like',),
-            ),
-        )
-        return None, None, None, signals, {}
 
-    (
-        fias_payload,
-        fias_debug_raw,
-        rosreestr_house,
-        rosreestr_payload,
-        gis_gkh_house,
-        gis_gkh_payload,
-        kad_arbitr_payload,
-        kad_arbitr_signals,
-    ) = await fetch_fias_data(text)
-
-    apply_rosreestr_signals(
-        rosreestr_payload=rosreestr_payload,
-        house=rosreestr_house,
-        listing_payload=None,
-    )
-    extra_signals = apply_gis_gkh_signals(
-        gis_gkh_payload=gis_gkh_payload,
-        house=gis_gkh_house,
-        listing_payload=None,
-    )
-    extra_signals = tuple(extra_signals) + tuple(kad_arbitr_signals)
-    sources_payload = build_sources_payload(
-        rosreestr_payload=rosreestr_payload,
-        gis_gkh_payload=gis_gkh_payload,
-        kad_arbitr_payload=kad_arbitr_payload,
-    )
-    extras: dict[str, Any] = {}
-    if sources_payload:
-        extras['sources'] = sources_payload
+async def _cached_result(
+    *,
+    check_cache_repo: CheckCacheRepoPort,
+    check_results_repo: CheckResultsRepoPort,
+    cache_key: str,
+) -> CheckFlowResult | None:
+    """Вернуть результат из кэша проверок, если он есть."""
 
-    normalized_input = normalize_address_raw(text).value
-    cache_query = CheckQuery(
-        {'type': QueryType.address.value, 'query': normalized_input},
-    )
-    cache_key = build_cache_key(
-        query=cache_query,
-        cache_version=cache_version,
-        fias_mode=fias_mode,
-    )
     cached_snapshot, cached_id = await get_cached_snapshot(
         cache_repo=check_cache_repo,
         results_repo=check_results_repo,
         key=cache_key,
     )
-    if cached_snapshot is not None and cached_id is not None:
-        return cached_snapshot, cached_id, None, (), extras
+    if cached_snapshot is None or cached_id is None:
+        return None
 
-    risk_result, _ = await run_address_risk_check(text)
-    merged_signals = merge_signals(
-        base=tuple(risk_result.signals),
-        extra=extra_signals,
-    )
-    if merged_signals != tuple(risk_result.signals):
-        risk_result.signals = list(merged_signals)
-        risk_result.risk_card = build_risk_card(merged_signals)
-
-    snapshot, check_id = await store_check_result(
-        raw_input=normalized_input,
-        result=risk_result,
-        kind='address',
-        fias_payload=fias_payload,
-        fias_debug_raw=fias_debug_raw,
-        listing_payload=None,
-        listing_error=None,
-        sources_payload=sources_payload,
-    )
-    await check_cache_repo.set(cache_key, check_id)
-    return snapshot, check_id, risk_result, merged_signals, extras
+    return cached_snapshot, cached_id, None, (), {}
 
 
-async def process_url(
+async def _run_once(
     *,
-    url_text: str,
-    listing_resolver_uc: Any,
+    single_flight: CheckSingleFlight | None,
+    cache_key: str,
+    compute: Callable[[], Awaitable[CheckFlowResult]],
+    recheck: Callable[[], Awaitable[CheckFlowResult | None]],
+) -> CheckFlowResult:
+    """Выполнить проверку, объединив одновременные запросы ключа."""
+
+    if single_flight is None:
+        return await compute()
+
+    return await single_flight.run(cache_key, compute, recheck=recheck)
+
+
+async def process_address(
+    *,
+    text: str,
     fetch_fias_data: FetchFiasData,
     run_address_risk_check: RunRiskCheck,
     store_check_result: StoreResult,
@@ -175,36 +122,41 @@ async def process_url(
     check_results_repo: CheckResultsRepoPort,
     fias_mode: str,
     cache_version: str,
-) -> tuple[
-    CheckResultSnapshot | None,
-    UUID | None,
-    AddressRiskCheckResult | None,
-    tuple[RiskSignal, ...],
-    dict[str, Any],
-]:
-    """Обработать запрос URL и учесть кэш."""
+    single_flight: CheckSingleFlight | None = None,
+) -> CheckFlowResult:
+    """Обработать адресный запрос с учётом кэша."""
 
-    normalized_input = sanitize_input_value(url_text)
+    if not is_address_like(text):
+        signals = (
+            build_single_signal(
+                code='query_not_address_like',
+                evidence=('heuristic:address_like',),
+            ),
+        )
+        return None, None, None, signals, {}
+
+    context = AddressCheckContext.from_text(text)
     cache_query = CheckQuery(
-        {'type': QueryType.url.value, 'query': normalized_input},
+        {'type': QueryType.address.value, 'query': context.value},
     )
     cache_key = build_cache_key(
         query=cache_query,
         cache_version=cache_version,
         fias_mode=fias_mode,
     )
-    cached_snapshot, cached_id = await get_cached_snapshot(
-        cache_repo=check_cache_repo,
-        results_repo=check_results_repo,
-        key=cache_key,
-    )
-    if cached_snapshot is not None and cached_id is not None:
-        return cached_snapshot, cached_id, None, (), {}
 
-    url_vo = UrlRaw(url_text)
-    extracted = extract_address_from_url(url_vo)
-    if extracted and is_address_like(extracted):
-        normalized_address_input = normalize_address_raw(extracted).value
+    async def _lookup() -> CheckFlowResult | None:
+        return await _cached_result(
+            check_cache_repo=check_cache_repo,
+            check_results_repo=check_results_repo,
+            cache_key=cache_key,
+        )
+
+    cached = await _lookup()
+    if cached is not None:
+        return cached
+
+    async def _compute() -> CheckFlowResult:
         (
             fias_payload,
             fias_debug_raw,
@@ -214,7 +166,7 @@ async def process_url(
             gis_gkh_payload,
             kad_arbitr_payload,
             kad_arbitr_signals,
-        ) = await fetch_fias_data(extracted)
+        ) = await fetch_fias_data(context)
 
         apply_rosreestr_signals(
             rosreestr_payload=rosreestr_payload,
@@ -235,7 +187,8 @@ async def process_url(
         extras: dict[str, Any] = {}
         if sources_payload:
             extras['sources'] = sources_payload
-        risk_result, _ = await run_address_risk_check(extracted)
+
+        risk_result, _ = await run_address_risk_check(context)
         merged_signals = merge_signals(
             base=tuple(risk_result.signals),
             extra=extra_signals,
@@ -245,87 +198,208 @@ async def process_url(
             risk_result.risk_card = build_risk_card(merged_signals)
 
         snapshot, check_id = await store_check_result(
-            raw_input=normalized_address_input,
+            raw_input=context.value,
             result=risk_result,
-            kind='url',
+            kind='address',
             fias_payload=fias_payload,
             fias_debug_raw=fias_debug_raw,
             listing_payload=None,
             listing_error=None,
             sources_payload=sources_payload,
         )
-        await check_cache_repo.set(cache_key, check_id)
+        await check_cache_repo.set(
+            cache_key,
+            check_id,
+            snapshot=snapshot,
+        )
         return snapshot, check_id, risk_result, merged_signals, extras
 
-    listing_result, listing_error = await try_resolve_listing(
-        listing_resolver_uc=listing_resolver_uc,
-        url=url_vo,
+    return await _run_once(
+        single_flight=single_flight,
+        cache_key=cache_key,
+        compute=_compute,
+        recheck=_lookup,
     )
-    extras: dict[str, Any] = {}
-    if listing_result:
-        listing_address, listing_payload = listing_result
-        normalized_address_input = normalize_address_raw(
-            listing_address,
-        ).value
-        (
-            fias_payload,
-            fias_debug_raw,
-            rosreestr_house,
-            rosreestr_payload,
-            gis_gkh_house,
-            gis_gkh_payload,
-            kad_arbitr_payload,
-            kad_arbitr_signals,
-        ) = await fetch_fias_data(listing_address)
 
-        apply_rosreestr_signals(
-            rosreestr_payload=rosreestr_payload,
-            house=rosreestr_house,
-            listing_payload=listing_payload,
-        )
-        extra_signals = apply_gis_gkh_signals(
-            gis_gkh_payload=gis_gkh_payload,
-            house=gis_gkh_house,
-            listing_payload=listing_payload,
-        )
-        extra_signals = tuple(extra_signals) + tuple(kad_arbitr_signals)
-        sources_payload = build_sources_payload(
-            rosreestr_payload=rosreestr_payload,
-            gis_gkh_payload=gis_gkh_payload,
-            kad_arbitr_payload=kad_arbitr_payload,
-        )
-        risk_result, _ = await run_address_risk_check(listing_address)
-        merged_signals = merge_signals(
-            base=tuple(risk_result.signals),
-            extra=extra_signals,
+
+async def process_url(
+    *,
+    url_text: str,
+    listing_resolver_uc: ListingResolverPort,
+    fetch_fias_data: FetchFiasData,
+    run_address_risk_check: RunRiskCheck,
+    store_check_result: StoreResult,
+    check_cache_repo: CheckCacheRepoPort,
+    check_results_repo: CheckResultsRepoPort,
+    fias_mode: str,
+    cache_version: str,
+    single_flight: CheckSingleFlight | None = None,
+) -> CheckFlowResult:
+    """Обработать запрос URL и учесть кэш."""
+
+    normalized_input = sanitize_input_value(url_text)
+    normalized_input = (
+        listing_resolver_uc.canonical_key(normalized_input) or normalized_input
+    )
+    cache_query = CheckQuery(
+        {'type': QueryType.url.value, 'query': normalized_input},
+    )
+    cache_key = build_cache_key(
+        query=cache_query,
+        cache_version=cache_version,
+        fias_mode=fias_mode,
+    )
+
+    async def _lookup() -> CheckFlowResult | None:
+        return await _cached_result(
+            check_cache_repo=check_cache_repo,
+            check_results_repo=check_results_repo,
+            cache_key=cache_key,
         )
-        if merged_signals != tuple(risk_result.signals):
-            risk_result.signals = list(merged_signals)
-            risk_result.risk_card = build_risk_card(merged_signals)
 
-        snapshot, check_id = await store_check_result(
-            raw_input=normalized_address_input,
-            result=risk_result,
-            kind='url',
-            fias_payload=fias_payload,
-            fias_debug_raw=fias_debug_raw,
-            listing_payload=listing_payload,
-            listing_error=None,
-            sources_payload=sources_payload,
+    cached = await _lookup()
+    if cached is not None:
+        return cached
+
+    async def _compute() -> CheckFlowResult:
+        url_vo = UrlRaw(url_text)
+        extracted = extract_address_from_url(url_vo)
+        if extracted and is_address_like(extracted):
+            context = AddressCheckContext.from_text(extracted)
+            (
+                fias_payload,
+                fias_debug_raw,
+                rosreestr_house,
+                rosreestr_payload,
+                gis_gkh_house,
+                gis_gkh_payload,
+                kad_arbitr_payload,
+                kad_arbitr_signals,
+            ) = await fetch_fias_data(context)
+
+            apply_rosreestr_signals(
+                rosreestr_payload=rosreestr_payload,
+                house=rosreestr_house,
+                listing_payload=None,
+            )
+            extra_signals = apply_gis_gkh_signals(
+                gis_gkh_payload=gis_gkh_payload,
+                house=gis_gkh_house,
+                listing_payload=None,
+            )
+            extra_signals = tuple(extra_signals) + tuple(kad_arbitr_signals)
+            sources_payload = build_sources_payload(
+                rosreestr_payload=rosreestr_payload,
+                gis_gkh_payload=gis_gkh_payload,
+                kad_arbitr_payload=kad_arbitr_payload,
+            )
+            extras: dict[str, Any] = {}
+            if sources_payload:
+                extras['sources'] = sources_payload
+            risk_result, _ = await run_address_risk_check(context)
+            merged_signals = merge_signals(
+                base=tuple(risk_result.signals),
+                extra=extra_signals,
+            )
+            if merged_signals != tuple(risk_result.signals):
+                risk_result.signals = list(merged_signals)
+                risk_result.risk_card = build_risk_card(merged_signals)
+
+            snapshot, check_id = await store_check_result(
+                raw_input=context.value,
+                result=risk_result,
+                kind='url',
+                fias_payload=fias_payload,
+                fias_debug_raw=fias_debug_raw,
+                listing_payload=None,
+                listing_error=None,
+                sources_payload=sources_payload,
+            )
+            await check_cache_repo.set(
+                cache_key,
+                check_id,
+                snapshot=snapshot,
+            )
+            return snapshot, check_id, risk_result, merged_signals, extras
+
+        listing_result, listing_error = await try_resolve_listing(
+            listing_resolver_uc=listing_resolver_uc,
+            url=url_vo,
         )
-        extras['listing'] = listing_payload
-        if sources_payload:
-            extras['sources'] = sources_payload
-        await check_cache_repo.set(cache_key, check_id)
-        return snapshot, check_id, risk_result, merged_signals, extras
+        extras: dict[str, Any] = {}
+        if listing_result:
+            listing_address, listing_payload = listing_result
+            context = AddressCheckContext.from_text(listing_address)
+            (
+                fias_payload,
+                fias_debug_raw,
+                rosreestr_house,
+                rosreestr_payload,
+                gis_gkh_house,
+                gis_gkh_payload,
+                kad_arbitr_payload,
+                kad_arbitr_signals,
+            ) = await fetch_fias_data(context)
+
+            apply_rosreestr_signals(
+                rosreestr_payload=rosreestr_payload,
+                house=rosreestr_house,
+                listing_payload=listing_payload,
+            )
+            extra_signals = apply_gis_gkh_signals(
+                gis_gkh_payload=gis_gkh_payload,
+                house=gis_gkh_house,
+                listing_payload=listing_payload,
+            )
+            extra_signals = tuple(extra_signals) + tuple(kad_arbitr_signals)
+            sources_payload = build_sources_payload(
+                rosreestr_payload=rosreestr_payload,
+                gis_gkh_payload=gis_gkh_payload,
+                kad_arbitr_payload=kad_arbitr_payload,
+            )
+            risk_result, _ = await run_address_risk_check(context)
+            merged_signals = merge_signals(
+                base=tuple(risk_result.signals),
+                extra=extra_signals,
+            )
+            if merged_signals != tuple(risk_result.signals):
+                risk_result.signals = list(merged_signals)
+                risk_result.risk_card = build_risk_card(merged_signals)
+
+            snapshot, check_id = await store_check_result(
+                raw_input=context.value,
+                result=risk_result,
+                kind='url',
+                fias_payload=fias_payload,
+                fias_debug_raw=fias_debug_raw,
+                listing_payload=listing_payload,
+                listing_error=None,
+                sources_payload=sources_payload,
+            )
+            extras['listing'] = listing_payload
+            if sources_payload:
+                extras['sources'] = sources_payload
+            await check_cache_repo.set(
+                cache_key,
+                check_id,
+                snapshot=snapshot,
+            )
+            return snapshot, check_id, risk_result, merged_signals, extras
+
+        if listing_error:
+            extras['listing_error'] = listing_error
 
-    if listing_error:
-        extras['listing_error'] = listing_error
+        signals = (
+            build_single_signal(
+                code='url_not_supported_yet',
+                evidence=('rule:url_not_supported',),
+            ),
+        )
+        return None, None, None, signals, extras
 
-    signals = (
-        build_single_signal(
-            code='url_not_supported_yet',
-            evidence=('rule:url_not_supported',),
-        ),
+    return await _run_once(
+        single_flight=single_flight,
+        cache_key=cache_key,
+        compute=_compute,
+        recheck=_lookup,
     )
-    return None, None, None, signals, extras
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
+from checks.application.ports.checks import ListingResolverPort
 from checks.domain.helpers.address_heuristics import is_address_like
 from checks.domain.value_objects.url import UrlRaw
 from sources.domain.entities import ListingNormalized
@@ -20,16 +20,13 @@ logger = logging.getLogger(__name__)
 
 async def try_resolve_listing(
     *,
-    listing_resolver_uc: Any,
+    listing_resolver_uc: ListingResolverPort,
     url: UrlRaw,
 ) -> tuple[tuple[str, dict[str, Any]] | None, str | None]:
     """Попробовать извлечь адрес из листинга."""
 
     try:
-        listing = await asyncio.to_thread(
-            listing_resolver_uc.execute,
-            url.value,
-        )
+        listing = await listing_resolver_uc.execute(url.value)
     except ListingNotSupportedError as exc:
         logger.info('listing_not_supported url=%s error=%s', url.value, exc)
         return None, 'ListingNotSupportedError'
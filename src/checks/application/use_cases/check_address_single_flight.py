@@ -0,0 +1,77 @@
+"""Объединение одинаковых одновременных проверок."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from checks.application.ports.checks import CheckLockPort
+
+Compute = Callable[[], Awaitable[Any]]
+Recheck = Callable[[], Awaitable[Any | None]]
+
+
+class CheckSingleFlight:
+    """Выполняет одно вычисление на ключ кэша для всех ожидающих."""
+
+    __slots__ = ('_lock', '_inflight')
+
+    def __init__(self, *, lock: CheckLockPort | None = None) -> None:
+        """Настроить межпроцессную блокировку, если она нужна."""
+
+        self._lock = lock
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    async def run(
+        self,
+        key: str,
+        compute: Compute,
+        *,
+        recheck: Recheck | None = None,
+    ) -> Any:
+        """Выполнить compute один раз для одновременных запросов ключа."""
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._run_locked(key, compute, recheck),
+            )
+            self._inflight[key] = task
+            task.add_done_callback(
+                lambda done: self._forget(key, done),
+            )
+
+        return await asyncio.shield(task)
+
+    @property
+    def inflight(self) -> int:
+        """Количество вычислений в процессе."""
+
+        return len(self._inflight)
+
+    async def _run_locked(
+        self,
+        key: str,
+        compute: Compute,
+        recheck: Recheck | None,
+    ) -> Any:
+        """Вычислить результат под межпроцессной блокировкой."""
+
+        if self._lock is None:
+            return await compute()
+
+        async with self._lock.hold(key):
+            if recheck is not None:
+                cached = await recheck()
+                if cached is not None:
+                    return cached
+            return await compute()
+
+    def _forget(self, key: str, task: asyncio.Future[Any]) -> None:
+        """Убрать завершённое вычисление из списка активных."""
+
+        if self._inflight.get(key) is task:
+            self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
 import logging
-from typing import Any
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
 from checks.application.ports.fias_client import FiasClient
+from checks.application.use_cases.check_address_context import (
+    AddressCheckContext,
+)
 from checks.application.use_cases.check_address_payloads import (
     build_house_payload,
     gis_gkh_house_to_payload,
@@ -17,13 +20,112 @@ from checks.application.use_cases.check_kad_arbitr_for_house import (
     CheckKadArbitrForHouse,
 )
 from risks.domain.entities.risk_card import RiskSignal
-from shared.kernel.kad_arbitr_client_factory import build_kad_arbitr_client
+from shared.kernel.kad_arbitr_client_factory import get_kad_arbitr_client
+from shared.kernel.kad_arbitr_pdf_extractor_factory import (
+    get_kad_arbitr_pdf_text_extractor,
+)
 from shared.kernel.settings import Settings
 from sources.gis_gkh.models import GisGkhHouseNormalized
 from sources.rosreestr.models import RosreestrHouseNormalized
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar('_T')
+
+DEFAULT_SOURCE_DEADLINES_SECONDS: dict[str, float] = {
+    'ROSREESTR': 30.0,
+    'GIS_GKH': 45.0,
+    'KAD_ARBITR': 60.0,
+}
+
+
+async def run_source_with_deadline(
+    awaitable: Awaitable[_T],
+    *,
+    source: str,
+    deadline_seconds: float | None,
+    fallback: _T,
+    on_error: Callable[[Exception], _T],
+) -> _T:
+    """Дождаться источника в пределах дедлайна.
+
+    По дедлайну возвращается fallback, при ошибке источника — результат
+    on_error: сбой одной ветки не должен отменять соседнюю в TaskGroup.
+    """
+
+    try:
+        if deadline_seconds is None:
+            return await awaitable
+        return await asyncio.wait_for(awaitable, timeout=deadline_seconds)
+    except TimeoutError:
+        logger.info(
+            'source_deadline_exceeded source=%s deadline=%s',
+            source,
+            deadline_seconds,
+        )
+        return fallback
+    except Exception as exc:
+        logger.warning(
+            'source_failed source=%s error=%s',
+            source,
+            exc,
+        )
+        return on_error(exc)
+
+
+def _source_deadline(settings: Settings | None, prefix: str) -> float | None:
+    """Определить дедлайн источника по настройкам."""
+
+    if not settings:
+        return None
+
+    value = getattr(
+        settings,
+        f'{prefix}_DEADLINE_SECONDS',
+        DEFAULT_SOURCE_DEADLINES_SECONDS[prefix],
+    )
+    if value is None or value <= 0:
+        return None
+
+    return float(value)
+
+
+def _source_error_payload(error: str) -> dict[str, Any]:
+    """Payload источника, завершившегося ошибкой или по дедлайну."""
+
+    return {
+        'found': False,
+        'house': None,
+        'error': error,
+        'signals': [],
+    }
+
+
+def _source_failure(exc: Exception) -> tuple[dict[str, Any], None]:
+    """Результат ветки Росреестра или ГИС ЖКХ, упавшей с ошибкой."""
+
+    return _source_error_payload(exc.__class__.__name__), None
+
+
+def _kad_arbitr_status_payload(status: str) -> dict[str, Any]:
+    """Payload kad.arbitr.ru без данных: таймаут или ошибка."""
+
+    return {
+        'status': status,
+        'participant': None,
+        'total': 0,
+        'cases': [],
+        'signals': [],
+    }
+
+
+def _kad_arbitr_failure(
+    exc: Exception,
+) -> tuple[dict[str, Any], list[RiskSignal]]:
+    """Результат ветки kad.arbitr.ru, упавшей с ошибкой."""
+
+    return _kad_arbitr_status_payload('error'), []
+
 
 async def fetch_fias_data(
     *,
@@ -31,6 +133,7 @@ async def fetch_fias_data(
     fias_mode: str,
     query: str,
     settings: Settings | None,
+    context: AddressCheckContext | None = None,
 ) -> tuple[
     dict[str, Any] | None,
     dict[str, Any] | None,
@@ -41,7 +144,11 @@ async def fetch_fias_data(
     dict[str, Any] | None,
     list[RiskSignal],
 ]:
-    """Получить нормализацию из ФИАС и источников."""
+    """Получить нормализацию из ФИАС и источников.
+
+    Исход запроса в ФИАС записывается в context, чтобы риск-проверка
+    того же адреса не повторяла его.
+    """
 
     try:
         normalized = await fias_client.normalize_address(query)
@@ -52,7 +159,10 @@ async def fetch_fias_data(
             query[:80],
             exc,
         )
-        return None, None, None, None, None, None, None, []
+        normalized = None
+
+    if context is not None:
+        context.record_fias(normalized)
 
     if normalized is None:
         return None, None, None, None, None, None, None, []
@@ -76,13 +186,75 @@ async def fetch_fias_data(
     if not target_number:
         target_number = normalized.cadastral_number
 
+    rosreestr_deadline = _source_deadline(settings, 'ROSREESTR')
+    gis_gkh_deadline = _source_deadline(settings, 'GIS_GKH')
+    kad_arbitr_deadline = _source_deadline(settings, 'KAD_ARBITR')
+
+    async def _resolve_rosreestr() -> tuple[
+        dict[str, Any] | None,
+        RosreestrHouseNormalized | None,
+    ]:
+        return await run_source_with_deadline(
+            build_rosreestr_payload(
+                settings=settings,
+                target_number=target_number,
+            ),
+            source='rosreestr',
+            deadline_seconds=rosreestr_deadline,
+            fallback=(_source_error_payload('TimeoutError'), None),
+            on_error=_source_failure,
+        )
+
+    async def _resolve_gis_gkh_and_kad_arbitr() -> tuple[
+        dict[str, Any] | None,
+        GisGkhHouseNormalized | None,
+        dict[str, Any] | None,
+        list[RiskSignal],
+    ]:
+        gis_gkh_payload, gis_gkh_house = await run_source_with_deadline(
+            build_gis_gkh_payload(
+                settings=settings,
+                target_number=target_number,
+                region_code=normalized.region_code,
+                house_payload=house_payload,
+            ),
+            source='gis_gkh',
+            deadline_seconds=gis_gkh_deadline,
+            fallback=(_source_error_payload('TimeoutError'), None),
+            on_error=_source_failure,
+        )
+        (
+            kad_arbitr_payload,
+            kad_arbitr_signals,
+        ) = await run_source_with_deadline(
+            build_kad_arbitr_payload(
+                settings=settings,
+                gis_gkh_house=gis_gkh_house,
+            ),
+            source='kad_arbitr',
+            deadline_seconds=kad_arbitr_deadline,
+            fallback=(_kad_arbitr_status_payload('timeout'), []),
+            on_error=_kad_arbitr_failure,
+        )
+        return (
+            gis_gkh_payload,
+            gis_gkh_house,
+            kad_arbitr_payload,
+            kad_arbitr_signals,
+        )
+
+    async with asyncio.TaskGroup() as group:
+        rosreestr_task = group.create_task(_resolve_rosreestr())
+        gis_gkh_task = group.create_task(_resolve_gis_gkh_and_kad_arbitr())
+
+    rosreestr_payload, rosreestr_house = rosreestr_task.result()
     (
-        rosreestr_payload,
-        rosreestr_house,
-    ) = await build_rosreestr_payload(
-        settings=settings,
-        target_number=target_number,
-    )
+        gis_gkh_payload,
+        gis_gkh_house,
+        kad_arbitr_payload,
+        kad_arbitr_signals,
+    ) = gis_gkh_task.result()
+
     if rosreestr_payload is None:
         if rosreestr_house is not None:
             rosreestr_payload = {
@@ -99,23 +271,6 @@ async def fetch_fias_data(
                 'signals': [],
             }
 
-    (
-        gis_gkh_payload,
-        gis_gkh_house,
-    ) = await build_gis_gkh_payload(
-        settings=settings,
-        target_number=target_number,
-        region_code=normalized.region_code,
-        house_payload=house_payload,
-    )
-    (
-        kad_arbitr_payload,
-        kad_arbitr_signals,
-    ) = await build_kad_arbitr_payload(
-        settings=settings,
-        gis_gkh_house=gis_gkh_house,
-    )
-
     return (
         public_payload,
         normalized.raw,
@@ -150,8 +305,7 @@ async def build_rosreestr_payload(
     ).get_rosreestr_resolver_use_case
     resolver = resolver_factory(settings)
     try:
-        rosreestr_house = await asyncio.to_thread(
-            resolver.execute,
+        rosreestr_house = await resolver.execute(
             cadastral_number=target_number,
         )
     except Exception as exc:
@@ -273,7 +427,7 @@ async def build_kad_arbitr_payload(
         return None, []
 
     try:
-        client = build_kad_arbitr_client(settings=settings)
+        client = get_kad_arbitr_client(settings=settings)
     except AttributeError:
         return None, []
     base_url = getattr(
@@ -284,19 +438,18 @@ async def build_kad_arbitr_payload(
     use_case = CheckKadArbitrForHouse(
         kad_arbitr_client=client,
         base_url=base_url,
+        enrich_concurrency=getattr(
+            settings,
+            'KAD_ARBITR_ENRICH_CONCURRENCY',
+            4,
+        ),
+        text_extractor=get_kad_arbitr_pdf_text_extractor(settings),
     )
     max_pages = getattr(settings, 'KAD_ARBITR_MAX_PAGES', 3)
-    try:
-        result = await use_case.execute(
-            gis_gkh_result=gis_gkh_house,
-            max_pages=max_pages,
-        )
-    finally:
-        close_method = getattr(client, 'close', None)
-        if callable(close_method):
-            result_close = close_method()
-            if inspect.isawaitable(result_close):
-                await result_close
+    result = await use_case.execute(
+        gis_gkh_result=gis_gkh_house,
+        max_pages=max_pages,
+    )
 
     facts_payload = result.facts.to_sources_payload() if result.facts else None
     if facts_payload is None:
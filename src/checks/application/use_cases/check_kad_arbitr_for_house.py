@@ -16,6 +16,10 @@ from sources.kad_arbitr.exceptions import (
 )
 from sources.kad_arbitr.models import KadArbitrFacts
 from sources.kad_arbitr.pdf.http_pdf_fetcher import HttpPdfFetcher
+from sources.kad_arbitr.pdf.ports import (
+    AsyncPdfTextExtractorPort,
+    PdfTextExtractorPort,
+)
 from sources.kad_arbitr.pdf.text_extractors import (
     CompositePdfTextExtractor,
     PdfMinerTextExtractor,
@@ -61,6 +65,10 @@ class CheckKadArbitrForHouse:
 
     kad_arbitr_client: KadArbitrClientPort
     base_url: str = 'https://kad.arbitr.ru'
+    enrich_concurrency: int = 4
+    text_extractor: PdfTextExtractorPort | AsyncPdfTextExtractorPort | None = (
+        None
+    )
 
     async def execute(
         self,
@@ -111,7 +119,7 @@ class CheckKadArbitrForHouse:
             client=self.kad_arbitr_client,
             base_url=self.base_url,
         )
-        text_extractor = CompositePdfTextExtractor(
+        text_extractor = self.text_extractor or CompositePdfTextExtractor(
             primary=PyPdfTextExtractor(),
             fallback=PdfMinerTextExtractor(),
         )
@@ -129,6 +137,7 @@ class CheckKadArbitrForHouse:
             details_uc=participants_uc,
             case_outcome_uc=case_outcome_uc,
             base_url=self.base_url,
+            max_concurrency=self.enrich_concurrency,
         )
         try:
             result = await resolver.execute(
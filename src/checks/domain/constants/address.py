@@ -29,3 +29,32 @@ ADDRESS_KEYWORDS = {
     'бульвар',
     'б-р',
 }
+
+ADDRESS_ABBREVIATIONS: Final[dict[str, str]] = {
+    'улица': 'ул',
+    'проспект': 'пр-т',
+    'просп': 'пр-т',
+    'пр-кт': 'пр-т',
+    'переулок': 'пер',
+    'шоссе': 'ш',
+    'набережная': 'наб',
+    'площадь': 'пл',
+    'бульвар': 'б-р',
+    'проезд': 'пр-д',
+    'область': 'обл',
+    'район': 'р-н',
+    'корпус': 'корп',
+    'к': 'корп',
+    'строение': 'стр',
+    'литера': 'лит',
+    'квартира': 'кв',
+}
+
+ADDRESS_KEY_SKIPPED_TOKENS: Final[frozenset[str]] = frozenset(
+    {'г', 'город'},
+)
+
+# «д.» — это и «дом», и «деревня»: префикс пропускается только перед номером.
+ADDRESS_KEY_HOUSE_TOKENS: Final[frozenset[str]] = frozenset({'д', 'дом'})
+
+ADDRESS_KEY_SEPARATORS_RE: Final[re.Pattern[str]] = re.compile(r'[\s,.;]+')
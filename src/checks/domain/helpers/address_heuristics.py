@@ -4,7 +4,13 @@ from __future__ import annotations
 
 import re
 
-from checks.domain.constants.address import ADDRESS_KEYWORDS
+from checks.domain.constants.address import (
+    ADDRESS_ABBREVIATIONS,
+    ADDRESS_KEY_HOUSE_TOKENS,
+    ADDRESS_KEY_SEPARATORS_RE,
+    ADDRESS_KEY_SKIPPED_TOKENS,
+    ADDRESS_KEYWORDS,
+)
 from checks.domain.exceptions.address import AddressHeuristicsError
 
 
@@ -17,6 +23,32 @@ def normalize_whitespace(text: str) -> str:
     return re.sub(r'\s+', ' ', text.strip())
 
 
+def canonical_address_key(text: str) -> str:
+    """Свести адрес к форме, общей для вариантов написания.
+
+    Регистр, пунктуация, «ё», полные и сокращённые типы элементов
+    («улица»/«ул.») и префиксы города и дома («г.», «д.») на ключ не
+    влияют. «д.» перед названием, а не номером, — это деревня, и он
+    остаётся в ключе.
+    """
+
+    normalized = normalize_whitespace(text).lower().replace('ё', 'е')
+    parts = [
+        part for part in ADDRESS_KEY_SEPARATORS_RE.split(normalized) if part
+    ]
+    tokens = []
+    for index, token in enumerate(parts):
+        if token in ADDRESS_KEY_SKIPPED_TOKENS:
+            continue
+        if token in ADDRESS_KEY_HOUSE_TOKENS:
+            following = parts[index + 1] if index + 1 < len(parts) else ''
+            if following[:1].isdigit():
+                continue
+        tokens.append(ADDRESS_ABBREVIATIONS.get(token, token))
+
+    return ' '.join(tokens)
+
+
 def is_address_like(text: str) -> bool:
     """Вернуть True, если строка похожа на почтовый адрес."""
 
@@ -4,18 +4,18 @@ from __future__ import annotations
 
 from checks.adapters.address_resolver_stub import AddressResolverStub
 from checks.application.ports.checks import AddressResolverPort
+from checks.application.ports.fias_client import FiasClient
 from checks.infrastructure.address_resolver_fias import FiasAddressResolver
 from shared.kernel.settings import Settings
 
 
-def build_address_resolver(settings: Settings) -> AddressResolverPort:
+def build_address_resolver(
+    settings: Settings,
+    fias_client: FiasClient | None = None,
+) -> AddressResolverPort:
     """Return address resolver implementation based on settings."""
 
-    if settings.fias_enabled:
-        return FiasAddressResolver(
-            base_url=settings.FIAS_BASE_URL,
-            token=settings.FIAS_TOKEN,
-            timeout_seconds=settings.FIAS_TIMEOUT_SECONDS,
-        )
+    if settings.fias_enabled and fias_client is not None:
+        return FiasAddressResolver(fias_client)
 
     return AddressResolverStub({})
@@ -1,48 +1,52 @@
-"""FIAS-backed address resolver adapter (legacy synchronous version)."""
+"""FIAS-backed address resolver adapter."""
 
 import logging
 
 from checks.application.ports.checks import AddressResolverPort
+from checks.application.ports.fias_client import (
+    FiasClient,
+    NormalizedAddress,
+)
 from checks.domain.value_objects.address import (
     AddressNormalized,
     AddressRaw,
     normalize_address,
 )
-from checks.infrastructure.fias.client_stub import StubFiasClient as FiasClient
-from checks.infrastructure.fias.errors import FiasError
 
 logger = logging.getLogger(__name__)
 
 
 class FiasAddressResolver(AddressResolverPort):
-    """Address resolver that will use the FIAS API."""
+    """Address resolver that confirms addresses through the FIAS client."""
 
     __slots__ = ('_client',)
 
-    def __init__(
-        self,
-        base_url: str,
-        token: str,
-        timeout_seconds: float,
-    ) -> None:
-        """Store FIAS connection parameters."""
+    def __init__(self, client: FiasClient) -> None:
+        """Store the shared FIAS client."""
 
-        # Legacy resolver still relies on synchronous client semantics.
-        self._client = FiasClient()
+        self._client = client
 
     async def normalize(self, raw: AddressRaw) -> AddressNormalized:
-        """Normalize address using FIAS (stubbed for now)."""
+        """Normalize address and mark it as FIAS-confirmed when found."""
 
-        normalized = normalize_address(raw)
         try:
-            self._client.search_address_item(raw.value)
-        except FiasError as exc:  # pragma: no cover - legacy path
+            found = await self._client.normalize_address(raw.value)
+        except Exception as exc:
             logger.warning(
                 'FIAS lookup failed, fallback to domain normalization: %s',
                 exc,
             )
-            normalized.source = 'stub'
-        else:
-            normalized.source = 'fias'
+            found = None
+
+        return await self.normalize_with_fias(raw, found)
 
+    async def normalize_with_fias(
+        self,
+        raw: AddressRaw,
+        found: NormalizedAddress | None,
+    ) -> AddressNormalized:
+        """Normalize address using an already known FIAS lookup outcome."""
+
+        normalized = normalize_address(raw)
+        normalized.source = 'fias' if found is not None else 'stub'
         return normalized
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import delete
+from sqlalchemy import Select, delete, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from checks.application.ports.checks import CheckCacheRepoPort
 from checks.domain.entities.check_cache import CachedCheckEntry
+from checks.domain.entities.check_result import CheckResultSnapshot
+from checks.infrastructure.check_results_repo_db import CheckResultsRepoDb
 from shared.infra.db.models.check_cache import CheckCacheModel
+from shared.infra.db.models.check_result import CheckResultModel
 from shared.kernel.db import session_scope
 
+logger = logging.getLogger(__name__)
+
 
 class CheckCacheRepoDb(CheckCacheRepoPort):
     """Сохраняет соответствия ключей кэша и результатов проверок."""
@@ -23,6 +30,9 @@ class CheckCacheRepoDb(CheckCacheRepoPort):
         '_ttl',
         '_cache_version',
         '_now_fn',
+        '_cleanup_interval',
+        '_last_cleanup_at',
+        '_cleanup_task',
     )
 
     def __init__(
@@ -32,6 +42,7 @@ class CheckCacheRepoDb(CheckCacheRepoPort):
         ttl_seconds: int,
         cache_version: str,
         now_fn: Callable[[], datetime] | None = None,
+        cleanup_interval_seconds: int = 300,
     ) -> None:
         """Настроить репозиторий и параметры TTL."""
 
@@ -39,6 +50,9 @@ class CheckCacheRepoDb(CheckCacheRepoPort):
         self._ttl = timedelta(seconds=ttl_seconds)
         self._cache_version = cache_version
         self._now_fn = now_fn or (lambda: datetime.now(UTC))
+        self._cleanup_interval = timedelta(seconds=cleanup_interval_seconds)
+        self._last_cleanup_at: datetime | None = None
+        self._cleanup_task: asyncio.Task[None] | None = None
 
     async def get(self, key: str) -> CachedCheckEntry | None:
         """Вернуть запись, если ключ присутствует и не протух."""
@@ -46,25 +60,58 @@ class CheckCacheRepoDb(CheckCacheRepoPort):
         now = self._now_fn()
         async with session_scope(self._session_factory) as session:
             model = await session.get(CheckCacheModel, key)
-            if model is None:
-                return None
 
-            if model.cache_version != self._cache_version:
-                await session.delete(model)
-                return None
+        if model is None:
+            return None
 
-            if model.expires_at <= now:
-                await session.delete(model)
-                return None
+        if model.cache_version != self._cache_version or (
+            model.expires_at <= now
+        ):
+            self._schedule_cleanup(now)
+            return None
 
-            return CachedCheckEntry(
-                check_id=model.check_result_id,
-                created_at=model.created_at,
-                expires_at=model.expires_at,
-            )
+        return CachedCheckEntry(
+            check_id=model.check_result_id,
+            created_at=model.created_at,
+            expires_at=model.expires_at,
+        )
+
+    async def get_snapshot(
+        self,
+        key: str,
+    ) -> tuple[CachedCheckEntry, CheckResultSnapshot] | None:
+        """Вернуть запись и снимок проверки одним запросом к БД."""
+
+        now = self._now_fn()
+        async with session_scope(self._session_factory) as session:
+            row = (
+                await session.execute(self._snapshot_statement(key, now))
+            ).first()
+
+        if row is None:
+            self._schedule_cleanup(now)
+            return None
+
+        cache_model, result_model = row
+        entry = CachedCheckEntry(
+            check_id=cache_model.check_result_id,
+            created_at=cache_model.created_at,
+            expires_at=cache_model.expires_at,
+        )
+        return entry, CheckResultsRepoDb.deserialize_snapshot(result_model)
+
+    async def set(
+        self,
+        key: str,
+        check_id: UUID,
+        *,
+        snapshot: CheckResultSnapshot | None = None,
+    ) -> None:
+        """Сохранить или обновить запись кэша.
 
-    async def set(self, key: str, check_id: UUID) -> None:
-        """Сохранить или обновить запись кэша."""
+        Снимок уже лежит в таблице результатов, get_snapshot читает его
+        оттуда, поэтому здесь он не нужен.
+        """
 
         now = self._now_fn()
         expires_at = now + self._ttl
@@ -86,11 +133,58 @@ class CheckCacheRepoDb(CheckCacheRepoPort):
                 model.cache_version = self._cache_version
 
     async def cleanup(self) -> None:
-        """Удалить протухшие записи (best effort)."""
+        """Удалить протухшие записи и записи чужой версии (best effort)."""
 
         now = self._now_fn()
+        self._last_cleanup_at = now
         async with session_scope(self._session_factory) as session:
             stmt = delete(CheckCacheModel).where(
-                CheckCacheModel.expires_at <= now,
+                or_(
+                    CheckCacheModel.expires_at <= now,
+                    CheckCacheModel.cache_version != self._cache_version,
+                ),
             )
             await session.execute(stmt)
+
+    def _snapshot_statement(
+        self,
+        key: str,
+        now: datetime,
+    ) -> Select[tuple[CheckCacheModel, CheckResultModel]]:
+        """Запрос живой записи кэша вместе с результатом проверки."""
+
+        return (
+            select(CheckCacheModel, CheckResultModel)
+            .join(
+                CheckResultModel,
+                CheckResultModel.id == CheckCacheModel.check_result_id,
+            )
+            .where(
+                CheckCacheModel.cache_key == key,
+                CheckCacheModel.cache_version == self._cache_version,
+                CheckCacheModel.expires_at > now,
+            )
+        )
+
+    def _schedule_cleanup(self, now: datetime) -> None:
+        """Запустить фоновую очистку не чаще заданного интервала."""
+
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            return
+
+        if (
+            self._last_cleanup_at is not None
+            and now - self._last_cleanup_at < self._cleanup_interval
+        ):
+            return
+
+        self._last_cleanup_at = now
+        self._cleanup_task = asyncio.create_task(self._run_cleanup())
+
+    async def _run_cleanup(self) -> None:
+        """Выполнить очистку, не роняя запросы при ошибке."""
+
+        try:
+            await self.cleanup()
+        except Exception as exc:
+            logger.info('check_cache_cleanup_failed error=%s', exc)
@@ -6,10 +6,15 @@ from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
+from checks.application.ports.checks import CheckCacheRepoPort
 from checks.domain.entities.check_cache import CachedCheckEntry
+from checks.domain.entities.check_result import CheckResultSnapshot
+from shared.infra.ttl_cache import TtlCache
 
+_DEFAULT_MAX_ITEMS = 100_000
 
-class InMemoryCheckCacheRepo:
+
+class InMemoryCheckCacheRepo(CheckCacheRepoPort):
     """Хранит ключи проверок и их идентификаторы с TTL."""
 
     __slots__ = ('_ttl', '_now_fn', '_storage')
@@ -18,46 +23,48 @@ class InMemoryCheckCacheRepo:
         self,
         ttl_seconds: int,
         *,
+        max_items: int = _DEFAULT_MAX_ITEMS,
         now_fn: Callable[[], datetime] | None = None,
     ) -> None:
         """Настроить кэш на использование указанного TTL."""
 
         self._ttl = timedelta(seconds=ttl_seconds)
         self._now_fn = now_fn or (lambda: datetime.now(UTC))
-        self._storage: dict[str, CachedCheckEntry] = {}
+        self._storage = TtlCache(
+            max_items=max_items,
+            ttl_seconds=ttl_seconds,
+            now_fn=lambda: self._now_fn().timestamp(),
+        )
 
     async def get(self, key: str) -> CachedCheckEntry | None:
         """Вернуть запись по ключу, если она не протухла."""
 
-        await self.cleanup()
-        entry = self._storage.get(key)
-        if not entry:
-            return None
-
-        if entry.is_expired(self._now_fn()):
-            self._storage.pop(key, None)
-            return None
+        return self._storage.get(key)
 
-        return entry
-
-    async def set(self, key: str, check_id: UUID) -> None:
-        """Сохранить запись кэша."""
+    async def set(
+        self,
+        key: str,
+        check_id: UUID,
+        *,
+        snapshot: CheckResultSnapshot | None = None,
+    ) -> None:
+        """Сохранить запись кэша; снимок берётся из репозитория результатов."""
 
-        await self.cleanup()
         created = self._now_fn()
         entry = CachedCheckEntry(
             check_id=check_id,
             created_at=created,
             expires_at=created + self._ttl,
         )
-        self._storage[key] = entry
+        self._storage.set(key, entry)
 
     async def cleanup(self) -> None:
         """Удалить протухшие записи."""
 
-        now = self._now_fn()
-        expired_keys = [
-            key for key, entry in self._storage.items() if entry.is_expired(now)
-        ]
-        for key in expired_keys:
-            self._storage.pop(key, None)
+        self._storage.purge_expired()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Счётчики попаданий, промахов и вытеснений."""
+
+        return self._storage.snapshot_stats()
@@ -0,0 +1,174 @@
+"""Процессный LRU-уровень перед кэшем и результатами проверок в БД.
+
+Оба уровня построены на общем TtlCache: он отвечает за вытеснение,
+сроки жизни и счётчики.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from checks.application.ports.checks import (
+    CheckCacheRepoPort,
+    CheckResultsRepoPort,
+)
+from checks.domain.entities.check_cache import CachedCheckEntry
+from checks.domain.entities.check_result import CheckResultSnapshot
+from shared.infra.ttl_cache import TtlCache
+
+
+class TieredCheckCacheRepo(CheckCacheRepoPort):
+    """Держит горячие ключи кэша проверок в памяти процесса."""
+
+    __slots__ = ('_inner', '_ttl', '_cache_version', '_now_fn', '_local')
+
+    def __init__(
+        self,
+        inner: CheckCacheRepoPort,
+        *,
+        max_items: int,
+        ttl_seconds: int,
+        cache_version: str,
+        now_fn: Callable[[], datetime] | None = None,
+    ) -> None:
+        """Настроить размер и TTL процессного уровня."""
+
+        self._inner = inner
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._cache_version = cache_version
+        self._now_fn = now_fn or (lambda: datetime.now(UTC))
+        self._local = TtlCache(
+            max_items=max_items,
+            ttl_seconds=ttl_seconds,
+            now_fn=lambda: self._now_fn().timestamp(),
+        )
+
+    async def get(self, key: str) -> CachedCheckEntry | None:
+        """Вернуть запись из памяти или из нижнего уровня."""
+
+        local_key = (self._cache_version, key)
+        now = self._now_fn()
+        cached = self._local.get(local_key)
+        if cached is not None:
+            return cached[0]
+
+        entry = await self._inner.get(key)
+        if entry is not None:
+            self._remember(local_key, entry, now)
+        return entry
+
+    async def get_snapshot(
+        self,
+        key: str,
+    ) -> tuple[CachedCheckEntry, CheckResultSnapshot | None] | None:
+        """Вернуть запись со снимком из памяти или из нижнего уровня."""
+
+        local_key = (self._cache_version, key)
+        now = self._now_fn()
+        cached = self._local.get(local_key)
+        if cached is not None and cached[1] is not None:
+            return cached
+
+        found = await self._inner.get_snapshot(key)
+        if found is not None:
+            entry, snapshot = found
+            self._remember(local_key, entry, now, snapshot=snapshot)
+        return found
+
+    async def set(
+        self,
+        key: str,
+        check_id: UUID,
+        *,
+        snapshot: CheckResultSnapshot | None = None,
+    ) -> None:
+        """Записать ключ в нижний уровень и в память процесса.
+
+        Переданный снимок запоминается вместе с записью, и следующий
+        get_snapshot не идёт в нижний уровень.
+        """
+
+        await self._inner.set(key, check_id, snapshot=snapshot)
+        now = self._now_fn()
+        entry = CachedCheckEntry(
+            check_id=check_id,
+            created_at=now,
+            expires_at=now + self._ttl,
+        )
+        self._remember(
+            (self._cache_version, key),
+            entry,
+            now,
+            snapshot=snapshot,
+        )
+
+    async def cleanup(self) -> None:
+        """Удалить протухшие записи нижнего уровня."""
+
+        await self._inner.cleanup()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Счётчики попаданий и промахов процессного уровня."""
+
+        return self._local.snapshot_stats()
+
+    def _remember(
+        self,
+        local_key: tuple[str, str],
+        entry: CachedCheckEntry,
+        now: datetime,
+        *,
+        snapshot: CheckResultSnapshot | None = None,
+    ) -> None:
+        """Сохранить запись не дольше её срока в нижнем уровне."""
+
+        ttl = min(entry.expires_at - now, self._ttl).total_seconds()
+        if ttl > 0:
+            self._local.set(local_key, (entry, snapshot), ttl_seconds=ttl)
+
+
+class TieredCheckResultsRepo(CheckResultsRepoPort):
+    """Держит горячие снимки проверок в памяти процесса."""
+
+    __slots__ = ('_inner', '_local')
+
+    def __init__(
+        self,
+        inner: CheckResultsRepoPort,
+        *,
+        max_items: int,
+    ) -> None:
+        """Настроить размер процессного уровня."""
+
+        self._inner = inner
+        # Снимки неизменяемы, поэтому живут до вытеснения по размеру.
+        self._local = TtlCache(max_items=max_items, ttl_seconds=math.inf)
+
+    async def save(self, result: CheckResultSnapshot) -> UUID:
+        """Сохранить снимок и запомнить его в памяти процесса."""
+
+        check_id = await self._inner.save(result)
+        self._local.set(check_id, result)
+        return check_id
+
+    async def get(self, check_id: UUID) -> CheckResultSnapshot | None:
+        """Вернуть снимок из памяти или из нижнего уровня."""
+
+        snapshot = self._local.get(check_id)
+        if snapshot is not None:
+            return snapshot
+
+        snapshot = await self._inner.get(check_id)
+        if snapshot is not None:
+            self._local.set(check_id, snapshot)
+        return snapshot
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Счётчики попаданий и промахов процессного уровня."""
+
+        return self._local.snapshot_stats()
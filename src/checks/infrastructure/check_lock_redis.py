@@ -0,0 +1,66 @@
+"""Межпроцессная блокировка вычисления проверки через Redis."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from checks.application.ports.checks import CheckLockPort
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCheckLock(CheckLockPort):
+    """Не даёт воркерам одновременно считать одну и ту же проверку."""
+
+    __slots__ = ('_client', '_timeout', '_wait', '_prefix')
+
+    def __init__(
+        self,
+        client: Redis,
+        *,
+        timeout_seconds: float,
+        wait_seconds: float,
+        prefix: str = 'flaffy:check-lock:',
+    ) -> None:
+        """Настроить клиента Redis и лимиты ожидания блокировки."""
+
+        self._client = client
+        self._timeout = timeout_seconds
+        self._wait = wait_seconds
+        self._prefix = prefix
+
+    @asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[bool]:
+        """Удерживать блокировку ключа, вернуть признак захвата."""
+
+        lock = self._client.lock(
+            f'{self._prefix}{key}',
+            timeout=self._timeout,
+            blocking_timeout=self._wait,
+        )
+        try:
+            acquired = bool(await lock.acquire())
+        except RedisError as exc:
+            logger.info('check_lock_unavailable key=%s error=%s', key, exc)
+            acquired = False
+
+        if not acquired:
+            logger.info('check_lock_not_acquired key=%s', key)
+
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                try:
+                    await lock.release()
+                except RedisError as exc:
+                    logger.info(
+                        'check_lock_release_failed key=%s error=%s',
+                        key,
+                        exc,
+                    )
@@ -57,7 +57,7 @@ class CheckResultsRepoDb(CheckResultsRepoPort):
             if model is None:
                 return None
 
-            return self._deserialize_snapshot(model)
+            return self.deserialize_snapshot(model)
 
     @staticmethod
     def _serialize_snapshot(
@@ -90,7 +90,7 @@ class CheckResultsRepoDb(CheckResultsRepoPort):
         return payload
 
     @staticmethod
-    def _deserialize_snapshot(model: CheckResultModel) -> CheckResultSnapshot:
+    def deserialize_snapshot(model: CheckResultModel) -> CheckResultSnapshot:
         """Восстановить доменный снимок из ORM-модели."""
 
         payload: Mapping[str, Any] = model.payload
@@ -0,0 +1,286 @@
+"""Кэширующая обёртка над клиентом ФИАС."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, fields, replace
+from datetime import datetime
+from typing import Any, Protocol
+
+from checks.application.ports.fias_client import (
+    FiasBatchResult,
+    FiasClient,
+    NormalizedAddress,
+)
+from checks.domain.helpers.address_heuristics import canonical_address_key
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = 'fias:'
+_FIELD_NAMES = frozenset(field.name for field in fields(NormalizedAddress))
+
+
+class FiasCachePort(Protocol):
+    """Хранилище нормализованных адресов."""
+
+    async def get(self, *, key: str) -> dict[str, object] | None:
+        """Получить значение по ключу."""
+
+    async def set(
+        self,
+        *,
+        key: str,
+        value: dict[str, object],
+        ttl_seconds: int,
+    ) -> None:
+        """Сохранить значение с TTL."""
+
+    async def get_many(
+        self,
+        *,
+        keys: Sequence[str],
+    ) -> dict[str, dict[str, object]]:
+        """Получить найденные значения одним обращением."""
+
+    async def set_many(
+        self,
+        *,
+        items: Mapping[str, dict[str, object]],
+        ttl_seconds: int,
+    ) -> None:
+        """Сохранить набор значений одним обращением."""
+
+
+class CachedFiasClient:
+    """Отдаёт нормализованные адреса из кэша по каноническому ключу.
+
+    Ключ строится canonical_address_key, поэтому запросы, отличающиеся
+    регистром, пробелами и сокращениями, разделяют одну запись, а
+    одновременные промахи по ключу ждут один запрос. Этот запрос идёт
+    в отдельной задаче, так что отмена одного из ждущих не прерывает
+    остальных. Кэшируются только найденные адреса: отрицательные исходы
+    остаются за клиентом.
+    """
+
+    __slots__ = (
+        '_inner',
+        '_cache',
+        '_ttl',
+        '_hits',
+        '_misses',
+        '_coalesced',
+        '_inflight',
+    )
+
+    def __init__(
+        self,
+        *,
+        inner: FiasClient,
+        cache: FiasCachePort,
+        ttl_seconds: int,
+    ) -> None:
+        """Сохранить клиента, хранилище и TTL."""
+
+        self._inner = inner
+        self._cache = cache
+        self._ttl = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._inflight: dict[
+            str,
+            asyncio.Future[NormalizedAddress | None],
+        ] = {}
+
+    @property
+    def inner(self) -> FiasClient:
+        """Обёрнутый клиент."""
+
+        return self._inner
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Попадания, промахи, доля попаданий и объединённые ожидания.
+
+        Ожидание чужого запроса — не попадание в кэш и в hit_rate не
+        входит.
+        """
+
+        total = self._hits + self._misses
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'coalesced': self._coalesced,
+            'hit_rate': self._hits / total if total else 0.0,
+        }
+
+    @property
+    def health(self) -> dict[str, object] | None:
+        """Состояние обёрнутого клиента, если он его сообщает."""
+
+        return getattr(self._inner, 'health', None)
+
+    async def normalize_address(self, query: str) -> NormalizedAddress | None:
+        """Вернуть адрес из кэша или запросить ФИАС."""
+
+        canonical = canonical_address_key(query)
+        if not canonical:
+            return await self._inner.normalize_address(query)
+
+        key = f'{_KEY_PREFIX}{canonical}'
+        cached = await self._cache.get(key=key)
+        if cached is not None:
+            address = _from_cache_dict(cached)
+            if address is not None:
+                self._hits += 1
+                return replace(address, source_query=query)
+
+        task = self._inflight.get(key)
+        if task is None:
+            self._misses += 1
+            task = asyncio.ensure_future(self._fetch_and_store(key, query))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self._coalesced += 1
+
+        result = await asyncio.shield(task)
+        return replace(result, source_query=query) if result else None
+
+    async def normalize_many(
+        self,
+        queries: Sequence[str],
+    ) -> list[FiasBatchResult]:
+        """Отдать найденное из кэша, остальное запросить одним пакетом.
+
+        Кэш читается одним get_many и пополняется одним set_many, а
+        запросы с одинаковым каноническим ключом уходят в ФИАС один раз.
+        """
+
+        found: dict[str, NormalizedAddress] = {}
+        errors: dict[str, str | None] = {}
+        keys: dict[str, str] = {}
+        for query in dict.fromkeys(queries):
+            canonical = canonical_address_key(query)
+            keys[query] = f'{_KEY_PREFIX}{canonical}' if canonical else query
+
+        cacheable = [
+            key
+            for key in dict.fromkeys(keys.values())
+            if key.startswith(_KEY_PREFIX)
+        ]
+        cached = await self._cache.get_many(keys=cacheable) if cacheable else {}
+        for key, data in cached.items():
+            address = _from_cache_dict(data)
+            if address is not None:
+                found[key] = address
+
+        to_fetch: dict[str, str] = {}
+        for query, key in keys.items():
+            if key in found or key in to_fetch:
+                continue
+            to_fetch[key] = query
+        self._hits += len(found)
+        self._misses += len(to_fetch)
+
+        if to_fetch:
+            fetched = await self._inner.normalize_many(list(to_fetch.values()))
+            to_store: dict[str, dict[str, object]] = {}
+            for key, item in zip(to_fetch, fetched, strict=True):
+                errors[key] = item.error
+                if item.address is None:
+                    continue
+
+                found[key] = item.address
+                if key.startswith(_KEY_PREFIX):
+                    to_store[key] = _to_cache_dict(item.address)
+
+            if to_store and self._ttl > 0:
+                await self._cache.set_many(
+                    items=to_store,
+                    ttl_seconds=self._ttl,
+                )
+
+        results = []
+        for query in queries:
+            key = keys[query]
+            address = found.get(key)
+            results.append(
+                FiasBatchResult(
+                    query=query,
+                    address=(
+                        replace(address, source_query=query)
+                        if address is not None
+                        else None
+                    ),
+                    error=errors.get(key),
+                ),
+            )
+        return results
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        query: str,
+    ) -> NormalizedAddress | None:
+        """Запросить ФИАС и положить найденный адрес в кэш."""
+
+        result = await self._inner.normalize_address(query)
+        if result is not None and self._ttl > 0:
+            await self._cache.set(
+                key=key,
+                value=_to_cache_dict(result),
+                ttl_seconds=self._ttl,
+            )
+        return result
+
+    def _forget(
+        self,
+        key: str,
+        task: asyncio.Future[NormalizedAddress | None],
+    ) -> None:
+        """Убрать завершённый запрос из списка активных."""
+
+        if self._inflight.get(key) is task:
+            self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    async def close(self) -> None:
+        """Закрыть обёрнутого клиента, если он это умеет."""
+
+        close_method = getattr(self._inner, 'close', None)
+        if callable(close_method):
+            result = close_method()
+            if inspect.isawaitable(result):
+                await result
+
+
+def _to_cache_dict(address: NormalizedAddress) -> dict[str, object]:
+    """Сериализовать адрес в JSON-совместимый словарь."""
+
+    data = asdict(address)
+    if address.updated_at is not None:
+        data['updated_at'] = address.updated_at.isoformat()
+    return data
+
+
+def _from_cache_dict(data: dict[str, Any]) -> NormalizedAddress | None:
+    """Восстановить адрес из кэша, отбросив повреждённые записи."""
+
+    values = {key: value for key, value in data.items() if key in _FIELD_NAMES}
+    updated_at = values.get('updated_at')
+    if isinstance(updated_at, str):
+        try:
+            values['updated_at'] = datetime.fromisoformat(updated_at)
+        except ValueError:
+            values['updated_at'] = None
+
+    try:
+        return NormalizedAddress(**values)
+    except TypeError:
+        logger.warning('fias_cache_entry_invalid keys=%s', sorted(data)[:5])
+        return None
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from random import uniform
 from time import perf_counter
@@ -11,10 +12,25 @@ from typing import Any
 
 import httpx
 
-from checks.application.ports.fias_client import NormalizedAddress
+from checks.application.ports.fias_client import (
+    FiasBatchResult,
+    NormalizedAddress,
+)
+from shared.infra.adaptive_limiter import AdaptiveConcurrencyLimiter
+from shared.infra.circuit_breaker import CLOSED, CircuitBreaker
+from shared.infra.negative_cache import (
+    BLOCKED,
+    NOT_FOUND,
+    UPSTREAM_ERROR,
+    NegativeCachePolicy,
+    NegativeOutcome,
+)
+from shared.infra.ttl_cache import TtlCache
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_BATCH_CHUNK_SIZE = 64
+
 
 class ApiFiasClient:
     """Async-клиент ФИАС, совместимый с приложением."""
@@ -27,7 +43,11 @@ class ApiFiasClient:
         '_timeout',
         '_retries',
         '_backoff',
-        '_semaphore',
+        '_limiter',
+        '_breaker',
+        '_negative_policy',
+        '_negative_cache',
+        '_batch_chunk_size',
     )
 
     def __init__(
@@ -41,6 +61,11 @@ class ApiFiasClient:
         retry_backoff_seconds: float,
         concurrency_limit: int,
         endpoint: str,
+        negative_cache_policy: NegativeCachePolicy | None = None,
+        negative_cache_max_items: int = 4096,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
+        batch_chunk_size: int = _DEFAULT_BATCH_CHUNK_SIZE,
     ) -> None:
         """Сохранить параметры доступа к ФИАС."""
 
@@ -56,137 +81,258 @@ class ApiFiasClient:
         self._timeout = httpx.Timeout(timeout_seconds)
         self._retries = max(0, retries)
         self._backoff = max(0.0, retry_backoff_seconds)
-        self._semaphore = asyncio.Semaphore(max(1, concurrency_limit))
+        self._limiter = limiter or AdaptiveConcurrencyLimiter(
+            max_limit=concurrency_limit,
+        )
+        self._breaker = breaker or CircuitBreaker(name='fias')
+        self._negative_policy = negative_cache_policy
+        self._negative_cache = (
+            TtlCache(max_items=negative_cache_max_items, ttl_seconds=0)
+            if negative_cache_policy is not None
+            else None
+        )
+        self._batch_chunk_size = max(1, batch_chunk_size)
 
     async def normalize_address(self, query: str) -> NormalizedAddress | None:
         """Попробовать нормализовать адрес через ФИАС."""
 
+        result, _ = await self._normalize_with_outcome(query)
+        return result
+
+    async def normalize_many(
+        self,
+        queries: Sequence[str],
+    ) -> list[FiasBatchResult]:
+        """Нормализовать пакет запросов через общий HTTP-клиент.
+
+        Повторяющиеся запросы отправляются один раз. Уникальные идут
+        частями по batch_chunk_size: внутри части параллельно в пределах
+        лимитера, так что большой пакет не создаёт задачу на каждый
+        запрос сразу. Ошибка одного запроса не прерывает остальные.
+        Результаты возвращаются в порядке входа.
+        """
+
+        unique = list(dict.fromkeys(queries))
+        outcomes: list[Any] = []
+        for start in range(0, len(unique), self._batch_chunk_size):
+            chunk = unique[start : start + self._batch_chunk_size]
+            outcomes.extend(
+                await asyncio.gather(
+                    *(self._normalize_with_outcome(query) for query in chunk),
+                    return_exceptions=True,
+                ),
+            )
+
+        by_query: dict[str, tuple[NormalizedAddress | None, str | None]] = {}
+        for query, outcome in zip(unique, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                logger.warning(
+                    'fias_batch_item_failed query_len=%s error=%s',
+                    len(query),
+                    outcome.__class__.__name__,
+                )
+                by_query[query] = (None, outcome.__class__.__name__)
+            else:
+                by_query[query] = outcome
+
+        return [
+            FiasBatchResult(
+                query=query,
+                address=by_query[query][0],
+                error=by_query[query][1],
+            )
+            for query in queries
+        ]
+
+    async def _normalize_with_outcome(
+        self,
+        query: str,
+    ) -> tuple[NormalizedAddress | None, NegativeOutcome | None]:
+        """Учесть отрицательный кэш и запросить ФИАС.
+
+        Пока выключатель не замкнут, отрицательные исходы не кэшируются:
+        быстрый отказ обеспечивает он сам, а после восстановления запросы
+        не должны упираться в записи, оставшиеся от инцидента.
+        """
+
+        cache = self._negative_cache
+        if cache is not None:
+            cached_outcome = cache.get(query)
+            if cached_outcome is not None:
+                logger.debug(
+                    'fias_negative_cache_hit query_len=%s',
+                    len(query),
+                )
+                return None, cached_outcome
+
+        result, outcome = await self._request_normalized(query)
+        if (
+            cache is not None
+            and outcome is not None
+            and self._breaker.state == CLOSED
+        ):
+            cache.set(
+                query,
+                outcome,
+                ttl_seconds=self._negative_policy.ttl_for(outcome),
+            )
+        return result, outcome
+
+    async def _request_normalized(
+        self,
+        query: str,
+    ) -> tuple[NormalizedAddress | None, NegativeOutcome | None]:
+        """Запросить ФИАС и вернуть результат или отрицательный исход.
+
+        Слот лимитера занимается на одну попытку, поэтому пауза перед
+        повтором не держит его. Перед каждой попыткой спрашивается
+        выключатель: при разомкнутой цепи запрос сразу завершается.
+        Каждая разрешённая попытка завершается исходом для выключателя,
+        в том числе при отмене и неожиданном исключении.
+        """
+
         params = {
             'search_string': query,
             'address_type': 1,
         }
         query_len = len(query)
-        async with self._semaphore:
-            for attempt in range(self._retries + 1):
-                if attempt:
-                    delay = self._backoff * (2**attempt)
-                    jitter = uniform(0, min(0.1, delay * 0.1)) if delay else 0.0
-                    await asyncio.sleep(delay + jitter)
-
-                logger.debug(
-                    'fias_request_start endpoint=%s attempt=%s query_len=%s',
-                    self._endpoint,
-                    attempt,
+        for attempt in range(self._retries + 1):
+            if attempt:
+                delay = self._backoff * (2**attempt)
+                jitter = uniform(0, min(0.1, delay * 0.1)) if delay else 0.0
+                await asyncio.sleep(delay + jitter)
+
+            if not self._breaker.allow():
+                logger.info(
+                    'fias_circuit_open query_len=%s attempt=%s',
                     query_len,
+                    attempt,
                 )
-                start = perf_counter()
-                response: httpx.Response | None = None
-                try:
-                    response = await self._http_client.get(
-                        self._build_url(),
-                        params=params,
-                        headers=self._headers,
-                        timeout=self._timeout,
-                    )
-                except httpx.RequestError as exc:
-                    logger.warning(
-                        'fias_request_error endpoint=%s attempt=%s error=%s',
-                        self._endpoint,
-                        attempt,
-                        exc.__class__.__name__,
-                    )
-                    if attempt == self._retries:
-                        logger.error(
-                            'fias_request_failed query_len=%s reason=request',
-                            query_len,
+                return None, UPSTREAM_ERROR
+
+            logger.debug(
+                'fias_request_start endpoint=%s attempt=%s query_len=%s',
+                self._endpoint,
+                attempt,
+                query_len,
+            )
+            try:
+                async with self._limiter.slot() as epoch:
+                    start = perf_counter()
+                    try:
+                        response = await self._http_client.get(
+                            self._build_url(),
+                            params=params,
+                            headers=self._headers,
+                            timeout=self._timeout,
+                        )
+                    except httpx.RequestError as exc:
+                        self._record_failure(epoch)
+                        logger.warning(
+                            'fias_request_error endpoint=%s attempt=%s '
+                            'error=%s',
+                            self._endpoint,
+                            attempt,
+                            exc.__class__.__name__,
                         )
-                        return None
-                    continue
-                finally:
+                        if attempt == self._retries:
+                            logger.error(
+                                'fias_request_failed query_len=%s '
+                                'reason=request',
+                                query_len,
+                            )
+                            return None, UPSTREAM_ERROR
+                        continue
+
                     duration = perf_counter() - start
                     logger.debug(
                         'fias_response_received status=%s duration=%.3fs',
-                        response.status_code if response else 'n/a',
+                        response.status_code,
                         duration,
                     )
-
-                if response is None:
-                    continue
-
-                status = response.status_code
-                if status == 200:
-                    payload = self._safe_json(response)
-                    parsed = self._parse_normalized(payload, query)
-                    if parsed is None:
-                        logger.warning(
-                            'fias_payload_invalid query_len=%s keys=%s',
-                            query_len,
-                            self._payload_keys(payload),
-                        )
-                        return None
-
-                    logger.info(
-                        'fias_request_success query_len=%s keys=%s',
+            except asyncio.CancelledError:
+                self._breaker.record_abandoned()
+                raise
+            except Exception:
+                self._breaker.record_failure()
+                raise
+
+            status = response.status_code
+            if self._should_retry_status(status):
+                self._record_failure(epoch)
+                logger.warning(
+                    'fias_retryable_status status=%s attempt=%s',
+                    status,
+                    attempt,
+                )
+                if attempt == self._retries:
+                    logger.error(
+                        'fias_retries_exhausted status=%s query_len=%s',
+                        status,
                         query_len,
-                        self._payload_keys(payload),
                     )
-                    return parsed
+                    return None, UPSTREAM_ERROR
+                continue
 
-                if status in (401, 403, 404):
+            self._breaker.record_success()
+            self._limiter.record_success(duration, epoch)
+            if status == 200:
+                payload = self._safe_json(response)
+                parsed = self._parse_normalized(payload, query)
+                if parsed is None:
                     logger.warning(
-                        'fias_request_denied status=%s '
-                        'endpoint=%s query_len=%s',
-                        status,
-                        self._endpoint,
+                        'fias_payload_invalid query_len=%s keys=%s',
                         query_len,
+                        self._payload_keys(payload),
                     )
-                    return None
+                    return None, NOT_FOUND
 
-                if self._should_retry_status(status):
-                    logger.warning(
-                        'fias_retryable_status status=%s attempt=%s',
-                        status,
-                        attempt,
-                    )
-                    if attempt == self._retries:
-                        logger.error(
-                            'fias_retries_exhausted status=%s query_len=%s',
-                            status,
-                            query_len,
-                        )
-                        return None
-                    continue
+                logger.info(
+                    'fias_request_success query_len=%s keys=%s',
+                    query_len,
+                    self._payload_keys(payload),
+                )
+                return parsed, None
 
+            if status in (401, 403, 404):
                 logger.warning(
-                    'fias_unexpected_status status=%s body=%s',
+                    'fias_request_denied status=%s endpoint=%s query_len=%s',
                     status,
-                    response.text[:200],
+                    self._endpoint,
+                    query_len,
                 )
-                return None
+                return None, (NOT_FOUND if status == 404 else BLOCKED)
+
+            logger.warning(
+                'fias_unexpected_status status=%s body=%s',
+                status,
+                response.text[:200],
+            )
+            return None, UPSTREAM_ERROR
 
         logger.info(
             'fias_request_no_result query_len=%s attempts=%s',
             query_len,
             self._retries + 1,
         )
-        return None
+        return None, UPSTREAM_ERROR
 
-    def search_address_item(
-        self,
-        search_string: str,
-        *,
-        address_type: int = 1,
-    ) -> NormalizedAddress | None:
-        """Синхронный шим для устаревших адаптеров."""
+    @property
+    def health(self) -> dict[str, object]:
+        """Состояние выключателя и адаптивного лимита."""
 
-        coro = self.normalize_address(search_string)
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            return asyncio.run(coro)
+        return {
+            'circuit': self._breaker.snapshot(),
+            'concurrency': self._limiter.snapshot(),
+        }
+
+    def _record_failure(self, epoch: int) -> None:
+        """Сообщить о сбое выключателю и лимитеру."""
 
-        future = asyncio.run_coroutine_threadsafe(coro, loop)
-        return future.result()
+        self._breaker.record_failure()
+        self._limiter.record_overload(epoch)
 
     @staticmethod
     def _parse_normalized(payload: Any, query: str) -> NormalizedAddress | None:
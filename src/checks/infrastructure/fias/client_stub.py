@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
-from checks.application.ports.fias_client import NormalizedAddress
+from checks.application.ports.fias_client import (
+    FiasBatchResult,
+    NormalizedAddress,
+)
 
 
 class StubFiasClient:
@@ -34,6 +38,24 @@ class StubFiasClient:
             region_code=normalized.get('region_code'),
         )
 
+    async def normalize_many(
+        self,
+        queries: Sequence[str],
+    ) -> list[FiasBatchResult]:
+        """Нормализовать пакет запросов по тем же правилам."""
+
+        results = []
+        for query in queries:
+            address = await self.normalize_address(query)
+            results.append(
+                FiasBatchResult(
+                    query=query,
+                    address=address,
+                    error=None if address is not None else 'not_found',
+                ),
+            )
+        return results
+
     @staticmethod
     def _match(query: str) -> dict[str, Any] | None:
         lowered = query.lower()
@@ -61,9 +83,3 @@ class StubFiasClient:
             }
 
         return None
-
-    @staticmethod
-    def search_address_item(value: str) -> dict[str, str]:
-        """Совместимость со старым синхронным интерфейсом."""
-
-        return {'value': value}
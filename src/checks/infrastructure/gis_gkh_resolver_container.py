@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import inspect
 
-from shared.kernel.gis_gkh_client_factory import build_gis_gkh_client
+from shared.kernel.gis_gkh_client_factory import (
+    build_gis_gkh_client,
+    get_gis_gkh_house_cache,
+)
 from shared.kernel.settings import Settings
 from sources.gis_gkh.use_cases.resolve_house_by_cadastral import (
     ResolveGisGkhHouseByCadastralUseCase,
@@ -21,7 +24,12 @@ def get_gis_gkh_resolver_use_case(
     global _use_case
     if _use_case is None:
         client = build_gis_gkh_client(settings)
-        _use_case = ResolveGisGkhHouseByCadastralUseCase(client=client)
+        _use_case = ResolveGisGkhHouseByCadastralUseCase(
+            client=client,
+            cache=get_gis_gkh_house_cache(settings),
+            ttl_seconds=getattr(settings, 'GIS_GKH_CACHE_TTL_SECONDS', 0),
+            stale_seconds=getattr(settings, 'GIS_GKH_CACHE_STALE_SECONDS', 0),
+        )
 
     return _use_case
 
@@ -33,6 +41,15 @@ def reset_gis_gkh_resolver_container() -> None:
     _use_case = None
 
 
+async def warmup_gis_gkh_resolver_container(settings: Settings) -> None:
+    """Заранее прогреть клиент GIS ЖКХ, если он это поддерживает."""
+
+    client = get_gis_gkh_resolver_use_case(settings).client
+    warmup_method = getattr(client, 'warmup', None)
+    if callable(warmup_method):
+        await warmup_method()
+
+
 async def shutdown_gis_gkh_resolver_container() -> None:
     """Корректно закрыть GIS ЖКХ клиент и сбросить singleton."""
 
@@ -40,6 +57,7 @@ async def shutdown_gis_gkh_resolver_container() -> None:
     if _use_case is None:
         return
 
+    await _use_case.close()
     client = _use_case.client
     close_method = getattr(client, 'close', None)
     if callable(close_method):
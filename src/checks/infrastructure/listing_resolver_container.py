@@ -2,40 +2,46 @@
 
 from __future__ import annotations
 
-import httpx
-
+from shared.infra.ttl_cache import TtlCache
+from shared.kernel.settings import get_settings
 from sources.application.use_cases import ResolveListingFromUrlUseCase
 from sources.infrastructure.avito import AvitoListingProvider
 
 _use_case: ResolveListingFromUrlUseCase | None = None
-
-
-def _client_factory() -> httpx.Client:
-    """Создать httpx client для провайдера."""
-
-    return httpx.Client(
-        timeout=10.0,
-        follow_redirects=True,
-        headers={
-            'User-Agent': 'flaffy/listing-resolver',
-        },
-    )
+_provider: AvitoListingProvider | None = None
 
 
 def get_listing_resolver_use_case() -> ResolveListingFromUrlUseCase:
     """Вернуть singleton use-case для резолвинга листингов."""
 
-    global _use_case
+    global _use_case, _provider
     if _use_case is not None:
         return _use_case
 
-    provider = AvitoListingProvider(client_factory=_client_factory)
-    _use_case = ResolveListingFromUrlUseCase((provider,))
+    _provider = AvitoListingProvider(
+        timeout_seconds=10.0,
+        user_agent='flaffy/listing-resolver',
+    )
+    settings = get_settings()
+    cache = None
+    if (
+        settings.LISTING_CACHE_ENABLED
+        and settings.LISTING_CACHE_TTL_SECONDS > 0
+    ):
+        cache = TtlCache(
+            max_items=settings.LISTING_CACHE_MAX_ITEMS,
+            ttl_seconds=settings.LISTING_CACHE_TTL_SECONDS,
+        )
+    _use_case = ResolveListingFromUrlUseCase((_provider,), cache=cache)
     return _use_case
 
 
-def close_listing_resolver_container() -> None:
-    """Сбросить use-case (клиенты создаются по запросу)."""
+async def close_listing_resolver_container() -> None:
+    """Закрыть пул соединений провайдера и сбросить use-case."""
 
-    global _use_case
+    global _use_case, _provider
+    provider = _provider
     _use_case = None
+    _provider = None
+    if provider is not None:
+        await provider.close()
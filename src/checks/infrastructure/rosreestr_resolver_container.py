@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import inspect
+
 from shared.kernel.rosreestr_client_factory import build_rosreestr_client
 from shared.kernel.settings import Settings
 from sources.rosreestr.use_cases.resolve_house_by_cadastral import (
@@ -29,3 +31,19 @@ def reset_rosreestr_resolver_container() -> None:
 
     global _use_case
     _use_case = None
+
+
+async def shutdown_rosreestr_resolver_container() -> None:
+    """Закрыть HTTP-клиент Росреестра и сбросить singleton."""
+
+    global _use_case
+    if _use_case is None:
+        return
+
+    client = _use_case.client
+    _use_case = None
+    close_method = getattr(client, 'close', None)
+    if callable(close_method):
+        result = close_method()
+        if inspect.isawaitable(result):
+            await result
@@ -0,0 +1,128 @@
+"""Адаптивный лимит параллельных запросов (AIMD)."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+
+class AdaptiveConcurrencyLimiter:
+    """Лимит параллелизма, подстраивающийся под здоровье источника.
+
+    Успешный быстрый ответ увеличивает лимит примерно на единицу за
+    «окно» из limit запросов. Перегрузка делит лимит на
+    decrease_factor: это ответы 429 или 5xx, сетевые ошибки и ответы
+    дольше latency_target_seconds. Лимит не выходит за границы
+    [min_limit, max_limit].
+
+    slot() отдаёт номер эпохи, которая меняется при каждом снижении.
+    Перегрузка запроса, начатого до последнего снижения, игнорируется:
+    пачка одновременных отказов снижает лимит один раз, а не до пола.
+    """
+
+    __slots__ = (
+        '_min_limit',
+        '_max_limit',
+        '_limit',
+        '_latency_target',
+        '_decrease_factor',
+        '_in_flight',
+        '_condition',
+        '_epoch',
+    )
+
+    def __init__(
+        self,
+        *,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: int | None = None,
+        latency_target_seconds: float | None = None,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        """Задать границы лимита и реакцию на перегрузку."""
+
+        self._max_limit = max(1, max_limit)
+        self._min_limit = min(max(1, min_limit), self._max_limit)
+        start = initial_limit if initial_limit is not None else max_limit
+        self._limit = float(
+            min(max(start, self._min_limit), self._max_limit),
+        )
+        self._latency_target = (
+            latency_target_seconds
+            if latency_target_seconds and latency_target_seconds > 0
+            else None
+        )
+        self._decrease_factor = min(max(decrease_factor, 0.1), 0.9)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._epoch = 0
+
+    @property
+    def limit(self) -> int:
+        """Текущий целый лимит."""
+
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Число выполняющихся запросов."""
+
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[int]:
+        """Занять слот на время одного запроса и вернуть эпоху."""
+
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self._in_flight < self.limit,
+            )
+            self._in_flight += 1
+
+        try:
+            yield self._epoch
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def record_success(
+        self,
+        latency_seconds: float,
+        epoch: int | None = None,
+    ) -> None:
+        """Учесть ответ; медленный ответ считается перегрузкой."""
+
+        if (
+            self._latency_target is not None
+            and latency_seconds > self._latency_target
+        ):
+            self.record_overload(epoch)
+            return
+
+        self._limit = min(
+            self._limit + 1.0 / max(self._limit, 1.0),
+            float(self._max_limit),
+        )
+
+    def record_overload(self, epoch: int | None = None) -> None:
+        """Мультипликативно снизить лимит.
+
+        epoch — эпоха из slot(); без неё снижение безусловно.
+        """
+
+        if epoch is not None and epoch != self._epoch:
+            return
+
+        self._epoch += 1
+        self._limit = max(
+            self._limit * self._decrease_factor,
+            float(self._min_limit),
+        )
+
+    def snapshot(self) -> dict[str, int]:
+        """Вернуть лимит и загрузку."""
+
+        return {'limit': self.limit, 'in_flight': self._in_flight}
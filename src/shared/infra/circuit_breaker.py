@@ -0,0 +1,141 @@
+"""Автоматический выключатель для вызовов внешних источников."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Literal
+
+logger = logging.getLogger(__name__)
+
+CircuitState = Literal['closed', 'open', 'half_open']
+
+CLOSED: CircuitState = 'closed'
+OPEN: CircuitState = 'open'
+HALF_OPEN: CircuitState = 'half_open'
+
+
+class CircuitBreaker:
+    """Размыкается после серии сбоев и пропускает пробные вызовы.
+
+    В состоянии closed вызовы идут свободно, подряд идущие сбои
+    считаются. После failure_threshold сбоев цепь размыкается на
+    reset_timeout_seconds, и allow() сразу отвечает False. Затем
+    half_open пропускает до half_open_max_calls пробных вызовов: успех
+    замыкает цепь, сбой снова размыкает.
+    """
+
+    __slots__ = (
+        '_name',
+        '_failure_threshold',
+        '_reset_timeout',
+        '_half_open_max_calls',
+        '_now',
+        '_state',
+        '_failures',
+        '_opened_at',
+        '_probes',
+    )
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        now_fn: Callable[[], float] | None = None,
+    ) -> None:
+        """Сконфигурировать пороги выключателя."""
+
+        self._name = name
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = max(0.0, reset_timeout_seconds)
+        self._half_open_max_calls = max(1, half_open_max_calls)
+        self._now = now_fn or time.monotonic
+        self._state: CircuitState = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Текущее состояние с учётом истёкшего таймаута."""
+
+        if (
+            self._state == OPEN
+            and self._now() - self._opened_at >= self._reset_timeout
+        ):
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def allow(self) -> bool:
+        """Разрешить вызов или ответить отказом без обращения к источнику."""
+
+        state = self.state
+        if state == CLOSED:
+            return True
+
+        if state == OPEN:
+            return False
+
+        if self._probes >= self._half_open_max_calls:
+            return False
+
+        self._probes += 1
+        return True
+
+    def record_success(self) -> None:
+        """Учесть успешный вызов."""
+
+        self._failures = 0
+        if self._state != CLOSED:
+            self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        """Учесть сбой и разомкнуть цепь при превышении порога."""
+
+        if self._state == HALF_OPEN:
+            self._open()
+            return
+
+        self._failures += 1
+        if self._state == CLOSED and self._failures >= self._failure_threshold:
+            self._open()
+
+    def record_abandoned(self) -> None:
+        """Учесть вызов, прерванный без ответа источника.
+
+        Разрешение в half_open занимает слот пробы, который освобождают
+        только исходы. Прерванная проба поэтому считается сбоем, иначе
+        цепь навсегда осталась бы полуоткрытой. В closed прерывание ничего
+        не говорит о здоровье источника и не учитывается.
+        """
+
+        if self._state == HALF_OPEN:
+            self._open()
+
+    def snapshot(self) -> dict[str, object]:
+        """Вернуть состояние для health-эндпоинтов и логов."""
+
+        return {
+            'state': self.state,
+            'failures': self._failures,
+        }
+
+    def _open(self) -> None:
+        self._opened_at = self._now()
+        self._transition(OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        logger.info(
+            'circuit_state_changed name=%s from=%s to=%s',
+            self._name,
+            self._state,
+            state,
+        )
+        self._state = state
+        self._probes = 0
+        if state == CLOSED:
+            self._failures = 0
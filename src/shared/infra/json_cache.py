@@ -0,0 +1,213 @@
+"""Кэши JSON-совместимых словарей: в памяти процесса и в Redis."""
+
+from __future__ import annotations
+
+import logging
+import time
+import zlib
+from collections.abc import Callable, Mapping, Sequence
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from shared.infra.ttl_cache import TtlCache
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_ITEMS = 10_000
+
+
+class InMemoryJsonCache:
+    """Ограниченный по размеру TTL кэш словарей в памяти процесса."""
+
+    __slots__ = ('_store',)
+
+    def __init__(
+        self,
+        *,
+        max_items: int = _DEFAULT_MAX_ITEMS,
+        now_fn: Callable[[], float] | None = None,
+    ) -> None:
+        """Инициализировать кэш."""
+
+        self._store = TtlCache(
+            max_items=max_items,
+            ttl_seconds=0,
+            now_fn=now_fn or time.monotonic,
+        )
+
+    async def get(self, *, key: str) -> dict[str, object] | None:
+        """Получить значение, если TTL не истёк."""
+
+        return self._store.get(key)
+
+    async def set(
+        self,
+        *,
+        key: str,
+        value: dict[str, object],
+        ttl_seconds: int,
+    ) -> None:
+        """Сохранить значение с TTL."""
+
+        self._store.set(key, value, ttl_seconds=max(ttl_seconds, 0))
+
+    async def get_many(
+        self,
+        *,
+        keys: Sequence[str],
+    ) -> dict[str, dict[str, object]]:
+        """Получить найденные значения по набору ключей."""
+
+        found = {}
+        for key in keys:
+            value = self._store.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set_many(
+        self,
+        *,
+        items: Mapping[str, dict[str, object]],
+        ttl_seconds: int,
+    ) -> None:
+        """Сохранить набор значений с общим TTL."""
+
+        for key, value in items.items():
+            self._store.set(key, value, ttl_seconds=max(ttl_seconds, 0))
+
+
+class RedisJsonCache:
+    """Хранит сжатые словари в Redis с TTL и лимитом записей.
+
+    Ключи записей индексируются в sorted set по времени истечения;
+    при превышении лимита удаляются записи, которые истекают раньше.
+    """
+
+    __slots__ = ('_client', '_prefix', '_index', '_max_items', '_now')
+
+    def __init__(
+        self,
+        client: Redis,
+        *,
+        max_items: int,
+        prefix: str,
+        now_fn: Callable[[], float] | None = None,
+    ) -> None:
+        """Настроить клиента Redis и лимит записей."""
+
+        self._client = client
+        self._prefix = prefix
+        self._index = f'{prefix}index'
+        self._max_items = max(1, max_items)
+        self._now = now_fn or time.time
+
+    async def get(self, *, key: str) -> dict[str, object] | None:
+        """Получить значение, если оно есть в Redis."""
+
+        try:
+            blob = await self._client.get(self._name(key))
+        except RedisError as exc:
+            logger.info('json_cache_unavailable key=%s error=%s', key, exc)
+            return None
+
+        return self._decode(key, blob)
+
+    async def get_many(
+        self,
+        *,
+        keys: Sequence[str],
+    ) -> dict[str, dict[str, object]]:
+        """Получить значения одним MGET."""
+
+        if not keys:
+            return {}
+
+        try:
+            blobs = await self._client.mget([self._name(key) for key in keys])
+        except RedisError as exc:
+            logger.info(
+                'json_cache_unavailable keys=%s error=%s',
+                len(keys),
+                exc,
+            )
+            return {}
+
+        found = {}
+        for key, blob in zip(keys, blobs, strict=True):
+            value = self._decode(key, blob)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set(
+        self,
+        *,
+        key: str,
+        value: dict[str, object],
+        ttl_seconds: int,
+    ) -> None:
+        """Сохранить сжатое значение с TTL."""
+
+        await self.set_many(items={key: value}, ttl_seconds=ttl_seconds)
+
+    async def set_many(
+        self,
+        *,
+        items: Mapping[str, dict[str, object]],
+        ttl_seconds: int,
+    ) -> None:
+        """Сохранить набор сжатых значений одним конвейером."""
+
+        if ttl_seconds <= 0 or not items:
+            return
+
+        now = self._now()
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                for key, value in items.items():
+                    name = self._name(key)
+                    blob = zlib.compress(orjson.dumps(value))
+                    pipe.set(name, blob, ex=ttl_seconds)
+                    pipe.zadd(self._index, {name: now + ttl_seconds})
+                pipe.zremrangebyscore(self._index, '-inf', now)
+                pipe.zcard(self._index)
+                results = await pipe.execute()
+
+            overflow = int(results[-1]) - self._max_items
+            if overflow > 0:
+                await self._evict(overflow)
+        except RedisError as exc:
+            logger.info(
+                'json_cache_set_failed keys=%s error=%s',
+                len(items),
+                exc,
+            )
+
+    async def _evict(self, count: int) -> None:
+        """Удалить записи, которые истекают раньше остальных."""
+
+        evicted = await self._client.zpopmin(self._index, count)
+        names = [member for member, _ in evicted]
+        if names:
+            await self._client.delete(*names)
+
+    @staticmethod
+    def _decode(key: str, blob: bytes | None) -> dict[str, object] | None:
+        """Распаковать запись, отбросив повреждённую."""
+
+        if blob is None:
+            return None
+
+        try:
+            value = orjson.loads(zlib.decompress(blob))
+        except (zlib.error, orjson.JSONDecodeError) as exc:
+            logger.info('json_cache_corrupted key=%s error=%s', key, exc)
+            return None
+
+        return value if isinstance(value, dict) else None
+
+    def _name(self, key: str) -> str:
+        return f'{self._prefix}{key}'
@@ -0,0 +1,50 @@
+"""Политика кэширования отрицательных ответов внешних источников."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from random import uniform
+from typing import Literal
+
+NegativeOutcome = Literal['not_found', 'blocked', 'upstream_error']
+
+NOT_FOUND: NegativeOutcome = 'not_found'
+BLOCKED: NegativeOutcome = 'blocked'
+UPSTREAM_ERROR: NegativeOutcome = 'upstream_error'
+
+
+@dataclass(frozen=True, slots=True)
+class NegativeCacheEntry:
+    """Запомненный отрицательный ответ источника."""
+
+    outcome: NegativeOutcome
+    detail: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class NegativeCachePolicy:
+    """Короткие TTL для отрицательных ответов с джиттером."""
+
+    not_found_ttl_seconds: float = 600.0
+    blocked_ttl_seconds: float = 120.0
+    upstream_error_ttl_seconds: float = 30.0
+    jitter_ratio: float = 0.2
+    jitter_fn: Callable[[float, float], float] = uniform
+
+    def ttl_for(self, outcome: NegativeOutcome) -> float:
+        """Вернуть TTL исхода с разбросом, чтобы записи не истекали разом."""
+
+        base = {
+            NOT_FOUND: self.not_found_ttl_seconds,
+            BLOCKED: self.blocked_ttl_seconds,
+            UPSTREAM_ERROR: self.upstream_error_ttl_seconds,
+        }[outcome]
+        if base <= 0:
+            return 0.0
+
+        ratio = max(0.0, self.jitter_ratio)
+        if not ratio:
+            return base
+
+        return max(0.0, base * (1 + self.jitter_fn(-ratio, ratio)))
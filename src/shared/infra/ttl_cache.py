@@ -0,0 +1,231 @@
+"""Процессный LRU-кэш с TTL и амортизированным O(1) вытеснением."""
+
+from __future__ import annotations
+
+import heapq
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+_HEAP_COMPACT_MIN = 64
+
+
+@dataclass(slots=True)
+class TtlCacheStats:
+    """Счётчики обращений и вытеснений кэша."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    rejections: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Вернуть счётчики в виде словаря."""
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'rejections': self.rejections,
+        }
+
+
+@dataclass(slots=True)
+class _Entry:
+    """Запись кэша с номером версии для ленивой очистки кучи."""
+
+    value: Any
+    expires_at: float
+    size: int
+    seq: int
+
+
+def default_size_of(value: Any) -> int:
+    """Оценить размер значения в байтах."""
+
+    if isinstance(value, str | bytes | bytearray | memoryview):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class TtlCache:
+    """LRU-кэш с TTL, лимитами по числу записей и байтам.
+
+    Порядок LRU хранится в OrderedDict, сроки жизни — в min-куче.
+    Перезаписанные ключи оставляют в куче устаревшие узлы, которые
+    отбрасываются при извлечении, а куча пересобирается, когда их
+    становится больше живых записей.
+    """
+
+    __slots__ = (
+        '_max_items',
+        '_max_bytes',
+        '_ttl_seconds',
+        '_now',
+        '_size_of',
+        '_items',
+        '_heap',
+        '_seq',
+        '_bytes',
+        'stats',
+    )
+
+    def __init__(
+        self,
+        *,
+        max_items: int,
+        ttl_seconds: float,
+        max_bytes: int | None = None,
+        now_fn: Callable[[], float] | None = None,
+        size_fn: Callable[[Any], int] | None = None,
+    ) -> None:
+        """Сконфигурировать лимиты и TTL по умолчанию."""
+
+        self._max_items = max_items
+        self._max_bytes = max_bytes if max_bytes and max_bytes > 0 else None
+        self._ttl_seconds = ttl_seconds
+        self._now = now_fn or time.monotonic
+        self._size_of = size_fn or default_size_of
+        self._items: OrderedDict[object, _Entry] = OrderedDict()
+        self._heap: list[tuple[float, int, object]] = []
+        self._seq = 0
+        self._bytes = 0
+        self.stats = TtlCacheStats()
+
+    def get(self, key: object) -> Any | None:
+        """Получить значение, если оно не протухло."""
+
+        now = self._now()
+        self._expire(now)
+        entry = self._items.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        if entry.expires_at <= now:
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def set(
+        self,
+        key: object,
+        value: Any,
+        *,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Сохранить значение с TTL по умолчанию или указанным."""
+
+        now = self._now()
+        self._expire(now)
+        self._remove(key)
+
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        size = self._size_of(value) if self._max_bytes is not None else 0
+        if ttl <= 0 or (self._max_bytes is not None and size > self._max_bytes):
+            self.stats.rejections += 1
+            return
+
+        self._seq += 1
+        expires_at = now + ttl
+        self._items[key] = _Entry(
+            value=value,
+            expires_at=expires_at,
+            size=size,
+            seq=self._seq,
+        )
+        self._bytes += size
+        heapq.heappush(self._heap, (expires_at, self._seq, key))
+        self._evict_overflow()
+        self._maybe_compact()
+
+    def pop(self, key: object) -> Any | None:
+        """Удалить значение и вернуть его."""
+
+        entry = self._remove(key)
+        return entry.value if entry is not None else None
+
+    def clear(self) -> None:
+        """Удалить все записи, сохранив счётчики."""
+
+        self._items.clear()
+        self._heap.clear()
+        self._bytes = 0
+
+    def purge_expired(self) -> None:
+        """Удалить протухшие записи."""
+
+        self._expire(self._now())
+
+    @property
+    def size_bytes(self) -> int:
+        """Суммарный оценочный размер значений."""
+
+        return self._bytes
+
+    def snapshot_stats(self) -> dict[str, int]:
+        """Вернуть счётчики вместе с текущим размером."""
+
+        return {
+            **self.stats.to_dict(),
+            'size': len(self._items),
+            'bytes': self._bytes,
+        }
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._items.get(key)
+        return entry is not None and entry.expires_at > self._now()
+
+    def _expire(self, now: float) -> None:
+        """Снять с кучи все истёкшие записи."""
+
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, seq, key = heapq.heappop(heap)
+            entry = self._items.get(key)
+            if entry is not None and entry.seq == seq:
+                self._remove(key)
+                self.stats.expirations += 1
+
+    def _evict_overflow(self) -> None:
+        """Вытеснить самые старые записи сверх лимитов."""
+
+        while len(self._items) > self._max_items or (
+            self._max_bytes is not None and self._bytes > self._max_bytes
+        ):
+            _, entry = self._items.popitem(last=False)
+            self._bytes -= entry.size
+            self.stats.evictions += 1
+
+    def _remove(self, key: object) -> _Entry | None:
+        """Удалить запись, оставив её узел в куче устаревшим."""
+
+        entry = self._items.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        return entry
+
+    def _maybe_compact(self) -> None:
+        """Пересобрать кучу, если устаревших узлов больше живых."""
+
+        if len(self._heap) <= max(2 * len(self._items), _HEAP_COMPACT_MIN):
+            return
+
+        self._heap = [
+            (entry.expires_at, entry.seq, key)
+            for key, entry in self._items.items()
+        ]
+        heapq.heapify(self._heap)
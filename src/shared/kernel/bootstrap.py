@@ -10,21 +10,37 @@ from sqlalchemy import text
 from checks.api.routes.check import router as check_router
 from checks.infrastructure.gis_gkh_resolver_container import (
     shutdown_gis_gkh_resolver_container,
+    warmup_gis_gkh_resolver_container,
 )
 from checks.infrastructure.listing_resolver_container import (
     close_listing_resolver_container,
 )
+from checks.infrastructure.rosreestr_resolver_container import (
+    shutdown_rosreestr_resolver_container,
+)
 from reports.api.routes import router as reports_router
+from shared.kernel.check_single_flight_factory import (
+    shutdown_check_single_flight,
+)
 from shared.kernel.db import create_engine, create_sessionmaker, session_scope
-from shared.kernel.fias_client_factory import get_fias_client
+from shared.kernel.fias_client_factory import (
+    get_fias_client,
+    shutdown_fias_cache,
+)
+from shared.kernel.gis_gkh_client_factory import shutdown_gis_gkh_house_cache
+from shared.kernel.kad_arbitr_client_factory import shutdown_kad_arbitr_client
+from shared.kernel.kad_arbitr_pdf_extractor_factory import (
+    shutdown_kad_arbitr_pdf_text_extractor,
+)
 from shared.kernel.logging import get_logger, setup_logging
 from shared.kernel.repositories import configure_repositories
+from shared.kernel.rosreestr_client_factory import shutdown_rosreestr_cache
 from shared.kernel.settings import get_settings
 
 RouterFactory = Callable[[], APIRouter]
 
 
-def _health_router(session_factory) -> APIRouter:
+def _health_router(session_factory, fias_client) -> APIRouter:
     router = APIRouter()
 
     @router.get('/health')
@@ -45,6 +61,18 @@ def _health_router(session_factory) -> APIRouter:
 
         return {'status': 'ok'}
 
+    @router.get('/health/fias')
+    async def fias_health() -> dict[str, object]:
+        """Состояние выключателя и лимита запросов к ФИАС."""
+
+        details = getattr(fias_client, 'health', None)
+        if details is None:
+            return {'status': 'ok'}
+
+        circuit = details.get('circuit', {})
+        status = 'ok' if circuit.get('state') == 'closed' else 'degraded'
+        return {'status': status, **details}
+
     return router
 
 
@@ -87,14 +115,26 @@ def create_app() -> FastAPI:
             settings.APP_ENV,
             settings.SERVICE_NAME,
         )
+        if settings.GIS_GKH_MODE == 'playwright' and settings.GIS_GKH_PREWARM:
+            try:
+                await warmup_gis_gkh_resolver_container(settings)
+            except Exception as exc:
+                logger.warning('gis_gkh_warmup_failed error=%s', exc)
         try:
             yield
         finally:
             if fias_http_client is not None:
                 await fias_http_client.aclose()
             await engine.dispose()
+            await shutdown_fias_cache()
             await shutdown_gis_gkh_resolver_container()
-            close_listing_resolver_container()
+            await shutdown_gis_gkh_house_cache()
+            await shutdown_rosreestr_resolver_container()
+            await shutdown_rosreestr_cache()
+            await shutdown_kad_arbitr_client()
+            await shutdown_check_single_flight()
+            await close_listing_resolver_container()
+            shutdown_kad_arbitr_pdf_text_extractor()
             logger.info('app_shutdown')
 
     app = FastAPI(
@@ -107,7 +147,7 @@ def create_app() -> FastAPI:
     app.state.fias_client = fias_client
     app.state.fias_http_client = fias_http_client
 
-    app.include_router(_health_router(session_factory))
+    app.include_router(_health_router(session_factory, fias_client))
 
     for factory in ROUTER_FACTORIES:
         app.include_router(factory[0], prefix=factory[1], tags=factory[2])
@@ -0,0 +1,54 @@
+"""Фабрика объединения одинаковых одновременных проверок."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from checks.application.use_cases.check_address_single_flight import (
+    CheckSingleFlight,
+)
+from shared.kernel.settings import Settings
+
+_CHECK_SINGLE_FLIGHT: CheckSingleFlight | None = None
+_CHECK_LOCK_REDIS: Any | None = None
+
+
+def get_check_single_flight(settings: Settings) -> CheckSingleFlight | None:
+    """Вернуть общий для процесса single-flight проверок."""
+
+    if not getattr(settings, 'CHECK_SINGLE_FLIGHT_ENABLED', True):
+        return None
+
+    global _CHECK_SINGLE_FLIGHT, _CHECK_LOCK_REDIS
+    if _CHECK_SINGLE_FLIGHT is None:
+        lock = None
+        redis_url = getattr(settings, 'CHECK_LOCK_REDIS_URL', None)
+        if redis_url:
+            from redis.asyncio import Redis
+
+            from checks.infrastructure.check_lock_redis import (
+                RedisCheckLock,
+            )
+
+            _CHECK_LOCK_REDIS = Redis.from_url(redis_url)
+            lock = RedisCheckLock(
+                _CHECK_LOCK_REDIS,
+                timeout_seconds=settings.CHECK_LOCK_TIMEOUT_SECONDS,
+                wait_seconds=settings.CHECK_LOCK_WAIT_SECONDS,
+            )
+        _CHECK_SINGLE_FLIGHT = CheckSingleFlight(lock=lock)
+
+    return _CHECK_SINGLE_FLIGHT
+
+
+async def shutdown_check_single_flight() -> None:
+    """Закрыть подключение к Redis и сбросить singleton."""
+
+    global _CHECK_SINGLE_FLIGHT, _CHECK_LOCK_REDIS
+    _CHECK_SINGLE_FLIGHT = None
+    if _CHECK_LOCK_REDIS is None:
+        return
+
+    client = _CHECK_LOCK_REDIS
+    _CHECK_LOCK_REDIS = None
+    await client.aclose()
@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import httpx
 
 from checks.application.ports.fias_client import FiasClient
+from checks.infrastructure.fias.cached_client import (
+    CachedFiasClient,
+    FiasCachePort,
+)
 from checks.infrastructure.fias.client import ApiFiasClient
 from checks.infrastructure.fias.client_stub import StubFiasClient
+from shared.infra.adaptive_limiter import AdaptiveConcurrencyLimiter
+from shared.infra.circuit_breaker import CircuitBreaker
+from shared.kernel.negative_cache_factory import build_negative_cache_policy
 from shared.kernel.settings import Settings
 
+_cache: FiasCachePort | None = None
+_cache_redis: Any | None = None
+
 
 def get_fias_client(
     settings: Settings,
@@ -25,7 +37,7 @@ def get_fias_client(
     if not settings.FIAS_BASE_URL or not settings.FIAS_TOKEN:
         raise RuntimeError('FIAS_BASE_URL and FIAS_TOKEN must be configured.')
 
-    return ApiFiasClient(
+    client = ApiFiasClient(
         base_url=settings.FIAS_BASE_URL,
         token=settings.FIAS_TOKEN,
         http_client=http_client,
@@ -34,4 +46,94 @@ def get_fias_client(
         retry_backoff_seconds=settings.FIAS_RETRY_BACKOFF_SECONDS,
         concurrency_limit=settings.FIAS_CONCURRENCY_LIMIT,
         endpoint=settings.FIAS_SUGGEST_ENDPOINT,
+        negative_cache_policy=build_negative_cache_policy(settings),
+        negative_cache_max_items=getattr(
+            settings,
+            'NEGATIVE_CACHE_MAX_ITEMS',
+            4096,
+        ),
+        limiter=AdaptiveConcurrencyLimiter(
+            max_limit=settings.FIAS_CONCURRENCY_LIMIT,
+            min_limit=getattr(settings, 'FIAS_MIN_CONCURRENCY', 1),
+            latency_target_seconds=getattr(
+                settings,
+                'FIAS_LATENCY_TARGET_SECONDS',
+                None,
+            ),
+        ),
+        breaker=CircuitBreaker(
+            name='fias',
+            failure_threshold=getattr(
+                settings,
+                'FIAS_BREAKER_FAILURE_THRESHOLD',
+                5,
+            ),
+            reset_timeout_seconds=getattr(
+                settings,
+                'FIAS_BREAKER_RESET_SECONDS',
+                30.0,
+            ),
+            half_open_max_calls=getattr(
+                settings,
+                'FIAS_BREAKER_HALF_OPEN_MAX_CALLS',
+                1,
+            ),
+        ),
+    )
+
+    cache_mode = getattr(settings, 'FIAS_CACHE_MODE', 'none')
+    if cache_mode not in ('memory', 'redis'):
+        return client
+
+    return CachedFiasClient(
+        inner=client,
+        cache=_get_cache(settings, cache_mode),
+        ttl_seconds=getattr(settings, 'FIAS_CACHE_TTL_SECONDS', 86400),
     )
+
+
+def _get_cache(settings: Settings, cache_mode: str) -> FiasCachePort:
+    """Вернуть общий для процесса кэш нормализованных адресов."""
+
+    global _cache, _cache_redis
+    if _cache is not None:
+        return _cache
+
+    max_items = getattr(settings, 'FIAS_CACHE_MAX_ITEMS', 20_000)
+    if cache_mode == 'redis':
+        redis_url = getattr(settings, 'FIAS_CACHE_REDIS_URL', None)
+        if not redis_url:
+            raise ValueError(
+                'FIAS_CACHE_REDIS_URL is required for redis cache mode.'
+            )
+
+        from redis.asyncio import Redis
+
+        from shared.infra.json_cache import RedisJsonCache
+
+        _cache_redis = Redis.from_url(redis_url)
+        _cache = RedisJsonCache(
+            _cache_redis,
+            max_items=max_items,
+            prefix='flaffy:fias:',
+        )
+
+    else:
+        from shared.infra.json_cache import InMemoryJsonCache
+
+        _cache = InMemoryJsonCache(max_items=max_items)
+
+    return _cache
+
+
+async def shutdown_fias_cache() -> None:
+    """Закрыть подключение к Redis и сбросить общий кэш."""
+
+    global _cache, _cache_redis
+    _cache = None
+    if _cache_redis is None:
+        return
+
+    client = _cache_redis
+    _cache_redis = None
+    await client.aclose()
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from shared.kernel.negative_cache_factory import build_negative_cache_policy
 from shared.kernel.settings import Settings
+from sources.gis_gkh.cache.ports import GisGkhHouseCachePort
 from sources.gis_gkh.ports import GisGkhClientPort
 from sources.gis_gkh.stub_client import StubGisGkhClient
 
+_house_cache: GisGkhHouseCachePort | None = None
+_house_cache_redis: Any | None = None
+
 
 def build_gis_gkh_client(settings: Settings) -> GisGkhClientPort:
     """Построить клиента GIS ЖКХ в зависимости от настроек."""
@@ -13,10 +20,80 @@ def build_gis_gkh_client(settings: Settings) -> GisGkhClientPort:
     if settings.GIS_GKH_MODE == 'playwright':
         from sources.gis_gkh.playwright_client import PlaywrightGisGkhClient
 
-        return PlaywrightGisGkhClient(
+        client: GisGkhClientPort = PlaywrightGisGkhClient(
             timeout_seconds=settings.GIS_GKH_TIMEOUT_SECONDS,
             headless=settings.GIS_GKH_HEADLESS,
             ssl_verify=settings.GIS_GKH_SSL_VERIFY,
+            pool_size=getattr(settings, 'GIS_GKH_POOL_SIZE', 2),
+            max_requests_per_context=getattr(
+                settings,
+                'GIS_GKH_CONTEXT_MAX_REQUESTS',
+                200,
+            ),
+            settle_ms=getattr(settings, 'GIS_GKH_SETTLE_MS', 1200),
+            direct_http=getattr(settings, 'GIS_GKH_DIRECT_HTTP', True),
+        )
+        policy = build_negative_cache_policy(settings)
+        if policy is None:
+            return client
+
+        from sources.gis_gkh.cached_client import CachedGisGkhClient
+
+        return CachedGisGkhClient(
+            inner=client,
+            policy=policy,
+            max_items=getattr(settings, 'NEGATIVE_CACHE_MAX_ITEMS', 4096),
         )
 
     return StubGisGkhClient()
+
+
+def get_gis_gkh_house_cache(settings: Settings) -> GisGkhHouseCachePort | None:
+    """Вернуть общий для процесса кэш домов GIS ЖКХ."""
+
+    global _house_cache, _house_cache_redis
+    cache_mode = getattr(settings, 'GIS_GKH_CACHE_MODE', 'none')
+    if cache_mode not in ('memory', 'redis'):
+        return None
+
+    if _house_cache is not None:
+        return _house_cache
+
+    max_items = getattr(settings, 'GIS_GKH_CACHE_MAX_ITEMS', 10_000)
+    if cache_mode == 'redis':
+        redis_url = getattr(settings, 'GIS_GKH_CACHE_REDIS_URL', None)
+        if not redis_url:
+            raise ValueError(
+                'GIS_GKH_CACHE_REDIS_URL is required for redis cache mode.'
+            )
+
+        from redis.asyncio import Redis
+
+        from shared.infra.json_cache import RedisJsonCache
+
+        _house_cache_redis = Redis.from_url(redis_url)
+        _house_cache = RedisJsonCache(
+            _house_cache_redis,
+            max_items=max_items,
+            prefix='flaffy:gis-gkh:',
+        )
+
+    else:
+        from shared.infra.json_cache import InMemoryJsonCache
+
+        _house_cache = InMemoryJsonCache(max_items=max_items)
+
+    return _house_cache
+
+
+async def shutdown_gis_gkh_house_cache() -> None:
+    """Закрыть подключение к Redis и сбросить общий кэш домов."""
+
+    global _house_cache, _house_cache_redis
+    _house_cache = None
+    if _house_cache_redis is None:
+        return
+
+    client = _house_cache_redis
+    _house_cache_redis = None
+    await client.aclose()
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import inspect
+
+from shared.kernel.negative_cache_factory import build_negative_cache_policy
 from shared.kernel.settings import Settings
 from sources.kad_arbitr.cache import LruTtlCache
 from sources.kad_arbitr.ports import KadArbitrClientPort
 from sources.kad_arbitr.stub_client import StubKadArbitrClient
 
 _KAD_ARBITR_CACHE: LruTtlCache | None = None
+_KAD_ARBITR_CLIENT: KadArbitrClientPort | None = None
 
 
 def build_kad_arbitr_client(
@@ -32,6 +36,11 @@ def build_kad_arbitr_client(
                 _KAD_ARBITR_CACHE = LruTtlCache(
                     max_items=settings.KAD_ARBITR_CACHE_MAX_ITEMS,
                     ttl_seconds=settings.KAD_ARBITR_CACHE_TTL_SECONDS,
+                    max_bytes=getattr(
+                        settings,
+                        'KAD_ARBITR_CACHE_MAX_BYTES',
+                        None,
+                    ),
                 )
             cache = _KAD_ARBITR_CACHE
 
@@ -42,9 +51,41 @@ def build_kad_arbitr_client(
             user_agent=settings.KAD_ARBITR_USER_AGENT,
             rate_limiter=rate_limiter,
             cache=cache,
+            negative_cache_policy=build_negative_cache_policy(settings),
+            warmup_ttl_seconds=getattr(
+                settings,
+                'KAD_ARBITR_WARMUP_TTL_SECONDS',
+                None,
+            ),
         )
 
     if mode == 'stub':
         return StubKadArbitrClient()
 
     raise ValueError('KAD_ARBITR_MODE must be one of: stub, xhr.')
+
+
+def get_kad_arbitr_client(*, settings: Settings) -> KadArbitrClientPort:
+    """Вернуть общий для процесса клиент kad.arbitr.ru."""
+
+    global _KAD_ARBITR_CLIENT
+    if _KAD_ARBITR_CLIENT is None:
+        _KAD_ARBITR_CLIENT = build_kad_arbitr_client(settings=settings)
+
+    return _KAD_ARBITR_CLIENT
+
+
+async def shutdown_kad_arbitr_client() -> None:
+    """Закрыть общий клиент kad.arbitr.ru и сбросить singleton."""
+
+    global _KAD_ARBITR_CLIENT
+    if _KAD_ARBITR_CLIENT is None:
+        return
+
+    client = _KAD_ARBITR_CLIENT
+    _KAD_ARBITR_CLIENT = None
+    close_method = getattr(client, 'close', None)
+    if callable(close_method):
+        result = close_method()
+        if inspect.isawaitable(result):
+            await result
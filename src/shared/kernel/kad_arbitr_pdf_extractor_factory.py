@@ -0,0 +1,55 @@
+"""Фабрика извлекателя текста PDF kad.arbitr.ru."""
+
+from __future__ import annotations
+
+from shared.kernel.settings import Settings
+from sources.kad_arbitr.pdf.ports import (
+    AsyncPdfTextExtractorPort,
+    PdfTextExtractorPort,
+)
+from sources.kad_arbitr.pdf.process_pool_extractor import (
+    ProcessPoolPdfTextExtractor,
+)
+from sources.kad_arbitr.pdf.text_extractors import (
+    CompositePdfTextExtractor,
+    PdfMinerTextExtractor,
+    PyPdfTextExtractor,
+)
+
+_process_pool_extractor: ProcessPoolPdfTextExtractor | None = None
+
+
+def get_kad_arbitr_pdf_text_extractor(
+    settings: Settings,
+) -> PdfTextExtractorPort | AsyncPdfTextExtractorPort:
+    """Вернуть извлекатель текста PDF согласно настройкам."""
+
+    workers = getattr(settings, 'KAD_ARBITR_PDF_WORKERS', 0)
+    max_pages = getattr(settings, 'KAD_ARBITR_PDF_MAX_PAGES', None)
+    if workers <= 0:
+        return CompositePdfTextExtractor(
+            primary=PyPdfTextExtractor(max_pages=max_pages),
+            fallback=PdfMinerTextExtractor(max_pages=max_pages),
+        )
+
+    global _process_pool_extractor
+    if _process_pool_extractor is None:
+        _process_pool_extractor = ProcessPoolPdfTextExtractor(
+            max_workers=workers,
+            timeout_seconds=settings.KAD_ARBITR_PDF_TIMEOUT_SECONDS,
+            max_pages=max_pages,
+            max_queue_depth=settings.KAD_ARBITR_PDF_MAX_QUEUE_DEPTH,
+        )
+
+    return _process_pool_extractor
+
+
+def shutdown_kad_arbitr_pdf_text_extractor() -> None:
+    """Остановить общий пул процессов разбора PDF."""
+
+    global _process_pool_extractor
+    if _process_pool_extractor is None:
+        return
+
+    _process_pool_extractor.shutdown()
+    _process_pool_extractor = None
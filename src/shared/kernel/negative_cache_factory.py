@@ -0,0 +1,39 @@
+"""Фабрика политики кэширования отрицательных ответов источников."""
+
+from __future__ import annotations
+
+from shared.infra.negative_cache import NegativeCachePolicy
+from shared.kernel.settings import Settings
+
+
+def build_negative_cache_policy(
+    settings: Settings,
+) -> NegativeCachePolicy | None:
+    """Построить политику из настроек или None, если она выключена."""
+
+    if not getattr(settings, 'NEGATIVE_CACHE_ENABLED', True):
+        return None
+
+    defaults = NegativeCachePolicy()
+    return NegativeCachePolicy(
+        not_found_ttl_seconds=getattr(
+            settings,
+            'NEGATIVE_CACHE_NOT_FOUND_TTL_SECONDS',
+            defaults.not_found_ttl_seconds,
+        ),
+        blocked_ttl_seconds=getattr(
+            settings,
+            'NEGATIVE_CACHE_BLOCKED_TTL_SECONDS',
+            defaults.blocked_ttl_seconds,
+        ),
+        upstream_error_ttl_seconds=getattr(
+            settings,
+            'NEGATIVE_CACHE_UPSTREAM_ERROR_TTL_SECONDS',
+            defaults.upstream_error_ttl_seconds,
+        ),
+        jitter_ratio=getattr(
+            settings,
+            'NEGATIVE_CACHE_JITTER_RATIO',
+            defaults.jitter_ratio,
+        ),
+    )
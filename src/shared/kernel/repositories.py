@@ -11,6 +11,10 @@ from checks.infrastructure.check_cache_repo_db import CheckCacheRepoDb
 from checks.infrastructure.check_cache_repo_inmemory import (
     InMemoryCheckCacheRepo,
 )
+from checks.infrastructure.check_cache_tiered import (
+    TieredCheckCacheRepo,
+    TieredCheckResultsRepo,
+)
 from checks.infrastructure.check_results_repo_db import CheckResultsRepoDb
 from checks.infrastructure.check_results_repo_inmemory import (
     InMemoryCheckResultsRepo,
@@ -80,9 +84,14 @@ def _build_check_results_repo(
     if settings.STORAGE_MODE == 'memory':
         return InMemoryCheckResultsRepo()
 
-    return CheckResultsRepoDb(
+    repo = CheckResultsRepoDb(
         session_factory=session_factory or _require_session_factory(),
     )
+    local_max_items = getattr(settings, 'CHECK_CACHE_LOCAL_MAX_ITEMS', 0)
+    if local_max_items <= 0:
+        return repo
+
+    return TieredCheckResultsRepo(repo, max_items=local_max_items)
 
 
 def _build_check_cache_repo(
@@ -94,11 +103,22 @@ def _build_check_cache_repo(
             ttl_seconds=settings.CHECK_CACHE_TTL_SECONDS,
         )
 
-    return CheckCacheRepoDb(
+    repo = CheckCacheRepoDb(
         session_factory=session_factory or _require_session_factory(),
         ttl_seconds=settings.CHECK_CACHE_TTL_SECONDS,
         cache_version=settings.CHECK_CACHE_VERSION,
     )
+    local_max_items = getattr(settings, 'CHECK_CACHE_LOCAL_MAX_ITEMS', 0)
+    local_ttl = getattr(settings, 'CHECK_CACHE_LOCAL_TTL_SECONDS', 0)
+    if local_max_items <= 0 or local_ttl <= 0:
+        return repo
+
+    return TieredCheckCacheRepo(
+        repo,
+        max_items=local_max_items,
+        ttl_seconds=min(local_ttl, settings.CHECK_CACHE_TTL_SECONDS),
+        cache_version=settings.CHECK_CACHE_VERSION,
+    )
 
 
 def _build_reports_repo(
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from shared.kernel.negative_cache_factory import build_negative_cache_policy
 from shared.kernel.settings import Settings
 from sources.rosreestr.api_cloud_client import ApiCloudRosreestrClient
 from sources.rosreestr.cache.in_memory import InMemoryTtlRosreestrCache
+from sources.rosreestr.cache.ports import RosreestrCachePort
 from sources.rosreestr.cached_client import CachedRosreestrClient
 from sources.rosreestr.ports import RosreestrClientPort
 from sources.rosreestr.stub_client import StubRosreestrClient
 
-_cache: InMemoryTtlRosreestrCache | None = None
+_cache: RosreestrCachePort | None = None
+_cache_redis: Any | None = None
 
 
 def build_rosreestr_client(settings: Settings) -> RosreestrClientPort:
@@ -22,19 +27,70 @@ def build_rosreestr_client(settings: Settings) -> RosreestrClientPort:
         client: RosreestrClientPort = ApiCloudRosreestrClient(
             token=settings.ROSREESTR_TOKEN,
             timeout_seconds=settings.ROSREESTR_TIMEOUT_SECONDS,
+            deadline_seconds=getattr(
+                settings,
+                'ROSREESTR_DEADLINE_SECONDS',
+                None,
+            ),
+            retries=getattr(settings, 'ROSREESTR_RETRIES', 2),
+            retry_backoff_seconds=getattr(
+                settings,
+                'ROSREESTR_RETRY_BACKOFF_SECONDS',
+                0.5,
+            ),
+            max_connections=getattr(settings, 'ROSREESTR_MAX_CONNECTIONS', 10),
         )
 
     else:
         client = StubRosreestrClient()
 
-    if cache_mode == 'memory':
-        global _cache
-        if _cache is None:
-            _cache = InMemoryTtlRosreestrCache()
+    if cache_mode in ('memory', 'redis'):
         client = CachedRosreestrClient(
             inner=client,
-            cache=_cache,
+            cache=_get_cache(settings, cache_mode),
             ttl_seconds=cache_ttl,
+            negative_policy=build_negative_cache_policy(settings),
         )
 
     return client
+
+
+def _get_cache(settings: Settings, cache_mode: str) -> RosreestrCachePort:
+    """Вернуть общий для процесса кэш ответов Росреестра."""
+
+    global _cache, _cache_redis
+    if _cache is not None:
+        return _cache
+
+    max_items = getattr(settings, 'ROSREESTR_CACHE_MAX_ITEMS', 10_000)
+    if cache_mode == 'redis':
+        redis_url = getattr(settings, 'ROSREESTR_CACHE_REDIS_URL', None)
+        if not redis_url:
+            raise ValueError(
+                'ROSREESTR_CACHE_REDIS_URL is required for redis cache mode.'
+            )
+
+        from redis.asyncio import Redis
+
+        from sources.rosreestr.cache.redis_cache import RedisRosreestrCache
+
+        _cache_redis = Redis.from_url(redis_url)
+        _cache = RedisRosreestrCache(_cache_redis, max_items=max_items)
+
+    else:
+        _cache = InMemoryTtlRosreestrCache(max_items=max_items)
+
+    return _cache
+
+
+async def shutdown_rosreestr_cache() -> None:
+    """Закрыть подключение к Redis и сбросить общий кэш."""
+
+    global _cache, _cache_redis
+    _cache = None
+    if _cache_redis is None:
+        return
+
+    client = _cache_redis
+    _cache_redis = None
+    await client.aclose()
@@ -44,16 +44,48 @@ class Settings(BaseSettings):
     FIAS_RETRIES: int = 2
     FIAS_RETRY_BACKOFF_SECONDS: float = 0.5
     FIAS_CONCURRENCY_LIMIT: int = 5
+    FIAS_MIN_CONCURRENCY: int = 1
+    FIAS_LATENCY_TARGET_SECONDS: float = 2.0
+    FIAS_BREAKER_FAILURE_THRESHOLD: int = 5
+    FIAS_BREAKER_RESET_SECONDS: float = 30.0
+    FIAS_BREAKER_HALF_OPEN_MAX_CALLS: int = 1
     FIAS_SUGGEST_ENDPOINT: str = '/api/spas/v2.0/SearchAddressItem'
+    FIAS_CACHE_MODE: Literal['none', 'memory', 'redis'] = 'memory'
+    FIAS_CACHE_TTL_SECONDS: int = 86400
+    FIAS_CACHE_MAX_ITEMS: int = 20000
+    FIAS_CACHE_REDIS_URL: str | None = None
     ROSREESTR_MODE: Literal['stub', 'api_cloud'] = 'stub'
     ROSREESTR_TOKEN: str | None = None
     ROSREESTR_TIMEOUT_SECONDS: int = 120
-    ROSREESTR_CACHE_MODE: Literal['none', 'memory'] = 'memory'
+    ROSREESTR_RETRIES: int = 2
+    ROSREESTR_RETRY_BACKOFF_SECONDS: float = 0.5
+    ROSREESTR_MAX_CONNECTIONS: int = 10
+    ROSREESTR_CACHE_MODE: Literal['none', 'memory', 'redis'] = 'memory'
     ROSREESTR_CACHE_TTL_SECONDS: int = 86400
+    ROSREESTR_CACHE_MAX_ITEMS: int = 10000
+    ROSREESTR_CACHE_REDIS_URL: str | None = None
+    ROSREESTR_DEADLINE_SECONDS: float = 30.0
+    NEGATIVE_CACHE_ENABLED: bool = True
+    NEGATIVE_CACHE_NOT_FOUND_TTL_SECONDS: float = 600.0
+    NEGATIVE_CACHE_BLOCKED_TTL_SECONDS: float = 120.0
+    NEGATIVE_CACHE_UPSTREAM_ERROR_TTL_SECONDS: float = 30.0
+    NEGATIVE_CACHE_JITTER_RATIO: float = 0.2
+    NEGATIVE_CACHE_MAX_ITEMS: int = 4096
     GIS_GKH_MODE: Literal['stub', 'playwright'] = 'stub'
     GIS_GKH_TIMEOUT_SECONDS: int = 60
     GIS_GKH_HEADLESS: bool = True
     GIS_GKH_SSL_VERIFY: bool = True
+    GIS_GKH_DEADLINE_SECONDS: float = 45.0
+    GIS_GKH_POOL_SIZE: int = 2
+    GIS_GKH_CONTEXT_MAX_REQUESTS: int = 200
+    GIS_GKH_SETTLE_MS: int = 1200
+    GIS_GKH_PREWARM: bool = True
+    GIS_GKH_DIRECT_HTTP: bool = True
+    GIS_GKH_CACHE_MODE: Literal['none', 'memory', 'redis'] = 'memory'
+    GIS_GKH_CACHE_TTL_SECONDS: int = 259200
+    GIS_GKH_CACHE_STALE_SECONDS: int = 86400
+    GIS_GKH_CACHE_MAX_ITEMS: int = 10000
+    GIS_GKH_CACHE_REDIS_URL: str | None = None
     KAD_ARBITR_MODE: str = 'stub'
     KAD_ARBITR_BASE_URL: str = 'https://kad.arbitr.ru'
     KAD_ARBITR_TIMEOUT_SECONDS: int = 30
@@ -61,13 +93,30 @@ class Settings(BaseSettings):
     KAD_ARBITR_USER_AGENT: str | None = None
     KAD_ARBITR_MAX_PAGES: int = 2
     KAD_ARBITR_MAX_CASES_TO_ENRICH: int = 20
+    KAD_ARBITR_ENRICH_CONCURRENCY: int = 4
     KAD_ARBITR_MAX_DOCS_TO_PARSE_PER_CASE: int = 1
     KAD_ARBITR_RATE_LIMIT_SECONDS: float = 0.4
+    KAD_ARBITR_WARMUP_TTL_SECONDS: int = 1800
     KAD_ARBITR_CACHE_ENABLED: bool = True
     KAD_ARBITR_CACHE_MAX_ITEMS: int = 256
     KAD_ARBITR_CACHE_TTL_SECONDS: int = 900
+    KAD_ARBITR_CACHE_MAX_BYTES: int = 0
+    KAD_ARBITR_DEADLINE_SECONDS: float = 60.0
+    KAD_ARBITR_PDF_WORKERS: int = 2
+    KAD_ARBITR_PDF_TIMEOUT_SECONDS: float = 20.0
+    KAD_ARBITR_PDF_MAX_PAGES: int = 50
+    KAD_ARBITR_PDF_MAX_QUEUE_DEPTH: int = 8
+    LISTING_CACHE_ENABLED: bool = True
+    LISTING_CACHE_TTL_SECONDS: int = 900
+    LISTING_CACHE_MAX_ITEMS: int = 4096
     CHECK_CACHE_TTL_SECONDS: int = 600
     CHECK_CACHE_VERSION: str = 'v1'
+    CHECK_CACHE_LOCAL_MAX_ITEMS: int = 1024
+    CHECK_CACHE_LOCAL_TTL_SECONDS: int = 60
+    CHECK_SINGLE_FLIGHT_ENABLED: bool = True
+    CHECK_LOCK_REDIS_URL: str | None = None
+    CHECK_LOCK_TIMEOUT_SECONDS: float = 120.0
+    CHECK_LOCK_WAIT_SECONDS: float = 60.0
     STORAGE_MODE: StorageMode = 'db'
 
     @property
@@ -138,6 +187,29 @@ class Settings(BaseSettings):
         if self.STORAGE_MODE == 'db' and not self.DB_DSN:
             raise ValueError('DB_DSN is required when STORAGE_MODE=db.')
 
+        if self.FIAS_CACHE_MODE == 'redis' and not self.FIAS_CACHE_REDIS_URL:
+            raise ValueError(
+                'FIAS_CACHE_REDIS_URL is required when FIAS_CACHE_MODE=redis.',
+            )
+
+        if (
+            self.ROSREESTR_CACHE_MODE == 'redis'
+            and not self.ROSREESTR_CACHE_REDIS_URL
+        ):
+            raise ValueError(
+                'ROSREESTR_CACHE_REDIS_URL is required '
+                'when ROSREESTR_CACHE_MODE=redis.',
+            )
+
+        if (
+            self.GIS_GKH_CACHE_MODE == 'redis'
+            and not self.GIS_GKH_CACHE_REDIS_URL
+        ):
+            raise ValueError(
+                'GIS_GKH_CACHE_REDIS_URL is required '
+                'when GIS_GKH_CACHE_MODE=redis.',
+            )
+
         return self
 
 
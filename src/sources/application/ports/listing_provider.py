@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Protocol
 
 from sources.domain.entities import ListingNormalized, ListingSnapshotRaw
-from sources.domain.value_objects import ListingUrl
+from sources.domain.value_objects import ListingId, ListingUrl
 
 
 class ListingProviderPort(Protocol):
@@ -16,7 +16,12 @@ class ListingProviderPort(Protocol):
 
         raise NotImplementedError
 
-    def fetch_snapshot(self, url: ListingUrl) -> ListingSnapshotRaw:
+    def canonical_key(self, url: ListingUrl) -> tuple[str, ListingId] | None:
+        """Вернуть (источник, id объявления), если id виден из URL."""
+
+        return None
+
+    async def fetch_snapshot(self, url: ListingUrl) -> ListingSnapshotRaw:
         """Загрузить RAW HTML объявления."""
 
         raise NotImplementedError
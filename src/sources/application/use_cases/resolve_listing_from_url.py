@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
+from shared.infra.ttl_cache import TtlCache
 from sources.application.ports import ListingProviderPort
 from sources.domain.entities import ListingNormalized
 from sources.domain.exceptions import ListingNotSupportedError
@@ -11,25 +12,60 @@ from sources.domain.value_objects import ListingUrl
 
 
 class ResolveListingFromUrlUseCase:
-    """Выбирает подходящего провайдера и нормализует листинг."""
+    """Выбирает подходящего провайдера и нормализует листинг.
 
-    __slots__ = ('_providers',)
+    С кэшем результат хранится под ключом (источник, id объявления из
+    URL), поэтому варианты одной ссылки с разными хостами и query не
+    загружают страницу повторно. Ссылки без id в пути не кэшируются.
+    """
+
+    __slots__ = ('_providers', '_cache')
 
     def __init__(
         self,
         providers: Sequence[ListingProviderPort],
+        *,
+        cache: TtlCache | None = None,
     ) -> None:
-        """Сохранить доступных провайдеров."""
+        """Сохранить доступных провайдеров и кэш листингов."""
 
         self._providers = tuple(providers)
+        self._cache = cache
+
+    def canonical_key(self, url_text: str) -> str | None:
+        """Вернуть ключ «источник:id» для URL или None."""
+
+        try:
+            url = ListingUrl(url_text)
+        except ValueError:
+            return None
+
+        for provider in self._providers:
+            if provider.is_supported(url):
+                key = provider.canonical_key(url)
+                if key is not None:
+                    source, listing_id = key
+                    return f'{source}:{listing_id.value}'
+                return None
 
-    def execute(self, url_text: str) -> ListingNormalized:
+        return None
+
+    async def execute(self, url_text: str) -> ListingNormalized:
         """Вернуть нормализованный листинг для URL."""
 
         url = ListingUrl(url_text)
         provider = self._resolve_provider(url)
-        snapshot = provider.fetch_snapshot(url)
-        return provider.normalize(snapshot)
+        key = provider.canonical_key(url) if self._cache is not None else None
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        snapshot = await provider.fetch_snapshot(url)
+        listing = provider.normalize(snapshot)
+        if key is not None:
+            self._cache.set(key, listing)
+        return listing
 
     def _resolve_provider(self, url: ListingUrl) -> ListingProviderPort:
         """Найти провайдера, который поддерживает URL."""
@@ -10,12 +10,17 @@ from sources.domain.value_objects import ListingUrl
 
 @dataclass(slots=True)
 class ListingSnapshotRaw:
-    """Снимок объявления на этапе загрузки HTML."""
+    """Снимок объявления на этапе загрузки HTML.
+
+    Провайдер, извлёкший состояние страницы при загрузке, кладёт его в
+    preloaded_state и может не хранить HTML.
+    """
 
     source: str
     url: ListingUrl
     fetched_at: datetime
-    raw_html: str
+    raw_html: str = ''
+    preloaded_state: bytes | None = None
 
     def __post_init__(self) -> None:
         """Убедиться, что время UTC-aware."""
@@ -0,0 +1 @@
+"""Пакет кэша GIS ЖКХ."""
@@ -0,0 +1,21 @@
+"""Порты кэша GIS ЖКХ."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class GisGkhHouseCachePort(Protocol):
+    """Кэш найденных домов GIS ЖКХ."""
+
+    async def get(self, *, key: str) -> dict[str, object] | None:
+        """Получить значение по ключу."""
+
+    async def set(
+        self,
+        *,
+        key: str,
+        value: dict[str, object],
+        ttl_seconds: int,
+    ) -> None:
+        """Сохранить значение с TTL."""
@@ -0,0 +1,111 @@
+"""Декоратор клиента GIS ЖКХ с кэшем отрицательных ответов."""
+
+from __future__ import annotations
+
+import inspect
+
+from shared.infra.negative_cache import (
+    BLOCKED,
+    NOT_FOUND,
+    UPSTREAM_ERROR,
+    NegativeCacheEntry,
+    NegativeCachePolicy,
+    NegativeOutcome,
+)
+from shared.infra.ttl_cache import TtlCache
+from sources.gis_gkh.exceptions import (
+    GisGkhBadResponseError,
+    GisGkhBlockedError,
+    GisGkhError,
+)
+from sources.gis_gkh.models import GisGkhHouseNormalized
+from sources.gis_gkh.ports import GisGkhClientPort
+
+
+class CachedGisGkhClient(GisGkhClientPort):
+    """Запоминает пустые ответы и ошибки GIS ЖКХ на короткий TTL."""
+
+    __slots__ = ('_inner', '_cache', '_policy')
+
+    def __init__(
+        self,
+        *,
+        inner: GisGkhClientPort,
+        policy: NegativeCachePolicy,
+        max_items: int,
+        cache: TtlCache | None = None,
+    ) -> None:
+        """Сохранить зависимости."""
+
+        self._inner = inner
+        self._policy = policy
+        self._cache = cache or TtlCache(max_items=max_items, ttl_seconds=0)
+
+    @property
+    def inner(self) -> GisGkhClientPort:
+        """Вернуть обёрнутый клиент."""
+
+        return self._inner
+
+    async def search_by_cadnum(
+        self,
+        *,
+        cadnum: str,
+        region_code: str,
+    ) -> list[GisGkhHouseNormalized]:
+        """Найти дома, не повторяя недавние отрицательные запросы."""
+
+        key = ('search', cadnum, region_code)
+        cached = self._cache.get(key)
+        if isinstance(cached, NegativeCacheEntry):
+            if cached.outcome == NOT_FOUND:
+                return []
+            if cached.outcome == BLOCKED:
+                raise GisGkhBlockedError(f'cached: {cached.detail}')
+            raise GisGkhBadResponseError(f'cached: {cached.detail}')
+
+        try:
+            result = await self._inner.search_by_cadnum(
+                cadnum=cadnum,
+                region_code=region_code,
+            )
+        except GisGkhBlockedError as exc:
+            self._remember(key, BLOCKED, str(exc))
+            raise
+        except GisGkhError as exc:
+            self._remember(key, UPSTREAM_ERROR, str(exc))
+            raise
+
+        if not result:
+            self._remember(key, NOT_FOUND, None)
+        return result
+
+    async def warmup(self) -> None:
+        """Прогреть вложенный клиент."""
+
+        warmup_method = getattr(self._inner, 'warmup', None)
+        if callable(warmup_method):
+            await warmup_method()
+
+    async def close(self) -> None:
+        """Закрыть вложенный клиент."""
+
+        close_method = getattr(self._inner, 'close', None)
+        if callable(close_method):
+            result = close_method()
+            if inspect.isawaitable(result):
+                await result
+
+    def _remember(
+        self,
+        key: tuple[str, str, str],
+        outcome: NegativeOutcome,
+        detail: str | None,
+    ) -> None:
+        """Запомнить отрицательный исход с TTL из политики."""
+
+        self._cache.set(
+            key,
+            NegativeCacheEntry(outcome=outcome, detail=detail),
+            ttl_seconds=self._policy.ttl_for(outcome),
+        )
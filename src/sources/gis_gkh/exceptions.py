@@ -9,3 +9,7 @@ class GisGkhError(Exception):
 
 class GisGkhBadResponseError(GisGkhError):
     """Некорректный ответ GIS ЖКХ."""
+
+
+class GisGkhBlockedError(GisGkhBadResponseError):
+    """GIS ЖКХ не пропустил запрос через антибот-защиту."""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any
 
 
@@ -115,3 +115,12 @@ class GisGkhHouseNormalized:
                 _get_first('condition', 'houseConditionName'),
             ),
         )
+
+    def to_cache_dict(self) -> dict[str, object]:
+        """Сериализовать модель для кэша без пустых полей."""
+
+        return {
+            key: value
+            for key, value in asdict(self).items()
+            if value is not None
+        }
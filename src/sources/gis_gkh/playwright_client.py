@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
 from typing import Any
 
+import httpx
 from playwright.async_api import (
     Browser,
     BrowserContext,
@@ -22,10 +28,16 @@ from sources.gis_gkh.consts import (
     HOUSES_PUBLIC_ENDPOINT,
     REGION_GUID_MAP,
 )
-from sources.gis_gkh.exceptions import GisGkhBadResponseError, GisGkhError
+from sources.gis_gkh.exceptions import (
+    GisGkhBadResponseError,
+    GisGkhBlockedError,
+    GisGkhError,
+)
 from sources.gis_gkh.models import GisGkhHouseNormalized
 from sources.gis_gkh.ports import GisGkhClientPort
 
+logger = logging.getLogger(__name__)
+
 _DEFAULT_USER_AGENT = (
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
     'AppleWebKit/537.36 (KHTML, like Gecko) '
@@ -33,8 +45,27 @@ _DEFAULT_USER_AGENT = (
 )
 
 
+@dataclass(slots=True, eq=False)
+class _ContextSlot:
+    """Браузерный контекст пула со счётчиком запросов."""
+
+    context: BrowserContext | None = None
+    page: Page | None = None
+    session_guid: str = field(default_factory=lambda: str(uuid.uuid4()))
+    requests: int = 0
+    stale: bool = True
+    cookie_header: str | None = None
+
+
 class PlaywrightGisGkhClient(GisGkhClientPort):
-    """Playwright-клиент для поиска домов в GIS ЖКХ."""
+    """Playwright-клиент для поиска домов в GIS ЖКХ.
+
+    Держит один браузер и пул прогретых контекстов. Запросы получают
+    контекст из очереди по порядку обращения; контекст пересоздаётся
+    после заданного числа запросов, после антибот-челленджа или если
+    перестал отвечать. В режиме direct_http браузер только проходит
+    защиту, а запросы к API идут через httpx с cookies контекста.
+    """
 
     def __init__(
         self,
@@ -43,6 +74,11 @@ class PlaywrightGisGkhClient(GisGkhClientPort):
         headless: bool = True,
         ssl_verify: bool = True,
         user_agent: str | None = None,
+        pool_size: int = 2,
+        max_requests_per_context: int = 200,
+        settle_ms: int = 1200,
+        direct_http: bool = False,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Сконфигурировать клиент."""
 
@@ -50,17 +86,23 @@ class PlaywrightGisGkhClient(GisGkhClientPort):
         self._headless = headless
         self._ssl_verify = ssl_verify
         self._user_agent = user_agent or _DEFAULT_USER_AGENT
+        self._pool_size = max(1, pool_size)
+        self._max_requests = max(1, max_requests_per_context)
+        self._settle_ms = max(0, settle_ms)
+        self._direct_http = direct_http or http_client is not None
+        self._owns_http_client = http_client is None
+        self._http_client = http_client
 
         self._pw: Playwright | None = None
         self._browser: Browser | None = None
-        self._context: BrowserContext | None = None
-        self._page: Page | None = None
-        self._session_guid = str(uuid.uuid4())
+        self._slots: list[_ContextSlot] = []
+        self._pool: asyncio.Queue[_ContextSlot] | None = None
+        self._init_lock = asyncio.Lock()
 
     async def __aenter__(self) -> PlaywrightGisGkhClient:
         """Открыть ресурсы Playwright."""
 
-        await self._init()
+        await self.warmup()
         return self
 
     async def __aexit__(self, exc_type, exc, traceback) -> None:
@@ -68,20 +110,53 @@ class PlaywrightGisGkhClient(GisGkhClientPort):
 
         await self.close()
 
+    async def warmup(self) -> None:
+        """Запустить браузер и прогреть все контексты пула.
+
+        Слоты возвращаются в очередь только после того, как завершились
+        все прогревы. Слот с неудачным прогревом остаётся stale и будет
+        пересоздан при выдаче; первая ошибка пробрасывается.
+        """
+
+        pool = await self._ensure_pool()
+        slots = [pool.get_nowait() for _ in range(pool.qsize())]
+        stale = [slot for slot in slots if slot.stale]
+        try:
+            results = await asyncio.gather(
+                *(self._recycle(slot) for slot in stale),
+                return_exceptions=True,
+            )
+        finally:
+            for slot in slots:
+                pool.put_nowait(slot)
+
+        errors = [item for item in results if isinstance(item, BaseException)]
+        for slot, result in zip(stale, results, strict=True):
+            if isinstance(result, BaseException):
+                slot.stale = True
+                logger.warning(
+                    'gis_gkh_warmup_failed session=%s error=%s',
+                    slot.session_guid,
+                    result.__class__.__name__,
+                )
+        if errors:
+            raise errors[0]
+
     async def close(self) -> None:
         """Закрыть браузерные ресурсы."""
 
         try:
-            if self._page:
-                await self._page.close()
-            if self._context:
-                await self._context.close()
+            for slot in self._slots:
+                await self._close_slot(slot)
             if self._browser:
                 await self._browser.close()
         finally:
-            self._page = None
-            self._context = None
+            self._slots = []
+            self._pool = None
             self._browser = None
+            if self._http_client is not None and self._owns_http_client:
+                await self._http_client.aclose()
+                self._http_client = None
             if self._pw:
                 await self._pw.stop()
                 self._pw = None
@@ -94,7 +169,6 @@ class PlaywrightGisGkhClient(GisGkhClientPort):
     ) -> list[GisGkhHouseNormalized]:
         """Найти дома по кадастровому номеру."""
 
-        await self._init()
         region_guid = self._resolve_region_guid(region_code)
 
         params = {
@@ -109,11 +183,13 @@ class PlaywrightGisGkhClient(GisGkhClientPort):
             'estStatus': None,
         }
 
-        data = await self._api_post_json(
-            HOUSES_PUBLIC_ENDPOINT,
-            params=params,
-            payload=payload,
-        )
+        async with self._checkout() as slot:
+            data = await self._api_post_json(
+                slot,
+                HOUSES_PUBLIC_ENDPOINT,
+                params=params,
+                payload=payload,
+            )
         items = data.get('items')
         if not isinstance(items, list):
             return []
@@ -125,36 +201,114 @@ class PlaywrightGisGkhClient(GisGkhClientPort):
 
         return result
 
-    async def _init(self) -> None:
-        """Инициализировать браузерный контекст."""
+    async def _ensure_pool(self) -> asyncio.Queue[_ContextSlot]:
+        """Запустить браузер и создать очередь контекстов один раз."""
+
+        if self._pool is not None:
+            return self._pool
+
+        async with self._init_lock:
+            if self._pool is None:
+                await self._launch_browser()
+                if self._direct_http and self._http_client is None:
+                    self._http_client = httpx.AsyncClient(
+                        verify=self._ssl_verify,
+                        timeout=self._timeout_seconds,
+                    )
+                self._slots = [_ContextSlot() for _ in range(self._pool_size)]
+                pool: asyncio.Queue[_ContextSlot] = asyncio.Queue()
+                for slot in self._slots:
+                    pool.put_nowait(slot)
+                self._pool = pool
+
+        return self._pool
+
+    @asynccontextmanager
+    async def _checkout(self) -> AsyncIterator[_ContextSlot]:
+        """Выдать здоровый контекст из пула в порядке очереди."""
+
+        pool = await self._ensure_pool()
+        slot = await pool.get()
+        try:
+            if slot.stale or not self._is_healthy(slot):
+                await self._recycle(slot)
+            yield slot
+        finally:
+            slot.requests += 1
+            if slot.requests >= self._max_requests:
+                slot.stale = True
+            pool.put_nowait(slot)
 
-        if self._page is not None:
-            return
+    def _is_healthy(self, slot: _ContextSlot) -> bool:
+        """Проверить, что браузер и страница контекста живы."""
 
-        self._pw = await async_playwright().start()
-        self._browser = await self._pw.chromium.launch(headless=self._headless)
-        self._context = await self._browser.new_context(
+        return (
+            self._browser is not None
+            and self._browser.is_connected()
+            and slot.page is not None
+            and not slot.page.is_closed()
+        )
+
+    async def _recycle(self, slot: _ContextSlot) -> None:
+        """Пересоздать контекст слота и пройти стартовые страницы."""
+
+        slot.stale = True
+        await self._close_slot(slot)
+        if self._browser is None or not self._browser.is_connected():
+            async with self._init_lock:
+                if self._browser is None or not self._browser.is_connected():
+                    await self._launch_browser()
+
+        context = await self._browser.new_context(
             user_agent=self._user_agent,
             viewport={'width': 1280, 'height': 720},
             ignore_https_errors=not self._ssl_verify,
         )
-        self._page = await self._context.new_page()
+        slot.context = context
+        slot.page = await context.new_page()
+        slot.session_guid = str(uuid.uuid4())
 
-        await self._page.goto(
+        await slot.page.goto(
             BASE_LANDING,
             wait_until='domcontentloaded',
             timeout=self._timeout_ms,
         )
-        await self._page.wait_for_timeout(1200)
-        await self._page.goto(
+        await slot.page.wait_for_timeout(self._settle_ms)
+        await slot.page.goto(
             HOUSES_PAGE,
             wait_until='domcontentloaded',
             timeout=self._timeout_ms,
         )
-        await self._page.wait_for_timeout(1200)
+        await slot.page.wait_for_timeout(self._settle_ms)
+        await self._harvest_cookies(slot)
+        slot.requests = 0
+        slot.stale = False
+        logger.debug('gis_gkh_context_ready session=%s', slot.session_guid)
+
+    async def _launch_browser(self) -> None:
+        """Запустить Playwright и браузер, если они ещё не запущены."""
+
+        if self._pw is None:
+            self._pw = await async_playwright().start()
+        self._browser = await self._pw.chromium.launch(headless=self._headless)
+
+    @staticmethod
+    async def _close_slot(slot: _ContextSlot) -> None:
+        """Закрыть контекст слота, не пробрасывая ошибки."""
+
+        context = slot.context
+        slot.context = None
+        slot.page = None
+        slot.cookie_header = None
+        if context is None:
+            return
+
+        with suppress(Exception):
+            await context.close()
 
     async def _api_post_json(
         self,
+        slot: _ContextSlot,
         path: str,
         *,
         params: dict[str, object],
@@ -162,9 +316,6 @@ class PlaywrightGisGkhClient(GisGkhClientPort):
     ) -> dict[str, Any]:
         """Выполнить POST запрос и вернуть JSON."""
 
-        if not self._context:
-            raise GisGkhError('Browser context is not initialized.')
-
         url = f'{BASE_URL}{path}'
         headers = {
             'Accept': 'application/json; charset=utf-8',
@@ -173,58 +324,143 @@ class PlaywrightGisGkhClient(GisGkhClientPort):
             'Referer': BASE_LANDING,
             'X-Requested-With': 'XMLHttpRequest',
             'State-Guid': '/houses',
-            'Session-Guid': self._session_guid,
+            'Session-Guid': slot.session_guid,
             'Request-Guid': str(uuid.uuid4()),
         }
+        body = json.dumps(payload)
+
+        direct = await self._post_direct(slot, url, params, headers, body)
+        if direct is not None:
+            status, text = direct
+            if not self._is_challenge_html(text):
+                return self._parse_json_body(status, text)
+
+            logger.info(
+                'gis_gkh_direct_challenge session=%s', slot.session_guid
+            )
+
+        data = await self._post_via_browser(slot, url, params, headers, body)
+        await self._harvest_cookies(slot)
+        return data
+
+    async def _post_direct(
+        self,
+        slot: _ContextSlot,
+        url: str,
+        params: dict[str, object],
+        headers: dict[str, str],
+        body: str,
+    ) -> tuple[int, str] | None:
+        """Отправить запрос через httpx с cookies браузерного контекста."""
+
+        if self._http_client is None or not slot.cookie_header:
+            return None
+
+        try:
+            response = await self._http_client.post(
+                url,
+                params=params,
+                headers={
+                    **headers,
+                    'Cookie': slot.cookie_header,
+                    'User-Agent': self._user_agent,
+                },
+                content=body,
+            )
+        except httpx.HTTPError as exc:
+            logger.info(
+                'gis_gkh_direct_failed session=%s error=%s',
+                slot.session_guid,
+                exc.__class__.__name__,
+            )
+            return None
+
+        return response.status_code, response.text
+
+    async def _post_via_browser(
+        self,
+        slot: _ContextSlot,
+        url: str,
+        params: dict[str, object],
+        headers: dict[str, str],
+        body: str,
+    ) -> dict[str, Any]:
+        """Отправить запрос из браузерного контекста, проходя защиту."""
+
+        context = slot.context
+        if context is None:
+            raise GisGkhError('Browser context is not initialized.')
 
         last_snippet = None
         for _ in range(3):
-            response = await self._context.request.post(
+            response = await context.request.post(
                 url,
                 params=params,
                 headers=headers,
-                data=json.dumps(payload),
+                data=body,
                 timeout=self._timeout_ms,
             )
-            body = await response.text()
-            if self._is_challenge_html(body):
-                last_snippet = body.lstrip()[:200].replace('\n', ' ')
-                await self._solve_challenge_by_navigation(BASE_LANDING)
+            text = await response.text()
+            if self._is_challenge_html(text):
+                last_snippet = text.lstrip()[:200].replace('\n', ' ')
+                slot.stale = True
+                await self._solve_challenge_by_navigation(context, BASE_LANDING)
                 continue
 
-            if body.lstrip().startswith('<'):
-                snippet = body.lstrip()[:200].replace('\n', ' ')
-                raise GisGkhBadResponseError(
-                    'GIS ЖКХ вернул HTML вместо JSON: '
-                    f'status={response.status} snippet={snippet!r}',
-                )
+            return self._parse_json_body(response.status, text)
 
-            try:
-                data = json.loads(body)
-            except json.JSONDecodeError as exc:
-                snippet = body[:200].replace('\n', ' ')
-                raise GisGkhBadResponseError(
-                    'Не удалось распарсить JSON: '
-                    f'status={response.status} snippet={snippet!r}',
-                ) from exc
+        raise GisGkhBlockedError(
+            'Не удалось пройти защиту GIS ЖКХ. '
+            f'last_snippet={last_snippet!r}',
+        )
 
-            if isinstance(data, dict):
-                return data
+    async def _harvest_cookies(self, slot: _ContextSlot) -> None:
+        """Запомнить cookies контекста для прямых HTTP-запросов."""
 
-            raise GisGkhBadResponseError('Ответ не является JSON-объектом.')
+        if not self._direct_http or slot.context is None:
+            return
 
-        raise GisGkhBadResponseError(
-            'Не удалось пройти защиту GIS ЖКХ. '
-            f'last_snippet={last_snippet!r}',
+        cookies = await slot.context.cookies(BASE_URL)
+        slot.cookie_header = (
+            '; '.join(
+                f'{cookie["name"]}={cookie["value"]}' for cookie in cookies
+            )
+            or None
         )
 
-    async def _solve_challenge_by_navigation(self, url: str) -> None:
-        """Пройти антибот через навигацию на страницу."""
+    @staticmethod
+    def _parse_json_body(status: int, body: str) -> dict[str, Any]:
+        """Разобрать JSON-ответ API."""
 
-        if self._context is None:
-            raise GisGkhError('Browser context is not initialized.')
+        if body.lstrip().startswith('<'):
+            snippet = body.lstrip()[:200].replace('\n', ' ')
+            raise GisGkhBadResponseError(
+                'GIS ЖКХ вернул HTML вместо JSON: '
+                f'status={status} snippet={snippet!r}',
+            )
+
+        try:
+            data = json.loads(body)
+        except json.JSONDecodeError as exc:
+            snippet = body[:200].replace('\n', ' ')
+            raise GisGkhBadResponseError(
+                'Не удалось распарсить JSON: '
+                f'status={status} snippet={snippet!r}',
+            ) from exc
+
+        if isinstance(data, dict):
+            return data
+
+        raise GisGkhBadResponseError('Ответ не является JSON-объектом.')
+
+    @staticmethod
+    async def _solve_challenge_by_navigation(
+        context: BrowserContext,
+        url: str,
+    ) -> None:
+        """Пройти антибот через навигацию на страницу."""
 
-        page = await self._context.new_page()
+        page = await context.new_page()
         try:
             try:
                 await page.goto(url, wait_until='commit', timeout=12_000)
@@ -2,17 +2,37 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 
+from sources.gis_gkh.cache.ports import GisGkhHouseCachePort
 from sources.gis_gkh.models import GisGkhHouseNormalized
 from sources.gis_gkh.ports import GisGkhClientPort
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(slots=True)
 class ResolveGisGkhHouseByCadastralUseCase:
-    """Получить дом из GIS ЖКХ по кадастровому номеру."""
+    """Получить дом из GIS ЖКХ по кадастровому номеру.
+
+    С кэшем запись отдаётся свежей ttl_seconds, затем ещё stale_seconds
+    отдаётся устаревшей, пока дом перечитывается в фоне.
+    """
 
     client: GisGkhClientPort
+    cache: GisGkhHouseCachePort | None = None
+    ttl_seconds: int = 0
+    stale_seconds: int = 0
+    now_fn: Callable[[], float] = time.time
+    _refreshing: dict[str, asyncio.Task[None]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
 
     async def execute(
         self,
@@ -22,8 +42,90 @@ class ResolveGisGkhHouseByCadastralUseCase:
     ) -> GisGkhHouseNormalized | None:
         """Вернуть первый найденный дом или None."""
 
+        if self.cache is None or self.ttl_seconds <= 0:
+            return await self._fetch(cadastral_number, region_code)
+
+        key = f'house:{region_code}:{cadastral_number}'
+        cached = await self.cache.get(key=key)
+        house_data = cached.get('house') if cached else None
+        if isinstance(house_data, dict):
+            fresh_until = cached.get('fresh_until')
+            if (
+                not isinstance(fresh_until, int | float)
+                or fresh_until <= self.now_fn()
+            ):
+                self._schedule_refresh(key, cadastral_number, region_code)
+            return GisGkhHouseNormalized.from_dict(house_data)
+
+        house = await self._fetch(cadastral_number, region_code)
+        if house is not None:
+            await self._store(key, house)
+        return house
+
+    async def close(self) -> None:
+        """Отменить незавершённые фоновые обновления."""
+
+        tasks = list(self._refreshing.values())
+        self._refreshing.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch(
+        self,
+        cadastral_number: str,
+        region_code: str,
+    ) -> GisGkhHouseNormalized | None:
+        """Запросить дом у клиента GIS ЖКХ."""
+
         results = await self.client.search_by_cadnum(
             cadnum=cadastral_number,
             region_code=region_code,
         )
         return results[0] if results else None
+
+    async def _store(self, key: str, house: GisGkhHouseNormalized) -> None:
+        """Сохранить дом со сроком свежести и запасом на устаревание."""
+
+        await self.cache.set(
+            key=key,
+            value={
+                'house': house.to_cache_dict(),
+                'fresh_until': self.now_fn() + self.ttl_seconds,
+            },
+            ttl_seconds=self.ttl_seconds + max(self.stale_seconds, 0),
+        )
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        cadastral_number: str,
+        region_code: str,
+    ) -> None:
+        """Запустить одно фоновое обновление устаревшей записи."""
+
+        if key in self._refreshing:
+            return
+
+        task = asyncio.create_task(
+            self._refresh(key, cadastral_number, region_code),
+        )
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(
+        self,
+        key: str,
+        cadastral_number: str,
+        region_code: str,
+    ) -> None:
+        """Перечитать дом и обновить кэш."""
+
+        try:
+            house = await self._fetch(cadastral_number, region_code)
+        except Exception as exc:
+            logger.info('gis_gkh_refresh_failed key=%s error=%s', key, exc)
+            return
+
+        if house is not None:
+            await self._store(key, house)
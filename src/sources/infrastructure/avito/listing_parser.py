@@ -21,6 +21,22 @@ from sources.infrastructure.avito.constants.parser import (
     TITLE_PATHS,
 )
 
+_FALLBACK_KEYS: dict[str, tuple[str, ...]] = {
+    'listing_id': ('id', 'listingId', 'itemId'),
+    'title': ('title',),
+    'address': ('fullAddress', 'address', 'locationName'),
+    'price': ('price', 'priceValue', 'amount'),
+    'coords': ('coordinates',),
+}
+
+_STATIC_PATHS: dict[str, list[list[str]]] = {
+    'listing_id': LISTING_ID_PATHS,
+    'title': TITLE_PATHS,
+    'address': ADDRESS_PATHS,
+    'price': PRICE_PATHS,
+    'coords': COORDS_PATHS,
+}
+
 
 def parse_avito_listing(
     *,
@@ -29,47 +45,22 @@ def parse_avito_listing(
 ) -> ListingNormalized:
     """Преобразовать preloadedState в ListingNormalized."""
 
-    listing_id_raw = _get_by_paths(preloaded_state, LISTING_ID_PATHS)
-    if listing_id_raw is None:
-        listing_id_raw = _find_value(
-            preloaded_state,
-            ('id', 'listingId', 'itemId'),
-            max_nodes=5000,
-        )
+    values = _extract_fields(preloaded_state)
 
-    listing_id_value = _normalize_listing_id(listing_id_raw)
+    listing_id_value = _normalize_listing_id(values['listing_id'])
     if listing_id_value is None:
         raise ListingParseError('listing_id is missing')
     listing_id = ListingId(listing_id_value)
 
-    title_raw = _get_by_paths(preloaded_state, TITLE_PATHS)
-    if title_raw is None:
-        title_raw = _find_value(preloaded_state, ('title',), max_nodes=5000)
+    title_raw = values['title']
     title = str(title_raw) if title_raw is not None else None
 
-    address_raw = _get_by_paths(preloaded_state, ADDRESS_PATHS)
-    if address_raw is None:
-        address_raw = _find_value(
-            preloaded_state,
-            ('fullAddress', 'address', 'locationName'),
-            max_nodes=5000,
-        )
+    address_raw = values['address']
     address = str(address_raw) if address_raw is not None else None
 
-    price_raw = _get_by_paths(preloaded_state, PRICE_PATHS)
-    if price_raw is None:
-        price_raw = _find_value(
-            preloaded_state,
-            ('price', 'priceValue', 'amount'),
-            max_nodes=5000,
-        )
-    price = _normalize_int(price_raw)
-
-    coords = _get_by_paths(preloaded_state, COORDS_PATHS)
-    if coords is None:
-        coords = _find_value(preloaded_state, ('coordinates',), max_nodes=5000)
+    price = _normalize_int(values['price'])
 
-    coords = coords or {}
+    coords = values['coords'] or {}
     lat = _as_float(
         _find_value(coords, ('latitude', 'lat')),
     )
@@ -94,6 +85,23 @@ def parse_avito_listing(
     )
 
 
+def _extract_fields(data: dict[str, Any]) -> dict[str, Any]:
+    """Собрать все поля: сначала пути, затем один обход дерева."""
+
+    values: dict[str, Any] = {}
+    missing: dict[str, tuple[str, ...]] = {}
+    for field, keys in _FALLBACK_KEYS.items():
+        value = _get_by_paths(data, _STATIC_PATHS[field])
+        if value is None:
+            missing[field] = keys
+        values[field] = value
+
+    if missing:
+        values.update(_find_values(data, missing, max_nodes=5000))
+
+    return values
+
+
 def _get_by_paths(
     data: dict[str, Any],
     paths: list[list[str]],
@@ -120,6 +128,54 @@ def _get_by_paths(
     return None
 
 
+def _find_values(
+    data: Any,
+    wanted: dict[str, tuple[str, ...]],
+    *,
+    max_depth: int = 6,
+    max_nodes: int = 5000,
+) -> dict[str, Any]:
+    """Найти значения нескольких полей за один обход дерева.
+
+    Обход идёт в том же порядке, что у _find_value, и останавливается,
+    как только найдены все поля.
+    """
+
+    pending = dict(wanted)
+    found: dict[str, Any] = {}
+    visited = 0
+
+    def _inner(node: Any, depth: int) -> None:
+        nonlocal visited
+        if depth < 0 or visited >= max_nodes or not pending:
+            return
+
+        visited += 1
+        if isinstance(node, dict):
+            for field, keys in list(pending.items()):
+                for key in keys:
+                    if key in node:
+                        value = node[key]
+                        if value is not None:
+                            found[field] = value
+                            del pending[field]
+                        break
+
+            for value in node.values():
+                if not pending:
+                    return
+                _inner(value, depth - 1)
+
+        elif isinstance(node, list):
+            for item in node:
+                if not pending:
+                    return
+                _inner(item, depth - 1)
+
+    _inner(data, max_depth)
+    return found
+
+
 def _find_value(
     data: Any,
     keys: Iterable[str],
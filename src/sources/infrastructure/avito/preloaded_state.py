@@ -2,62 +2,174 @@
 
 from __future__ import annotations
 
+import re
+
 from sources.domain.exceptions import ListingParseError
 
 MARKER = 'window.__preloadedState__'
 
-
-def extract_preloaded_state_json(html: str) -> str:
-    """Вернуть JSON из window.__preloadedState__."""
-
-    marker_idx = html.find(MARKER)
-    if marker_idx == -1:
-        raise ListingParseError('preloaded state not found')
-
-    eq_idx = html.find('=', marker_idx + len(MARKER))
-    if eq_idx == -1:
-        raise ListingParseError('preloaded state assignment not found')
-
-    brace_idx = html.find('{', eq_idx)
-    if brace_idx == -1:
-        raise ListingParseError('preloaded state json not found')
-
-    return _extract_braced_object(html, brace_idx)
-
-
-def _extract_braced_object(text: str, start_idx: int) -> str:
-    """Извлечь JSON-объект с балансом фигурных скобок."""
-
-    depth = 0
-    in_string = False
-    escaped = False
-
-    for idx in range(start_idx, len(text)):
-        char = text[idx]
-        if in_string:
-            if escaped:
-                escaped = False
+_MARKER_BYTES = MARKER.encode()
+_TOKEN_RE = re.compile(rb'[{}"\\]')
+_STRING_TOKEN_RE = re.compile(rb'["\\]')
+_BACKSLASH = ord('\\')
+_QUOTE = ord('"')
+_OPEN = ord('{')
+_CLOSE = ord('}')
+
+
+class PreloadedStateScanner:
+    """Инкрементально выделяет JSON preloaded state из потока байт.
+
+    До маркера хранится только хвост для поиска на стыке чанков. После
+    открывающей скобки регулярное выражение перепрыгивает к следующей
+    скобке, кавычке или обратному слэшу, так что обычный текст не
+    проходит через Python-цикл.
+    """
+
+    __slots__ = (
+        '_pending',
+        '_seen_marker',
+        '_seen_eq',
+        '_body',
+        '_depth',
+        '_in_string',
+        '_escaped',
+        '_done',
+    )
+
+    def __init__(self) -> None:
+        """Подготовить сканер к первому чанку."""
+
+        self._pending = b''
+        self._seen_marker = False
+        self._seen_eq = False
+        self._body: bytearray | None = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """Скобки сбалансированы и JSON собран целиком."""
+
+        return self._done
+
+    def feed(self, chunk: bytes) -> bool:
+        """Обработать очередной чанк и вернуть True, когда JSON собран."""
+
+        if self._done:
+            return True
+
+        data = self._pending + chunk if self._pending else chunk
+        self._pending = b''
+        if self._body is None:
+            start = self._locate_start(data)
+            if start < 0:
+                return False
+            data = data[start:]
+            self._body = bytearray()
+
+        end = self._scan(data)
+        if end < 0:
+            self._body += data
+            return False
+
+        self._body += data[: end + 1]
+        self._done = True
+        return True
+
+    def result(self) -> bytes:
+        """Вернуть JSON preloaded state."""
+
+        if self._done:
+            return bytes(self._body)
+
+        if not self._seen_marker:
+            raise ListingParseError('preloaded state not found')
+
+        if not self._seen_eq:
+            raise ListingParseError('preloaded state assignment not found')
+
+        if self._body is None:
+            raise ListingParseError('preloaded state json not found')
+
+        raise ListingParseError('unterminated preloaded state json')
+
+    def _locate_start(self, data: bytes) -> int:
+        """Найти открывающую скобку JSON после маркера и знака «=»."""
+
+        pos = 0
+        if not self._seen_marker:
+            idx = data.find(_MARKER_BYTES)
+            if idx < 0:
+                self._pending = data[-(len(_MARKER_BYTES) - 1) :]
+                return -1
+            self._seen_marker = True
+            pos = idx + len(_MARKER_BYTES)
+
+        if not self._seen_eq:
+            idx = data.find(b'=', pos)
+            if idx < 0:
+                return -1
+            self._seen_eq = True
+            pos = idx + 1
+
+        return data.find(b'{', pos)
+
+    def _scan(self, data: bytes) -> int:
+        """Продолжить баланс скобок и вернуть индекс закрывающей."""
+
+        pos = 0
+        if self._escaped:
+            self._escaped = False
+            pos = 1
+
+        depth = self._depth
+        in_string = self._in_string
+        size = len(data)
+        while True:
+            pattern = _STRING_TOKEN_RE if in_string else _TOKEN_RE
+            match = pattern.search(data, pos)
+            if match is None:
+                break
+
+            idx = match.start()
+            char = data[idx]
+            pos = idx + 1
+            if in_string:
+                if char == _BACKSLASH:
+                    if pos >= size:
+                        self._escaped = True
+                        break
+                    pos += 1
+                else:
+                    in_string = False
                 continue
 
-            if char == '\\':
-                escaped = True
-                continue
+            if char == _QUOTE:
+                in_string = True
+            elif char == _OPEN:
+                depth += 1
+            elif char == _CLOSE:
+                depth -= 1
+                if depth == 0:
+                    return idx
+
+        self._depth = depth
+        self._in_string = in_string
+        return -1
 
-            if char == '"':
-                in_string = False
 
-            continue
+def extract_preloaded_state_bytes(html: bytes) -> bytes:
+    """Вернуть JSON из window.__preloadedState__ в виде байт."""
 
-        if char == '"':
-            in_string = True
-            continue
+    scanner = PreloadedStateScanner()
+    scanner.feed(html)
+    return scanner.result()
 
-        if char == '{':
-            depth += 1
 
-        elif char == '}':
-            depth -= 1
-            if depth == 0:
-                return text[start_idx : idx + 1]
+def extract_preloaded_state_json(html: str) -> str:
+    """Вернуть JSON из window.__preloadedState__."""
 
-    raise ListingParseError('unterminated preloaded state json')
+    return extract_preloaded_state_bytes(html.encode()).decode()
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import importlib.util
+import re
 from datetime import UTC, datetime
 
 import httpx
@@ -15,37 +16,60 @@ from sources.domain.exceptions import (
     ListingNotSupportedError,
     ListingParseError,
 )
-from sources.domain.value_objects import ListingUrl
-from sources.infrastructure.avito import (
+from sources.domain.value_objects import ListingId, ListingUrl
+from sources.infrastructure.avito.listing_parser import parse_avito_listing
+from sources.infrastructure.avito.preloaded_state import (
+    PreloadedStateScanner,
     extract_preloaded_state_json,
-    parse_avito_listing,
 )
 
+_DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+_URL_ITEM_ID_RE = re.compile(r'(?:^|[/_])(\d{6,})/?$')
+
+
+def _http2_available() -> bool:
+    """HTTP/2 в httpx требует опционального пакета h2."""
+
+    return importlib.util.find_spec('h2') is not None
+
 
 class AvitoListingProvider(ListingProviderPort):
-    """HTTP-провайдер объявлений Avito."""
+    """Async HTTP-провайдер объявлений Avito.
+
+    Клиент с пулом соединений живёт всё время работы провайдера.
+    HTML читается потоком байт, и разбор заканчивается, как только
+    сбалансированы скобки window.__preloadedState__: остаток страницы
+    парсеру не нужен, а сам JSON уходит в orjson без декодирования
+    страницы в str.
+    """
 
-    __slots__ = ('_client_factory', '_timeout')
+    __slots__ = ('_client', '_owns_client', '_timeout', '_max_bytes')
 
     def __init__(
         self,
         *,
-        client_factory: Callable[[], httpx.Client] | None = None,
+        client: httpx.AsyncClient | None = None,
         timeout_seconds: float = 10.0,
+        max_connections: int = 20,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        user_agent: str = 'flaffy/avito-provider',
     ) -> None:
-        """Сохранить фабрику httpx клиента и таймаут."""
-
-        self._timeout = timeout_seconds
-        if client_factory is None:
-            self._client_factory = lambda: httpx.Client(
-                timeout=self._timeout,
-                follow_redirects=True,
-                headers={
-                    'User-Agent': 'flaffy/avito-provider',
-                },
-            )
-        else:
-            self._client_factory = client_factory
+        """Создать или принять общий httpx клиент."""
+
+        self._timeout = httpx.Timeout(timeout_seconds)
+        self._max_bytes = max_bytes
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            timeout=self._timeout,
+            follow_redirects=True,
+            http2=_http2_available(),
+            limits=httpx.Limits(
+                max_connections=max(1, max_connections),
+                max_keepalive_connections=max(1, max_connections // 2),
+                keepalive_expiry=60.0,
+            ),
+            headers={'User-Agent': user_agent},
+        )
 
     def is_supported(self, url: ListingUrl) -> bool:
         """Поддерживаются только avito.ru."""
@@ -53,36 +77,57 @@ class AvitoListingProvider(ListingProviderPort):
         host = httpx.URL(url.value).host or ''
         return host.endswith('avito.ru')
 
-    def fetch_snapshot(self, url: ListingUrl) -> ListingSnapshotRaw:
-        """Загрузить HTML объявления."""
+    def canonical_key(self, url: ListingUrl) -> tuple[str, ListingId] | None:
+        """Взять id объявления из пути URL без учёта хоста и query.
+
+        Полные ссылки заканчиваются на «_<id>», короткие — на «/<id>»;
+        мобильный хост и параметры трекинга на id не влияют.
+        """
+
+        if not self.is_supported(url):
+            return None
+
+        match = _URL_ITEM_ID_RE.search(httpx.URL(url.value).path)
+        if match is None:
+            return None
+
+        return 'avito', ListingId(match.group(1))
+
+    async def fetch_snapshot(self, url: ListingUrl) -> ListingSnapshotRaw:
+        """Загрузить HTML объявления до конца preloaded state."""
 
         if not self.is_supported(url):
             raise ListingNotSupportedError('URL не принадлежит avito.ru')
 
         try:
-            with self._client_factory() as client:
-                response = client.get(url.value, timeout=self._timeout)
+            async with self._client.stream(
+                'GET',
+                url.value,
+                timeout=self._timeout,
+            ) as response:
+                if response.status_code != 200:
+                    raise ListingFetchError(
+                        f'HTTP {response.status_code} при загрузке объявления',
+                    )
+                state = await self._read_preloaded_state(response)
         except (httpx.TimeoutException, httpx.RequestError) as exc:
             raise ListingFetchError(str(exc)) from exc
 
-        if response.status_code != 200:
-            raise ListingFetchError(
-                f'HTTP {response.status_code} при загрузке объявления',
-            )
-
         return ListingSnapshotRaw(
             source='avito',
             url=url,
             fetched_at=datetime.now(UTC),
-            raw_html=response.text,
+            preloaded_state=state,
         )
 
     def normalize(self, snapshot: ListingSnapshotRaw) -> ListingNormalized:
         """Преобразовать HTML в ListingNormalized."""
 
-        json_str = extract_preloaded_state_json(snapshot.raw_html)
+        payload = snapshot.preloaded_state
+        if payload is None:
+            payload = extract_preloaded_state_json(snapshot.raw_html)
         try:
-            data = orjson.loads(json_str)
+            data = orjson.loads(payload)
         except orjson.JSONDecodeError as exc:
             raise ListingParseError('preloaded state corrupted') from exc
 
@@ -93,3 +138,42 @@ class AvitoListingProvider(ListingProviderPort):
             url=snapshot.url,
             preloaded_state=data,
         )
+
+    async def close(self) -> None:
+        """Закрыть HTTP клиент."""
+
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _read_preloaded_state(
+        self,
+        response: httpx.Response,
+    ) -> bytes | None:
+        """Читать тело, пока сканер не соберёт preloaded state.
+
+        По HTTP/2 чтение обрывается сразу: сбрасывается только поток.
+        Оборванный ответ HTTP/1.1 закрывает соединение, поэтому там
+        остаток тела в пределах max_bytes дочитывается без разбора,
+        и соединение возвращается в пул.
+        """
+
+        scanner = PreloadedStateScanner()
+        state: bytes | None = None
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if state is not None:
+                if size > self._max_bytes:
+                    return state
+                continue
+
+            if scanner.feed(chunk):
+                state = scanner.result()
+                if response.http_version != 'HTTP/1.1':
+                    return state
+                continue
+
+            if size > self._max_bytes:
+                raise ListingFetchError('объявление превышает лимит размера')
+
+        return state
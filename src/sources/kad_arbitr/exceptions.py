@@ -13,3 +13,7 @@ class KadArbitrBlockedError(KadArbitrClientError):
 
 class KadArbitrUnexpectedResponseError(KadArbitrClientError):
     """Неожиданный ответ от kad.arbitr.ru."""
+
+
+class KadArbitrPdfExtractionError(KadArbitrClientError):
+    """Не удалось извлечь текст из PDF в отведённые лимиты."""
@@ -17,3 +17,10 @@ class PdfTextExtractorPort(Protocol):
 
     def extract_text(self, *, pdf_bytes: bytes) -> str:
         """Извлечь текст из PDF."""
+
+
+class AsyncPdfTextExtractorPort(Protocol):
+    """Контракт асинхронного извлечения текста из PDF."""
+
+    async def extract_text(self, *, pdf_bytes: bytes) -> str:
+        """Асинхронно извлечь текст из PDF."""
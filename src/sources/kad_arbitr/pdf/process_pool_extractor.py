@@ -0,0 +1,221 @@
+"""Извлечение текста из PDF в пуле процессов."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import signal
+import threading
+from collections.abc import Iterator
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+)
+from contextlib import contextmanager
+from multiprocessing.context import BaseContext
+
+from sources.kad_arbitr.exceptions import KadArbitrPdfExtractionError
+from sources.kad_arbitr.pdf.ports import AsyncPdfTextExtractorPort
+from sources.kad_arbitr.pdf.text_extractors import (
+    CompositePdfTextExtractor,
+    PdfMinerTextExtractor,
+    PyPdfTextExtractor,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _WorkerDeadlineExceeded(BaseException):
+    """Срок разбора истёк; BaseException не глотают except Exception."""
+
+
+def _raise_deadline(signum: int, frame: object) -> None:
+    raise _WorkerDeadlineExceeded
+
+
+@contextmanager
+def _worker_deadline(timeout_seconds: float | None) -> Iterator[None]:
+    """Прервать разбор по таймеру, если процесс это позволяет.
+
+    Таймер ставится только в главном потоке рабочего процесса: так
+    выполняются задачи ProcessPoolExecutor. В остальных случаях лимит
+    держит только ожидающая сторона.
+    """
+
+    if (
+        not timeout_seconds
+        or timeout_seconds <= 0
+        or not hasattr(signal, 'setitimer')
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    previous = signal.signal(signal.SIGALRM, _raise_deadline)
+    signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _pool_context() -> BaseContext:
+    """Контекст запуска рабочих процессов без fork.
+
+    fork из многопоточного процесса uvicorn копирует захваченные другими
+    потоками блокировки. forkserver стартует процессы из чистого
+    однопоточного сервера; где его нет, используется spawn.
+    """
+
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def extract_text_in_worker(
+    pdf_bytes: bytes,
+    max_pages: int | None,
+    timeout_seconds: float | None = None,
+) -> str:
+    """Извлечь текст из PDF внутри рабочего процесса.
+
+    timeout_seconds ограничивает разбор в самом процессе, чтобы
+    зависший документ освобождал слот пула.
+    """
+
+    extractor = CompositePdfTextExtractor(
+        primary=PyPdfTextExtractor(max_pages=max_pages),
+        fallback=PdfMinerTextExtractor(max_pages=max_pages),
+    )
+    try:
+        with _worker_deadline(timeout_seconds):
+            return extractor.extract_text(pdf_bytes=pdf_bytes)
+    except _WorkerDeadlineExceeded:
+        raise KadArbitrPdfExtractionError(
+            'pdf extraction timed out in worker',
+        ) from None
+
+
+class ProcessPoolPdfTextExtractor(AsyncPdfTextExtractorPort):
+    """Выносит разбор PDF из event loop в пул процессов.
+
+    Задача считается в очереди, пока её future в пуле не завершится:
+    таймаут ожидания не освобождает место, пока процесс ещё занят.
+    Сам процесс прерывает разбор по тому же таймауту. Сломанный пул
+    (упавший процесс) пересоздаётся при следующем вызове.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 2,
+        timeout_seconds: float = 20.0,
+        max_pages: int | None = 50,
+        max_queue_depth: int = 8,
+        executor: Executor | None = None,
+    ) -> None:
+        """Сконфигурировать пул и лимиты извлечения."""
+
+        self._max_workers = max_workers
+        self._timeout_seconds = timeout_seconds
+        self._max_pages = max_pages
+        self._max_queue_depth = max_queue_depth
+        self._owns_executor = executor is None
+        self._executor = executor
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    async def extract_text(self, *, pdf_bytes: bytes) -> str:
+        """Извлечь текст с учётом таймаута и глубины очереди."""
+
+        if self._pending >= self._max_queue_depth:
+            logger.info(
+                'kad_arbitr_pdf_queue_full pending=%s limit=%s',
+                self._pending,
+                self._max_queue_depth,
+            )
+            raise KadArbitrPdfExtractionError('pdf extraction queue is full')
+
+        executor = self._get_executor()
+        try:
+            job = executor.submit(
+                extract_text_in_worker,
+                pdf_bytes,
+                self._max_pages,
+                self._timeout_seconds,
+            )
+        except BrokenExecutor as exc:
+            self._discard_broken(executor)
+            raise KadArbitrPdfExtractionError(
+                'pdf extraction pool is broken'
+            ) from exc
+
+        with self._pending_lock:
+            self._pending += 1
+        job.add_done_callback(self._job_finished)
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(job),
+                timeout=self._timeout_seconds,
+            )
+        except TimeoutError as exc:
+            logger.info(
+                'kad_arbitr_pdf_timeout size=%s timeout=%s',
+                len(pdf_bytes),
+                self._timeout_seconds,
+            )
+            raise KadArbitrPdfExtractionError(
+                'pdf extraction timed out'
+            ) from exc
+        except BrokenExecutor as exc:
+            logger.warning(
+                'kad_arbitr_pdf_pool_broken size=%s',
+                len(pdf_bytes),
+            )
+            self._discard_broken(executor)
+            raise KadArbitrPdfExtractionError(
+                'pdf extraction worker crashed'
+            ) from exc
+
+    def shutdown(self) -> None:
+        """Остановить пул процессов, если он создан этим объектом."""
+
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def pending(self) -> int:
+        """Количество документов в обработке или очереди."""
+
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        """Лениво создать пул процессов."""
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=_pool_context(),
+            )
+        return self._executor
+
+    def _job_finished(self, job: Future[str]) -> None:
+        """Освободить место в очереди; вызывается из потока пула."""
+
+        with self._pending_lock:
+            self._pending -= 1
+
+    def _discard_broken(self, executor: Executor) -> None:
+        """Сбросить сломанный пул, чтобы следующий вызов создал новый."""
+
+        if not self._owns_executor or self._executor is not executor:
+            return
+
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
@@ -10,6 +10,11 @@ from sources.kad_arbitr.pdf.ports import PdfTextExtractorPort
 class PyPdfTextExtractor(PdfTextExtractorPort):
     """Извлечение текста через pypdf."""
 
+    def __init__(self, *, max_pages: int | None = None) -> None:
+        """Сохранить ограничение на число страниц."""
+
+        self._max_pages = max_pages
+
     def extract_text(self, *, pdf_bytes: bytes) -> str:
         """Извлечь текст через pypdf."""
 
@@ -20,7 +25,9 @@ class PyPdfTextExtractor(PdfTextExtractorPort):
 
         reader = PdfReader(BytesIO(pdf_bytes))
         parts: list[str] = []
-        for page in reader.pages:
+        for index, page in enumerate(reader.pages):
+            if self._max_pages is not None and index >= self._max_pages:
+                break
             parts.append(page.extract_text() or '')
         return '\n'.join(parts)
 
@@ -28,6 +35,11 @@ class PyPdfTextExtractor(PdfTextExtractorPort):
 class PdfMinerTextExtractor(PdfTextExtractorPort):
     """Извлечение текста через pdfminer.six."""
 
+    def __init__(self, *, max_pages: int | None = None) -> None:
+        """Сохранить ограничение на число страниц."""
+
+        self._max_pages = max_pages
+
     def extract_text(self, *, pdf_bytes: bytes) -> str:
         """Извлечь текст через pdfminer.six."""
 
@@ -36,7 +48,13 @@ class PdfMinerTextExtractor(PdfTextExtractorPort):
         except ImportError as exc:  # pragma: no cover - optional
             raise RuntimeError('pdfminer.six is not installed') from exc
 
-        return extract_text(BytesIO(pdf_bytes)) or ''
+        return (
+            extract_text(
+                BytesIO(pdf_bytes),
+                maxpages=self._max_pages or 0,
+            )
+            or ''
+        )
 
 
 class CompositePdfTextExtractor(PdfTextExtractorPort):
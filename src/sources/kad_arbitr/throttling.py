@@ -23,6 +23,7 @@ class RateLimiter:
         self._now = now_fn or time.monotonic
         self._sleep = sleep_fn or asyncio.sleep
         self._last_call: float | None = None
+        self._lock = asyncio.Lock()
 
     async def wait(self) -> None:
         """Подождать до следующего разрешённого запроса."""
@@ -30,15 +31,16 @@ class RateLimiter:
         if self._min_interval_seconds <= 0:
             return
 
-        now = self._now()
-        if self._last_call is None:
-            self._last_call = now
-            return
-
-        elapsed = now - self._last_call
-        remaining = self._min_interval_seconds - elapsed
-        if remaining > 0:
-            await self._sleep(remaining)
+        async with self._lock:
             now = self._now()
+            if self._last_call is None:
+                self._last_call = now
+                return
 
-        self._last_call = now
+            elapsed = now - self._last_call
+            remaining = self._min_interval_seconds - elapsed
+            if remaining > 0:
+                await self._sleep(remaining)
+                now = self._now()
+
+            self._last_call = now
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import date
 
@@ -12,6 +13,7 @@ from sources.kad_arbitr.exceptions import (
     KadArbitrClientError,
 )
 from sources.kad_arbitr.models import (
+    KadArbitrCaseNormalized,
     KadArbitrEnrichedCase,
     KadArbitrFacts,
     KadArbitrParticipantNormalized,
@@ -44,6 +46,7 @@ class EnrichKadArbitrCasesForParticipant:
     details_uc: EnrichKadArbitrCaseParticipants
     case_outcome_uc: ResolveKadArbitrCaseOutcome
     base_url: str = 'https://kad.arbitr.ru'
+    max_concurrency: int = 4
 
     async def execute(
         self,
@@ -90,76 +93,59 @@ class EnrichKadArbitrCasesForParticipant:
             reverse=True,
         )
         limited = cases_sorted[:max_cases]
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def _run(
+            case: KadArbitrCaseNormalized,
+        ) -> KadArbitrEnrichedCase | Exception:
+            async with semaphore:
+                try:
+                    return await self._enrich_case(
+                        case=case,
+                        participant=participant,
+                    )
+                except KadArbitrBlockedError:
+                    raise
+                except Exception as exc:
+                    return exc
+
+        blocked = False
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(_run(case)) for case in limited]
+        except* KadArbitrBlockedError:
+            blocked = True
+
+        if blocked:
+            return EnrichKadArbitrCasesResult(
+                facts=KadArbitrFacts(
+                    status='blocked',
+                    participant=participant,
+                    participant_type=participant_type,
+                    cases=[],
+                    stats={},
+                    reason='blocked',
+                ),
+            )
+
         enriched_cases: list[KadArbitrEnrichedCase] = []
         errors_count = 0
         error_examples: list[dict[str, str]] = []
-        for case in limited:
-            try:
-                details = await self.details_uc.execute(
-                    case_id=case.case_id,
-                    target_participant=participant,
-                )
-                target_role = _select_target_role(details.participants)
-                outcome = await self.case_outcome_uc.execute(
-                    case_id=case.case_id,
-                )
-                outcome_text = outcome.extracted_text or ''
-                claim_result = classify_claim(text=outcome_text)
-                amounts_result = extract_amounts(
-                    text=outcome_text,
-                    max_amounts=3,
-                )
-                role_group = map_role_to_group(target_role)
-                impact, impact_confidence = evaluate_outcome_impact(
-                    outcome=outcome.outcome,
-                    role_group=role_group,
-                )
-                enriched_cases.append(
-                    KadArbitrEnrichedCase(
-                        case_id=case.case_id,
-                        case_number=case.case_number,
-                        start_date=case.start_date,
-                        case_type=case.case_type,
-                        court=case.court,
-                        url=case.url,
-                        target_role=target_role,
-                        target_role_group=role_group,
-                        outcome=outcome.outcome,
-                        confidence=outcome.confidence,
-                        impact=impact,
-                        impact_confidence=impact_confidence,
-                        act_id=outcome.act_id,
-                        evidence_snippet=outcome.evidence_snippet,
-                        card_url=details.card_url,
-                        claim_categories=claim_result.categories,
-                        claim_confidence=claim_result.confidence,
-                        claim_matched_keywords=claim_result.matched_keywords,
-                        amounts=amounts_result.amounts,
-                        amounts_fragments=amounts_result.matched_fragments,
-                    )
-                )
-            except KadArbitrBlockedError:
-                return EnrichKadArbitrCasesResult(
-                    facts=KadArbitrFacts(
-                        status='blocked',
-                        participant=participant,
-                        participant_type=participant_type,
-                        cases=[],
-                        stats={},
-                        reason='blocked',
-                    ),
-                )
-            except Exception as exc:
+        for case, task in zip(limited, tasks, strict=True):
+            outcome = task.result()
+            if isinstance(outcome, Exception):
                 errors_count += 1
                 if len(error_examples) < 3:
                     error_examples.append(
                         {
                             'case_id': case.case_id,
-                            'error': exc.__class__.__name__,
+                            'error': outcome.__class__.__name__,
                         }
                     )
                 continue
 
+            enriched_cases.append(outcome)
+
         stats = {
             'cases_total_found': len(limited),
             'cases_enriched_ok': len(enriched_cases),
@@ -181,6 +167,56 @@ class EnrichKadArbitrCasesForParticipant:
             ),
         )
 
+    async def _enrich_case(
+        self,
+        *,
+        case: KadArbitrCaseNormalized,
+        participant: str,
+    ) -> KadArbitrEnrichedCase:
+        """Обогатить одно дело деталями и исходом."""
+
+        details = await self.details_uc.execute(
+            case_id=case.case_id,
+            target_participant=participant,
+        )
+        target_role = _select_target_role(details.participants)
+        outcome = await self.case_outcome_uc.execute(
+            case_id=case.case_id,
+        )
+        outcome_text = outcome.extracted_text or ''
+        claim_result = classify_claim(text=outcome_text)
+        amounts_result = extract_amounts(
+            text=outcome_text,
+            max_amounts=3,
+        )
+        role_group = map_role_to_group(target_role)
+        impact, impact_confidence = evaluate_outcome_impact(
+            outcome=outcome.outcome,
+            role_group=role_group,
+        )
+        return KadArbitrEnrichedCase(
+            case_id=case.case_id,
+            case_number=case.case_number,
+            start_date=case.start_date,
+            case_type=case.case_type,
+            court=case.court,
+            url=case.url,
+            target_role=target_role,
+            target_role_group=role_group,
+            outcome=outcome.outcome,
+            confidence=outcome.confidence,
+            impact=impact,
+            impact_confidence=impact_confidence,
+            act_id=outcome.act_id,
+            evidence_snippet=outcome.evidence_snippet,
+            card_url=details.card_url,
+            claim_categories=claim_result.categories,
+            claim_confidence=claim_result.confidence,
+            claim_matched_keywords=claim_result.matched_keywords,
+            amounts=amounts_result.amounts,
+            amounts_fragments=amounts_result.matched_fragments,
+        )
+
 
 def _select_target_role(
     participants: list[KadArbitrParticipantNormalized],
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import inspect
+
 from sources.kad_arbitr.cache import LruTtlCache
 from sources.kad_arbitr.claim_classifier import extract_relevant_text
+from sources.kad_arbitr.exceptions import KadArbitrPdfExtractionError
 from sources.kad_arbitr.models import (
     KadArbitrActOutcomeNormalized,
     KadArbitrJudicialActNormalized,
@@ -11,7 +14,11 @@ from sources.kad_arbitr.models import (
 from sources.kad_arbitr.pdf.outcome_extractor import (
     extract_outcome_from_text,
 )
-from sources.kad_arbitr.pdf.ports import PdfFetcherPort, PdfTextExtractorPort
+from sources.kad_arbitr.pdf.ports import (
+    AsyncPdfTextExtractorPort,
+    PdfFetcherPort,
+    PdfTextExtractorPort,
+)
 
 
 class ResolveKadArbitrActOutcome:
@@ -21,7 +28,7 @@ class ResolveKadArbitrActOutcome:
         self,
         *,
         fetcher: PdfFetcherPort,
-        text_extractor: PdfTextExtractorPort,
+        text_extractor: PdfTextExtractorPort | AsyncPdfTextExtractorPort,
         text_cache: LruTtlCache | None = None,
     ) -> None:
         """Сохранить зависимости use-case."""
@@ -54,7 +61,16 @@ class ResolveKadArbitrActOutcome:
         )
         if cached_text is None:
             pdf_bytes = await self._fetcher.fetch(url=act.pdf_url)
-            raw_text = self._text_extractor.extract_text(pdf_bytes=pdf_bytes)
+            try:
+                raw_text = await self._extract_text(pdf_bytes)
+            except KadArbitrPdfExtractionError as exc:
+                return KadArbitrActOutcomeNormalized(
+                    act_id=act.act_id,
+                    outcome='unknown',
+                    confidence='low',
+                    reason=str(exc),
+                    extracted_text=None,
+                )
             text = _trim_text(extract_relevant_text(raw_text))
             if self._text_cache is not None:
                 self._text_cache.set(cache_key, text)
@@ -75,6 +91,14 @@ class ResolveKadArbitrActOutcome:
         outcome.extracted_text = text
         return outcome
 
+    async def _extract_text(self, pdf_bytes: bytes) -> str:
+        """Извлечь текст синхронным или асинхронным извлекателем."""
+
+        result = self._text_extractor.extract_text(pdf_bytes=pdf_bytes)
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
 
 def _trim_text(value: str, *, limit: int = 30_000) -> str:
     """Обрезать текст для анализа до безопасной длины."""
@@ -4,9 +4,19 @@ from __future__ import annotations
 
 import asyncio
 import json
+import time
+from collections.abc import Callable
 
 import httpx
 
+from shared.infra.negative_cache import (
+    BLOCKED,
+    NOT_FOUND,
+    UPSTREAM_ERROR,
+    NegativeCacheEntry,
+    NegativeCachePolicy,
+    NegativeOutcome,
+)
 from sources.kad_arbitr.cache import LruTtlCache
 from sources.kad_arbitr.exceptions import (
     KadArbitrBlockedError,
@@ -39,6 +49,9 @@ class XhrKadArbitrClient(KadArbitrClientPort):
         client: httpx.AsyncClient | None = None,
         rate_limiter: RateLimiter | None = None,
         cache: LruTtlCache | None = None,
+        warmup_ttl_seconds: float | None = None,
+        negative_cache_policy: NegativeCachePolicy | None = None,
+        now_fn: Callable[[], float] | None = None,
     ) -> None:
         """Сконфигурировать XHR-клиент."""
 
@@ -47,13 +60,24 @@ class XhrKadArbitrClient(KadArbitrClientPort):
         self._ssl_verify = ssl_verify
         self._user_agent = user_agent or _DEFAULT_USER_AGENT
         self._warmed_up = False
+        self._warmed_at: float | None = None
+        self._warmup_ttl_seconds = warmup_ttl_seconds
+        self._warmup_lock = asyncio.Lock()
+        self._now = now_fn or time.monotonic
         self._owns_client = client is None
         self._rate_limiter = rate_limiter
         self._cache = cache
+        self._negative_policy = negative_cache_policy
+        self._inflight_pages: dict[str, asyncio.Future[str]] = {}
         self._client = client or httpx.AsyncClient(
             base_url=self._base_url,
             verify=self._ssl_verify,
             timeout=self._timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=10,
+                max_keepalive_connections=5,
+                keepalive_expiry=60.0,
+            ),
         )
 
     async def __aenter__(self) -> XhrKadArbitrClient:
@@ -79,11 +103,39 @@ class XhrKadArbitrClient(KadArbitrClientPort):
     ) -> KadArbitrSearchResponse:
         """Асинхронно выполнить поиск дел."""
 
-        if self._cache is not None:
-            key = self._build_search_cache_key(payload)
-            cached = self._cache.get(key)
-            if cached is not None:
-                return cached
+        if self._cache is None:
+            return await self._fetch_search_instances(payload)
+
+        key = self._build_search_cache_key(payload)
+        cached = self._cache.get(key)
+        if isinstance(cached, NegativeCacheEntry):
+            if cached.outcome == BLOCKED:
+                raise KadArbitrBlockedError(f'cached: {cached.detail}')
+            raise KadArbitrUnexpectedResponseError(f'cached: {cached.detail}')
+
+        if cached is not None:
+            return cached
+
+        try:
+            result = await self._fetch_search_instances(payload)
+        except KadArbitrBlockedError as exc:
+            self._remember_negative(key, BLOCKED, exc)
+            raise
+        except KadArbitrUnexpectedResponseError as exc:
+            self._remember_negative(key, UPSTREAM_ERROR, exc)
+            raise
+
+        ttl_seconds = None
+        if not result.items and self._negative_policy is not None:
+            ttl_seconds = self._negative_policy.ttl_for(NOT_FOUND)
+        self._cache.set(key, result, ttl_seconds=ttl_seconds)
+        return result
+
+    async def _fetch_search_instances(
+        self,
+        payload: KadArbitrSearchPayload,
+    ) -> KadArbitrSearchResponse:
+        """Выполнить поиск дел с повторами."""
 
         await self._warmup()
         request_headers = self._xhr_headers()
@@ -109,6 +161,7 @@ class XhrKadArbitrClient(KadArbitrClientPort):
                 ) from exc
 
             if response.status_code == 403:
+                self._invalidate_session()
                 raise KadArbitrBlockedError('kad.arbitr blocked request')
 
             if response.status_code >= 500:
@@ -147,8 +200,6 @@ class XhrKadArbitrClient(KadArbitrClientPort):
                 raise KadArbitrUnexpectedResponseError(
                     f'invalid response: {exc}'
                 ) from exc
-            if self._cache is not None:
-                self._cache.set(self._build_search_cache_key(payload), result)
             return result
 
         raise KadArbitrUnexpectedResponseError(
@@ -158,31 +209,54 @@ class XhrKadArbitrClient(KadArbitrClientPort):
     async def get_case_card_html(self, *, case_id: str) -> str:
         """Асинхронно получить HTML карточки дела."""
 
-        cache_key = ('card_html', case_id)
-        if self._cache is not None:
-            cached = self._cache.get(cache_key)
-            if cached is not None:
-                return cached
-
-        html = await self._get_html(path=f'/Card/{case_id}')
-        if self._cache is not None:
-            self._cache.set(cache_key, html)
-        return html
+        return await self._get_case_page_html(case_id=case_id)
 
     async def get_case_acts_html(self, *, case_id: str) -> str:
         """Асинхронно получить HTML со списком актов."""
 
-        cache_key = ('acts_html', case_id)
+        return await self._get_case_page_html(case_id=case_id)
+
+    async def _get_case_page_html(self, *, case_id: str) -> str:
+        """Получить страницу дела одним запросом для карточки и актов."""
+
+        cache_key = ('case_page_html', case_id)
         if self._cache is not None:
             cached = self._cache.get(cache_key)
             if cached is not None:
                 return cached
 
+        task = self._inflight_pages.get(case_id)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch_case_page_html(case_id=case_id),
+            )
+            self._inflight_pages[case_id] = task
+            task.add_done_callback(
+                lambda done: self._forget_inflight_page(case_id, done),
+            )
+
+        return await asyncio.shield(task)
+
+    async def _fetch_case_page_html(self, *, case_id: str) -> str:
+        """Загрузить страницу дела и положить её в кэш."""
+
         html = await self._get_html(path=f'/Card/{case_id}')
         if self._cache is not None:
-            self._cache.set(cache_key, html)
+            self._cache.set(('case_page_html', case_id), html)
         return html
 
+    def _forget_inflight_page(
+        self,
+        case_id: str,
+        task: asyncio.Future[str],
+    ) -> None:
+        """Убрать завершённую загрузку страницы из списка активных."""
+
+        if self._inflight_pages.get(case_id) is task:
+            self._inflight_pages.pop(case_id, None)
+        if not task.cancelled():
+            task.exception()
+
     async def _get_html(self, *, path: str) -> str:
         """Получить HTML страницу с повторными попытками."""
 
@@ -208,6 +282,7 @@ class XhrKadArbitrClient(KadArbitrClientPort):
                 ) from exc
 
             if response.status_code == 403:
+                self._invalidate_session()
                 raise KadArbitrBlockedError('kad.arbitr blocked request')
 
             if response.status_code >= 500:
@@ -233,18 +308,41 @@ class XhrKadArbitrClient(KadArbitrClientPort):
         )
 
     async def _warmup(self) -> None:
-        """Выполнить прогрев сессии при первом запросе."""
+        """Прогреть сессию при первом запросе и после её устаревания."""
 
-        if self._warmed_up:
+        if self._is_warm():
             return
 
-        headers = {
-            'Accept': 'text/html,application/xhtml+xml,application/xml',
-            'User-Agent': self._user_agent,
-        }
-        await self._wait_rate_limit()
-        await self._client.get('/', headers=headers)
-        self._warmed_up = True
+        async with self._warmup_lock:
+            if self._is_warm():
+                return
+
+            headers = {
+                'Accept': 'text/html,application/xhtml+xml,application/xml',
+                'User-Agent': self._user_agent,
+            }
+            await self._wait_rate_limit()
+            await self._client.get('/', headers=headers)
+            self._warmed_up = True
+            self._warmed_at = self._now()
+
+    def _is_warm(self) -> bool:
+        """Проверить, что cookies прогрева ещё актуальны."""
+
+        if not self._warmed_up:
+            return False
+
+        if self._warmup_ttl_seconds is None or self._warmed_at is None:
+            return True
+
+        return self._now() - self._warmed_at < self._warmup_ttl_seconds
+
+    def _invalidate_session(self) -> None:
+        """Сбросить cookies, чтобы следующий запрос прогрел сессию заново."""
+
+        self._client.cookies.clear()
+        self._warmed_up = False
+        self._warmed_at = None
 
     def _xhr_headers(self) -> dict[str, str]:
         """Сформировать XHR заголовки."""
@@ -279,6 +377,23 @@ class XhrKadArbitrClient(KadArbitrClientPort):
 
         await self._rate_limiter.wait()
 
+    def _remember_negative(
+        self,
+        key: tuple[str, str],
+        outcome: NegativeOutcome,
+        exc: Exception,
+    ) -> None:
+        """Запомнить отрицательный исход поиска на короткий TTL."""
+
+        if self._cache is None or self._negative_policy is None:
+            return
+
+        self._cache.set(
+            key,
+            NegativeCacheEntry(outcome=outcome, detail=str(exc)),
+            ttl_seconds=self._negative_policy.ttl_for(outcome),
+        )
+
     def _build_search_cache_key(
         self,
         payload: KadArbitrSearchPayload,
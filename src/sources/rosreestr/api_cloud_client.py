@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from random import uniform
+
 import httpx
 
 from sources.rosreestr.dto import RosreestrApiResponse
@@ -10,53 +14,137 @@ from sources.rosreestr.ports import RosreestrClientPort
 
 API_URL = 'https://api-cloud.ru/api/rosreestr.php'
 
+logger = logging.getLogger(__name__)
+
 
 class ApiCloudRosreestrClient(RosreestrClientPort):
-    """HTTP-клиент для Rosreestr API-Cloud."""
+    """Async HTTP-клиент для Rosreestr API-Cloud."""
 
-    __slots__ = ('_client', '_token', '_timeout')
+    __slots__ = (
+        '_client',
+        '_owns_client',
+        '_token',
+        '_timeout',
+        '_deadline',
+        '_retries',
+        '_backoff',
+    )
 
     def __init__(
         self,
         *,
         token: str | None,
-        timeout_seconds: int = 120,
-        client: httpx.Client | None = None,
+        timeout_seconds: float = 120,
+        deadline_seconds: float | None = None,
+        retries: int = 2,
+        retry_backoff_seconds: float = 0.5,
+        max_connections: int = 10,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         """Сохранить параметры доступа."""
 
         if not token:
             raise RosreestrClientError('token is required')
         self._token = token
-        self._timeout = timeout_seconds
-        self._client = client or httpx.Client(timeout=self._timeout)
+        self._timeout = httpx.Timeout(timeout_seconds)
+        self._deadline = (
+            deadline_seconds
+            if deadline_seconds and deadline_seconds > 0
+            else None
+        )
+        self._retries = max(0, retries)
+        self._backoff = max(0.0, retry_backoff_seconds)
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=max(1, max_connections),
+                max_keepalive_connections=max(1, max_connections // 2),
+                keepalive_expiry=60.0,
+            ),
+        )
 
-    def get_object(self, *, cadastral_number: str) -> RosreestrApiResponse:
+    async def get_object(
+        self,
+        *,
+        cadastral_number: str,
+    ) -> RosreestrApiResponse:
         """Получить объект по кадастровому номеру."""
 
         params = {
             'type': 'object',
             'cadastr': cadastral_number,
         }
-        response = self._request(params)
+        response = await self._request(params)
         return RosreestrApiResponse.from_dict(response)
 
-    def _request(self, params: dict[str, str]) -> dict | list | None:
-        headers = {'Token': self._token}
+    async def close(self) -> None:
+        """Закрыть HTTP клиент."""
 
-        try:
-            response = self._client.get(
-                API_URL,
-                params=params,
-                headers=headers,
-                timeout=self._timeout,
-            )
-            response.raise_for_status()
+        if self._owns_client:
+            await self._client.aclose()
 
-        except httpx.HTTPError as exc:
-            raise RosreestrClientError(str(exc)) from exc
+    async def _request(self, params: dict[str, str]) -> dict | list | None:
+        """Выполнить запрос с повторами в пределах дедлайна вызова."""
 
         try:
-            return response.json()
-        except ValueError as exc:
-            raise RosreestrClientError('invalid json') from exc
+            async with asyncio.timeout(self._deadline):
+                return await self._request_with_retries(params)
+        except TimeoutError as exc:
+            raise RosreestrClientError('deadline exceeded') from exc
+
+    async def _request_with_retries(
+        self,
+        params: dict[str, str],
+    ) -> dict | list | None:
+        headers = {'Token': self._token}
+
+        for attempt in range(self._retries + 1):
+            if attempt:
+                delay = self._backoff * (2**attempt)
+                jitter = uniform(0, min(0.1, delay * 0.1)) if delay else 0.0
+                await asyncio.sleep(delay + jitter)
+
+            try:
+                response = await self._client.get(
+                    API_URL,
+                    params=params,
+                    headers=headers,
+                    timeout=self._timeout,
+                )
+            except httpx.RequestError as exc:
+                logger.warning(
+                    'rosreestr_request_error attempt=%s error=%s',
+                    attempt,
+                    exc.__class__.__name__,
+                )
+                if attempt == self._retries:
+                    raise RosreestrClientError(str(exc)) from exc
+                continue
+
+            if self._should_retry_status(response.status_code):
+                logger.warning(
+                    'rosreestr_retryable_status status=%s attempt=%s',
+                    response.status_code,
+                    attempt,
+                )
+                if attempt < self._retries:
+                    continue
+
+            try:
+                response.raise_for_status()
+            except httpx.HTTPError as exc:
+                raise RosreestrClientError(str(exc)) from exc
+
+            try:
+                return response.json()
+            except ValueError as exc:
+                raise RosreestrClientError('invalid json') from exc
+
+        raise RosreestrClientError('retries exhausted')
+
+    @staticmethod
+    def _should_retry_status(status: int) -> bool:
+        """Определить, стоит ли повторять запрос по статусу."""
+
+        return status in {429, 500, 502, 503, 504}
@@ -8,10 +8,10 @@ from typing import Protocol
 class RosreestrCachePort(Protocol):
     """Кэш Rosreestr API."""
 
-    def get(self, *, key: str) -> dict[str, object] | None:
+    async def get(self, *, key: str) -> dict[str, object] | None:
         """Получить значение по ключу."""
 
-    def set(
+    async def set(
         self,
         *,
         key: str,
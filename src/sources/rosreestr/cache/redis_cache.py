@@ -0,0 +1,33 @@
+"""Общий для процессов кэш ответов Росреестра в Redis."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from redis.asyncio import Redis
+
+from shared.infra.json_cache import RedisJsonCache
+from sources.rosreestr.cache.ports import RosreestrCachePort
+
+
+class RedisRosreestrCache(RedisJsonCache, RosreestrCachePort):
+    """Хранит сжатые ответы Росреестра в Redis с TTL и лимитом записей."""
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        client: Redis,
+        *,
+        max_items: int,
+        prefix: str = 'flaffy:rosreestr:',
+        now_fn: Callable[[], float] | None = None,
+    ) -> None:
+        """Настроить клиента Redis и лимит записей."""
+
+        super().__init__(
+            client,
+            max_items=max_items,
+            prefix=prefix,
+            now_fn=now_fn,
+        )
@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
+import inspect
+
+from shared.infra.negative_cache import (
+    NOT_FOUND,
+    UPSTREAM_ERROR,
+    NegativeCachePolicy,
+    NegativeOutcome,
+)
 from sources.rosreestr.cache.ports import RosreestrCachePort
 from sources.rosreestr.dto import RosreestrApiResponse
+from sources.rosreestr.exceptions import RosreestrClientError
 from sources.rosreestr.ports import RosreestrClientPort
 
 
@@ -16,14 +25,16 @@ class CachedRosreestrClient(RosreestrClientPort):
         inner: RosreestrClientPort,
         cache: RosreestrCachePort,
         ttl_seconds: int,
+        negative_policy: NegativeCachePolicy | None = None,
     ) -> None:
         """Сохранить зависимости."""
 
         self._inner = inner
         self._cache = cache
         self._ttl_seconds = ttl_seconds
+        self._negative_policy = negative_policy
 
-    def get_object(
+    async def get_object(
         self,
         *,
         cadastral_number: str,
@@ -31,15 +42,61 @@ class CachedRosreestrClient(RosreestrClientPort):
         """Получить объект Росреестра с кэшированием."""
 
         key = f'rosreestr:object:{cadastral_number}'
-        cached = self._cache.get(key=key)
+        cached = await self._cache.get(key=key)
         if cached:
+            error = cached.get('upstream_error')
+            if error is not None:
+                raise RosreestrClientError(f'cached: {error}')
             return RosreestrApiResponse.from_dict(cached)
 
-        response = self._inner.get_object(cadastral_number=cadastral_number)
-        if response.status == 200 and response.found:
-            self._cache.set(
-                key=key,
-                value=response.to_dict(),
-                ttl_seconds=self._ttl_seconds,
+        try:
+            response = await self._inner.get_object(
+                cadastral_number=cadastral_number
             )
+        except RosreestrClientError as exc:
+            await self._remember(
+                key,
+                {'upstream_error': str(exc)},
+                self._negative_ttl(UPSTREAM_ERROR),
+            )
+            raise
+
+        if response.status != 200:
+            ttl_seconds = self._negative_ttl(UPSTREAM_ERROR)
+        elif response.found:
+            ttl_seconds = self._ttl_seconds
+        else:
+            ttl_seconds = self._negative_ttl(NOT_FOUND)
+        await self._remember(key, response.to_dict(), ttl_seconds)
         return response
+
+    def _negative_ttl(self, outcome: NegativeOutcome) -> int:
+        """Вернуть TTL отрицательного исхода в целых секундах."""
+
+        if self._negative_policy is None:
+            return 0
+        return round(self._negative_policy.ttl_for(outcome))
+
+    async def _remember(
+        self,
+        key: str,
+        value: dict[str, object],
+        ttl_seconds: int,
+    ) -> None:
+        """Сохранить ответ, если для него задан положительный TTL."""
+
+        if ttl_seconds > 0:
+            await self._cache.set(
+                key=key,
+                value=value,
+                ttl_seconds=ttl_seconds,
+            )
+
+    async def close(self) -> None:
+        """Закрыть вложенный клиент."""
+
+        close_method = getattr(self._inner, 'close', None)
+        if callable(close_method):
+            result = close_method()
+            if inspect.isawaitable(result):
+                await result
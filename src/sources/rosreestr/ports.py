@@ -10,7 +10,11 @@ from sources.rosreestr.dto import RosreestrApiResponse
 class RosreestrClientPort(Protocol):
     """Контракт клиента Росреестра."""
 
-    def get_object(self, *, cadastral_number: str) -> RosreestrApiResponse:
+    async def get_object(
+        self,
+        *,
+        cadastral_number: str,
+    ) -> RosreestrApiResponse:
         """Вернуть данные по кадастровому номеру."""
 
         raise NotImplementedError
@@ -12,7 +12,11 @@ class StubRosreestrClient(RosreestrClientPort):
 
     __slots__ = ()
 
-    def get_object(self, *, cadastral_number: str) -> RosreestrApiResponse:
+    async def get_object(
+        self,
+        *,
+        cadastral_number: str,
+    ) -> RosreestrApiResponse:
         """Вернуть фиктивный объект по кадастровому номеру."""
 
         if cadastral_number in ROSREESTR_FIXTURE:
@@ -18,7 +18,7 @@ class ResolveRosreestrHouseByCadastralUseCase:
 
         self.client = client
 
-    def execute(
+    async def execute(
         self,
         *,
         cadastral_number: str,
@@ -26,7 +26,9 @@ class ResolveRosreestrHouseByCadastralUseCase:
         """Получить объект Росреестра или None, если не найден."""
 
         self._validate_cadastral_number(cadastral_number)
-        response = self.client.get_object(cadastral_number=cadastral_number)
+        response = await self.client.get_object(
+            cadastral_number=cadastral_number,
+        )
         if response.status != 200:
             raise RosreestrBadResponseError(
                 f'unexpected status: {response.status}',
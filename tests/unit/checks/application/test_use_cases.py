@@ -35,7 +35,10 @@ class ListingResolverStub:
         self.listing = None
         self.calls = 0
 
-    def execute(self, url_text: str):
+    def canonical_key(self, url_text: str) -> None:
+        return None
+
+    async def execute(self, url_text: str):
         self.calls += 1
         if self.listing is None:
             raise ListingNotSupportedError(url_text)
@@ -180,7 +183,7 @@ async def test_address_path_uses_address_risk_use_case():
                 risk_card=build_risk_card(()),
             )
 
-        async def execute(self, raw):
+        async def execute(self, raw, *, context=None):
             self.called_with = raw
             return self._result
 
@@ -201,7 +204,10 @@ async def test_address_path_uses_address_risk_use_case():
         async def get(self, key):
             return None
 
-        async def set(self, key, check_id):
+        async def get_snapshot(self, key):
+            return None
+
+        async def set(self, key, check_id, *, snapshot=None):
             return None
 
         async def cleanup(self):
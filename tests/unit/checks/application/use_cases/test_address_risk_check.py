@@ -7,7 +7,12 @@ from checks.adapters.signals_provider_stub import SignalsProviderStub
 from checks.application.use_cases.address_risk_check import (
     AddressRiskCheckUseCase,
 )
+from checks.application.use_cases.check_address_context import (
+    AddressCheckContext,
+)
 from checks.domain.value_objects.address import normalize_address_raw
+from checks.infrastructure.address_resolver_fias import FiasAddressResolver
+from checks.infrastructure.fias.client_stub import StubFiasClient
 
 pytestmark = pytest.mark.asyncio
 
@@ -29,3 +34,65 @@ async def test_risk_check_use_case_produces_confidence_signal() -> None:
     codes = [signal.code for signal in result.signals]
     assert 'address_confidence_low' in codes
     assert 0 <= result.risk_card.score <= 100
+
+
+class _CountingFiasClient(StubFiasClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def normalize_address(self, query: str):
+        self.calls += 1
+        return await super().normalize_address(query)
+
+
+async def test_risk_check_reuses_fias_outcome_from_context() -> None:
+    """Известный исход ФИАС не запрашивается резолвером повторно."""
+
+    client = _CountingFiasClient()
+    use_case = AddressRiskCheckUseCase(
+        address_resolver=FiasAddressResolver(client),
+        signals_provider=SignalsProviderStub({}),
+    )
+    context = AddressCheckContext.from_text('г. Москва, ул. Тверская, д. 1')
+    context.record_fias(await client.normalize_address(context.value))
+
+    first = await use_case.execute(context.raw, context=context)
+    second = await use_case.execute(context.raw, context=context)
+
+    assert client.calls == 1
+    assert first.normalized_address.source == 'fias'
+    assert second.normalized_address is first.normalized_address
+
+
+async def test_risk_check_resolves_when_context_has_no_fias_outcome() -> None:
+    """Без исхода ФИАС в контексте резолвер вызывается как обычно."""
+
+    client = _CountingFiasClient()
+    use_case = AddressRiskCheckUseCase(
+        address_resolver=FiasAddressResolver(client),
+        signals_provider=SignalsProviderStub({}),
+    )
+    context = AddressCheckContext.from_text('г. Москва, ул. Тверская, д. 1')
+
+    result = await use_case.execute(context.raw, context=context)
+
+    assert client.calls == 1
+    assert result.normalized_address.source == 'fias'
+    assert context.normalized is result.normalized_address
+
+
+async def test_stub_resolver_ignores_fias_outcome_from_context() -> None:
+    """Резолвер без ФИАС нормализует адрес через порт как обычно."""
+
+    use_case = AddressRiskCheckUseCase(
+        address_resolver=AddressResolverStub({}),
+        signals_provider=SignalsProviderStub({}),
+    )
+    context = AddressCheckContext.from_text('г. Москва, ул. Тверская, д. 1')
+    context.record_fias(await StubFiasClient().normalize_address(context.value))
+
+    result = await use_case.execute(context.raw, context=context)
+
+    assert context.fias_address is not None
+    assert result.normalized_address.source == 'stub'
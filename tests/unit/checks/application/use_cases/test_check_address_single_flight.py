@@ -0,0 +1,119 @@
+"""Проверка объединения одинаковых одновременных проверок."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from checks.application.use_cases.address_risk_check import (
+    AddressRiskCheckResult,
+)
+from checks.application.use_cases.check_address import CheckAddressUseCase
+from checks.application.use_cases.check_address_single_flight import (
+    CheckSingleFlight,
+)
+from checks.domain.value_objects.address import (
+    normalize_address,
+    normalize_address_raw,
+)
+from checks.domain.value_objects.query import CheckQuery
+from checks.infrastructure.check_cache_repo_inmemory import (
+    InMemoryCheckCacheRepo,
+)
+from checks.infrastructure.check_results_repo_inmemory import (
+    InMemoryCheckResultsRepo,
+)
+from checks.infrastructure.fias.client_stub import StubFiasClient
+from risks.application.scoring import build_risk_card
+
+pytestmark = pytest.mark.asyncio
+
+
+class SlowAddressRiskCheckUseCase:
+    """Считает вызовы и отдаёт результат после паузы."""
+
+    def __init__(self) -> None:
+        normalized = normalize_address(normalize_address_raw('ул мира 7'))
+        self._result = AddressRiskCheckResult(
+            normalized_address=normalized,
+            signals=[],
+            risk_card=build_risk_card(()),
+        )
+        self.calls = 0
+
+    async def execute(self, raw, *, context=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self._result
+
+
+class RecordingLock:
+    """Записывает ключи, под которыми шло вычисление."""
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+
+    @asynccontextmanager
+    async def hold(self, key: str):
+        self.keys.append(key)
+        yield True
+
+
+async def test_concurrent_identical_checks_share_one_computation() -> None:
+    fake_risk = SlowAddressRiskCheckUseCase()
+    single_flight = CheckSingleFlight()
+    use_case = CheckAddressUseCase(
+        address_risk_check_use_case=fake_risk,
+        check_results_repo=InMemoryCheckResultsRepo(),
+        check_cache_repo=InMemoryCheckCacheRepo(ttl_seconds=600),
+        fias_client=StubFiasClient(),
+        fias_mode='stub',
+        cache_version='test',
+        single_flight=single_flight,
+    )
+
+    query = CheckQuery({'type': 'address', 'query': 'ул мира 7'})
+    responses = await asyncio.gather(
+        *(use_case.execute_query(query) for _ in range(5)),
+    )
+
+    assert fake_risk.calls == 1
+    assert len({response['check_id'] for response in responses}) == 1
+    assert single_flight.inflight == 0
+
+
+async def test_single_flight_rechecks_cache_under_lock() -> None:
+    lock = RecordingLock()
+    single_flight = CheckSingleFlight(lock=lock)
+    computed = 0
+
+    async def compute():
+        nonlocal computed
+        computed += 1
+        return 'computed'
+
+    async def recheck():
+        return 'cached'
+
+    result = await single_flight.run('key', compute, recheck=recheck)
+
+    assert result == 'cached'
+    assert computed == 0
+    assert lock.keys == ['key']
+
+
+async def test_single_flight_propagates_errors_and_forgets_key() -> None:
+    single_flight = CheckSingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0)
+        raise RuntimeError('boom')
+
+    results = await asyncio.gather(
+        single_flight.run('key', compute),
+        single_flight.run('key', compute),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(item, RuntimeError) for item in results)
+    assert single_flight.inflight == 0
@@ -0,0 +1,207 @@
+"""Проверка параллельного опроса источников в fetch_fias_data."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from checks.application.ports.fias_client import NormalizedAddress
+from checks.application.use_cases import check_address_sources
+from checks.application.use_cases.check_address_context import (
+    AddressCheckContext,
+)
+from checks.application.use_cases.check_address_sources import (
+    fetch_fias_data,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class _FiasClientStub:
+    async def normalize_address(self, query: str) -> NormalizedAddress | None:
+        return NormalizedAddress(
+            source_query=query,
+            normalized='г. Москва, ул. Тверская, д. 1',
+            fias_id='fias-main',
+            confidence=0.95,
+            raw={'query': query},
+            cadastral_number='77:01:000101:1',
+            region_code='77',
+        )
+
+
+class _RosreestrResolverStub:
+    def __init__(self, started: asyncio.Event) -> None:
+        self._started = started
+        self.saw_gis_gkh = False
+
+    async def execute(self, *, cadastral_number: str):
+        try:
+            await asyncio.wait_for(self._started.wait(), timeout=1.0)
+        except TimeoutError:
+            return None
+        self.saw_gis_gkh = True
+        return None
+
+
+class _GisGkhResolverStub:
+    def __init__(
+        self,
+        started: asyncio.Event,
+        *,
+        delay: float = 0.0,
+    ) -> None:
+        self._started = started
+        self._delay = delay
+
+    async def execute(self, *, cadastral_number: str, region_code: str):
+        self._started.set()
+        await asyncio.sleep(self._delay)
+        return None
+
+
+def _patch_resolvers(monkeypatch, rosreestr, gis_gkh) -> None:
+    monkeypatch.setattr(
+        'checks.infrastructure.rosreestr_resolver_container.'
+        'get_rosreestr_resolver_use_case',
+        lambda settings: rosreestr,
+    )
+    monkeypatch.setattr(
+        'checks.infrastructure.gis_gkh_resolver_container.'
+        'get_gis_gkh_resolver_use_case',
+        lambda settings: gis_gkh,
+    )
+
+
+async def test_independent_sources_run_concurrently(monkeypatch) -> None:
+    started = asyncio.Event()
+    rosreestr = _RosreestrResolverStub(started)
+    _patch_resolvers(monkeypatch, rosreestr, _GisGkhResolverStub(started))
+
+    result = await fetch_fias_data(
+        fias_client=_FiasClientStub(),
+        fias_mode='stub',
+        query='г. Москва, ул. Тверская, д. 1',
+        settings=SimpleNamespace(ROSREESTR_MODE='stub'),
+    )
+
+    assert rosreestr.saw_gis_gkh is True
+    assert result[3]['found'] is False
+    assert result[5]['found'] is False
+
+
+async def test_source_deadline_returns_timeout_payload(monkeypatch) -> None:
+    started = asyncio.Event()
+    started.set()
+    _patch_resolvers(
+        monkeypatch,
+        _RosreestrResolverStub(started),
+        _GisGkhResolverStub(started, delay=1.0),
+    )
+
+    (
+        _,
+        _,
+        _,
+        rosreestr_payload,
+        gis_gkh_house,
+        gis_gkh_payload,
+        kad_arbitr_payload,
+        kad_arbitr_signals,
+    ) = await fetch_fias_data(
+        fias_client=_FiasClientStub(),
+        fias_mode='stub',
+        query='г. Москва, ул. Тверская, д. 1',
+        settings=SimpleNamespace(GIS_GKH_DEADLINE_SECONDS=0.05),
+    )
+
+    assert rosreestr_payload['error'] is None
+    assert gis_gkh_house is None
+    assert gis_gkh_payload['error'] == 'TimeoutError'
+    assert kad_arbitr_payload is None
+    assert kad_arbitr_signals == []
+
+
+async def test_fias_failure_is_recorded_in_context() -> None:
+    class _FailingClient:
+        async def normalize_address(self, query: str):
+            raise RuntimeError('fias down')
+
+    context = AddressCheckContext.from_text('г. Москва, ул. Тверская, д. 1')
+
+    result = await fetch_fias_data(
+        fias_client=_FailingClient(),
+        fias_mode='api',
+        query=context.value,
+        settings=None,
+        context=context,
+    )
+
+    assert result == (None, None, None, None, None, None, None, [])
+    assert context.fias_resolved is True
+    assert context.fias_address is None
+
+
+async def test_failing_source_keeps_sibling_result(monkeypatch) -> None:
+    started = asyncio.Event()
+    _patch_resolvers(
+        monkeypatch,
+        _RosreestrResolverStub(started),
+        _GisGkhResolverStub(started),
+    )
+
+    async def _failing_rosreestr(**kwargs):
+        raise RuntimeError('rosreestr down')
+
+    monkeypatch.setattr(
+        check_address_sources,
+        'build_rosreestr_payload',
+        _failing_rosreestr,
+    )
+
+    result = await fetch_fias_data(
+        fias_client=_FiasClientStub(),
+        fias_mode='stub',
+        query='г. Москва, ул. Тверская, д. 1',
+        settings=SimpleNamespace(ROSREESTR_MODE='stub'),
+    )
+
+    assert result[3] == {
+        'found': False,
+        'house': None,
+        'error': 'RuntimeError',
+        'signals': [],
+    }
+    assert result[5]['found'] is False
+    assert result[5]['error'] is None
+
+
+async def test_failing_kad_arbitr_returns_error_payload(monkeypatch) -> None:
+    started = asyncio.Event()
+    started.set()
+    _patch_resolvers(
+        monkeypatch,
+        _RosreestrResolverStub(started),
+        _GisGkhResolverStub(started),
+    )
+
+    async def _failing_kad_arbitr(**kwargs):
+        raise ValueError('bad payload')
+
+    monkeypatch.setattr(
+        check_address_sources,
+        'build_kad_arbitr_payload',
+        _failing_kad_arbitr,
+    )
+
+    result = await fetch_fias_data(
+        fias_client=_FiasClientStub(),
+        fias_mode='stub',
+        query='г. Москва, ул. Тверская, д. 1',
+        settings=SimpleNamespace(ROSREESTR_MODE='stub'),
+    )
+
+    assert result[3]['error'] is None
+    assert result[5]['error'] is None
+    assert result[6]['status'] == 'error'
+    assert result[7] == []
@@ -34,7 +34,7 @@ async def test_build_kad_arbitr_payload_returns_payload(monkeypatch) -> None:
     client = StubKadArbitrClient(response=response)
     monkeypatch.setattr(
         'checks.application.use_cases.check_address_sources.'
-        'build_kad_arbitr_client',
+        'get_kad_arbitr_client',
         lambda settings: client,
     )
     settings = SimpleNamespace(
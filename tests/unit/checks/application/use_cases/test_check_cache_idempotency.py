@@ -29,7 +29,10 @@ from sources.domain.exceptions import ListingNotSupportedError
 class ListingResolverStub:
     """Всегда сообщает, что URL не поддерживается."""
 
-    def execute(self, url_text: str):
+    def canonical_key(self, url_text: str) -> None:
+        return None
+
+    async def execute(self, url_text: str):
         raise ListingNotSupportedError(url_text)
 
 
@@ -78,7 +81,7 @@ class FakeAddressRiskCheckUseCase:
         )
         self.calls = 0
 
-    async def execute(self, raw):
+    async def execute(self, raw, *, context=None):
         self.calls += 1
         return self._result
 
@@ -126,3 +129,77 @@ async def test_cache_expires_after_ttl() -> None:
 
     assert fake_risk.calls == 2
     assert first['check_id'] != second['check_id']
+
+
+class CountingFiasClient(StubFiasClient):
+    """Считает обращения к ФИАС."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def normalize_address(self, query: str):
+        self.calls += 1
+        return await super().normalize_address(query)
+
+
+async def test_cache_hit_skips_upstream_sources() -> None:
+    """Попадание в кэш не обращается к ФИАС и источникам."""
+
+    fias_client = CountingFiasClient()
+    fake_risk = FakeAddressRiskCheckUseCase()
+    use_case = CheckAddressUseCase(
+        address_risk_check_use_case=fake_risk,
+        check_results_repo=InMemoryCheckResultsRepo(),
+        check_cache_repo=InMemoryCheckCacheRepo(ttl_seconds=600),
+        fias_client=fias_client,
+        fias_mode='stub',
+        cache_version='test',
+    )
+
+    query = CheckQuery({'type': 'address', 'query': 'ул мира 7'})
+    first = await use_case.execute_query(query)
+    second = await use_case.execute_query(query)
+
+    assert fias_client.calls == 1
+    assert first['check_id'] == second['check_id']
+
+
+class SnapshotLookupCacheRepo(InMemoryCheckCacheRepo):
+    """Кэш, отдающий снимок вместе с записью одним вызовом."""
+
+    def __init__(self, results_repo: InMemoryCheckResultsRepo) -> None:
+        super().__init__(ttl_seconds=600)
+        self._results_repo = results_repo
+        self.snapshot_calls = 0
+
+    async def get_snapshot(self, key: str):
+        self.snapshot_calls += 1
+        entry = await self.get(key)
+        if entry is None:
+            return None
+        return entry, await self._results_repo.get(entry.check_id)
+
+
+async def test_cache_hit_uses_combined_snapshot_lookup() -> None:
+    """Снимок берётся через get_snapshot, если кэш его поддерживает."""
+
+    fake_risk = FakeAddressRiskCheckUseCase()
+    results_repo = InMemoryCheckResultsRepo()
+    cache_repo = SnapshotLookupCacheRepo(results_repo)
+    use_case = CheckAddressUseCase(
+        address_risk_check_use_case=fake_risk,
+        check_results_repo=results_repo,
+        check_cache_repo=cache_repo,
+        fias_client=StubFiasClient(),
+        fias_mode='stub',
+        cache_version='test',
+    )
+
+    query = CheckQuery({'type': 'address', 'query': 'ул мира 7'})
+    first = await use_case.execute_query(query)
+    second = await use_case.execute_query(query)
+
+    assert cache_repo.snapshot_calls == 2
+    assert fake_risk.calls == 1
+    assert first['check_id'] == second['check_id']
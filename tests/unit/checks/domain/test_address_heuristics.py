@@ -1,4 +1,7 @@
-from checks.domain.helpers.address_heuristics import is_address_like
+from checks.domain.helpers.address_heuristics import (
+    canonical_address_key,
+    is_address_like,
+)
 
 
 def test_address_like_with_street_and_number():
@@ -19,3 +22,27 @@ def test_keyword_only_street():
 
 def test_too_many_special_symbols():
     assert is_address_like('@@@###$$$%%%^^^&&&***') is False
+
+
+def test_canonical_address_key_folds_spelling_variants():
+    variants = (
+        'г. Москва, ул. Тверская, д. 1',
+        'город  Москва улица Тверская 1',
+        'москва, УЛ ТВЕРСКАЯ, ДОМ 1',
+    )
+    keys = {canonical_address_key(value) for value in variants}
+    assert keys == {'москва ул тверская 1'}
+
+
+def test_canonical_address_key_keeps_distinct_addresses_apart():
+    assert canonical_address_key('ул. Тверская, д. 1') != (
+        canonical_address_key('ул. Тверская, д. 11')
+    )
+
+
+def test_canonical_address_key_keeps_village_prefix():
+    village = canonical_address_key('обл. Тверская, д. Петрово, 5')
+
+    assert village == 'обл тверская д петрово 5'
+    assert village != canonical_address_key('обл. Тверская, г. Петрово, 5')
+    assert village != canonical_address_key('обл. Тверская, Петрово, 5')
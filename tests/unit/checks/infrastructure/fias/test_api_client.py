@@ -1,7 +1,11 @@
+import asyncio
+
 import httpx
 import pytest
 
 from checks.infrastructure.fias.client import ApiFiasClient
+from shared.infra.circuit_breaker import CircuitBreaker
+from shared.infra.negative_cache import NegativeCachePolicy
 
 
 @pytest.mark.asyncio
@@ -23,3 +27,191 @@ async def test_api_client_returns_none_on_non_200():
         )
         result = await client.normalize_address('test query')
         assert result is None
+
+
+@pytest.mark.asyncio
+async def test_api_client_caches_not_found_queries():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(404, json={})
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = ApiFiasClient(
+            base_url='https://fias.example',
+            token='token',
+            http_client=http_client,
+            timeout_seconds=0.1,
+            retries=0,
+            retry_backoff_seconds=0.0,
+            concurrency_limit=1,
+            endpoint='/search',
+            negative_cache_policy=NegativeCachePolicy(jitter_ratio=0),
+        )
+        assert await client.normalize_address('test query') is None
+        assert await client.normalize_address('test query') is None
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_api_client_normalize_many_dedupes_and_reports_failures():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params['search_string']
+        calls.append(query)
+        if query == 'broken':
+            return httpx.Response(503, json={})
+        if query == 'missing':
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json={'full_name': query.upper()})
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = ApiFiasClient(
+            base_url='https://fias.example',
+            token='token',
+            http_client=http_client,
+            timeout_seconds=0.1,
+            retries=0,
+            retry_backoff_seconds=0.0,
+            concurrency_limit=2,
+            endpoint='/search',
+        )
+        results = await client.normalize_many(
+            ['a', 'broken', 'a', 'missing', 'b'],
+        )
+
+    assert sorted(calls) == ['a', 'b', 'broken', 'missing']
+    assert [item.query for item in results] == [
+        'a',
+        'broken',
+        'a',
+        'missing',
+        'b',
+    ]
+    assert [
+        item.address.normalized if item.address else None for item in results
+    ] == ['A', None, 'A', None, 'B']
+    assert [item.error for item in results] == [
+        None,
+        'upstream_error',
+        None,
+        'not_found',
+        None,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_api_client_circuit_opens_and_fails_fast():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503, json={})
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = ApiFiasClient(
+            base_url='https://fias.example',
+            token='token',
+            http_client=http_client,
+            timeout_seconds=0.1,
+            retries=3,
+            retry_backoff_seconds=0.0,
+            concurrency_limit=4,
+            endpoint='/search',
+            breaker=CircuitBreaker(name='fias', failure_threshold=2),
+        )
+        assert await client.normalize_address('first') is None
+        assert await client.normalize_address('second') is None
+
+        assert client.health['circuit']['state'] == 'open'
+        assert client.health['concurrency']['limit'] == 1
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_api_client_cancelled_half_open_probe_does_not_wedge_breaker():
+    clock = [0.0]
+    release = asyncio.Event()
+    started = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params['search_string'] == 'hang':
+            started.set()
+            await release.wait()
+        return httpx.Response(200, json={'full_name': 'г. Москва'})
+
+    breaker = CircuitBreaker(
+        name='fias',
+        failure_threshold=1,
+        reset_timeout_seconds=10,
+        now_fn=lambda: clock[0],
+    )
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = ApiFiasClient(
+            base_url='https://fias.example',
+            token='token',
+            http_client=http_client,
+            timeout_seconds=1.0,
+            retries=0,
+            retry_backoff_seconds=0.0,
+            concurrency_limit=4,
+            endpoint='/search',
+            breaker=breaker,
+        )
+        breaker.record_failure()
+        clock[0] = 10
+
+        probe = asyncio.create_task(client.normalize_address('hang'))
+        await started.wait()
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert breaker.state == 'open'
+        clock[0] = 20
+        result = await client.normalize_address('г. Москва')
+
+    assert result is not None
+    assert breaker.state == 'closed'
+
+
+@pytest.mark.asyncio
+async def test_api_client_normalize_many_processes_batch_in_chunks():
+    active = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        query = request.url.params['search_string']
+        return httpx.Response(200, json={'full_name': query})
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = ApiFiasClient(
+            base_url='https://fias.example',
+            token='token',
+            http_client=http_client,
+            timeout_seconds=1.0,
+            retries=0,
+            retry_backoff_seconds=0.0,
+            concurrency_limit=10,
+            endpoint='/search',
+            batch_chunk_size=2,
+        )
+        queries = [f'q{idx}' for idx in range(5)]
+        results = await client.normalize_many(queries)
+
+    assert peak == 2
+    assert [item.address.normalized for item in results] == queries
@@ -0,0 +1,213 @@
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from checks.application.ports.fias_client import (
+    FiasBatchResult,
+    NormalizedAddress,
+)
+from checks.infrastructure.fias.cached_client import CachedFiasClient
+from shared.infra.json_cache import InMemoryJsonCache
+
+
+class _FiasClientStub:
+    def __init__(self, result: NormalizedAddress | None) -> None:
+        self.result = result
+        self.queries: list[str] = []
+
+    async def normalize_address(self, query: str) -> NormalizedAddress | None:
+        self.queries.append(query)
+        return self.result
+
+
+def _address() -> NormalizedAddress:
+    return NormalizedAddress(
+        source_query='г. Москва, ул. Тверская, д. 1',
+        normalized='г Москва, ул Тверская, д 1',
+        fias_id='guid-1',
+        confidence=0.9,
+        raw={'full_name': 'г Москва, ул Тверская, д 1'},
+        region_code='77',
+        updated_at=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_client_serves_spelling_variants_from_cache():
+    inner = _FiasClientStub(_address())
+    client = CachedFiasClient(
+        inner=inner,
+        cache=InMemoryJsonCache(),
+        ttl_seconds=60,
+    )
+
+    first = await client.normalize_address('г. Москва, ул. Тверская, д. 1')
+    second = await client.normalize_address('москва  улица тверская 1')
+
+    assert inner.queries == ['г. Москва, ул. Тверская, д. 1']
+    assert second.source_query == 'москва  улица тверская 1'
+    assert second.fias_id == first.fias_id
+    assert second.updated_at == first.updated_at
+    assert client.stats == {
+        'hits': 1,
+        'misses': 1,
+        'coalesced': 0,
+        'hit_rate': 0.5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_cached_client_does_not_cache_misses():
+    inner = _FiasClientStub(None)
+    client = CachedFiasClient(
+        inner=inner,
+        cache=InMemoryJsonCache(),
+        ttl_seconds=60,
+    )
+
+    assert await client.normalize_address('ул. Ленина, 5') is None
+    assert await client.normalize_address('ул. Ленина, 5') is None
+    assert len(inner.queries) == 2
+
+
+class _BatchFiasClientStub(_FiasClientStub):
+    def __init__(self, result: NormalizedAddress | None) -> None:
+        super().__init__(result)
+        self.batches: list[list[str]] = []
+
+    async def normalize_many(self, queries):
+        self.batches.append(list(queries))
+        return [
+            FiasBatchResult(query=query, address=self.result)
+            for query in queries
+        ]
+
+
+@pytest.mark.asyncio
+async def test_cached_client_normalize_many_fetches_each_key_once():
+    inner = _BatchFiasClientStub(_address())
+    client = CachedFiasClient(
+        inner=inner,
+        cache=InMemoryJsonCache(),
+        ttl_seconds=60,
+    )
+    await client.normalize_address('ул. Ленина, д. 5')
+
+    results = await client.normalize_many(
+        [
+            'г. Москва, ул. Тверская, д. 1',
+            'ул. Ленина, д. 5',
+            'Москва улица Тверская 1',
+        ],
+    )
+
+    assert inner.batches == [['г. Москва, ул. Тверская, д. 1']]
+    assert [item.query for item in results] == [
+        'г. Москва, ул. Тверская, д. 1',
+        'ул. Ленина, д. 5',
+        'Москва улица Тверская 1',
+    ]
+    assert all(item.address is not None for item in results)
+    assert results[2].address.source_query == 'Москва улица Тверская 1'
+
+
+@pytest.mark.asyncio
+async def test_cached_client_coalesces_concurrent_misses():
+    class _SlowStub(_FiasClientStub):
+        async def normalize_address(self, query):
+            await asyncio.sleep(0)
+            return await super().normalize_address(query)
+
+    inner = _SlowStub(_address())
+    client = CachedFiasClient(
+        inner=inner,
+        cache=InMemoryJsonCache(),
+        ttl_seconds=60,
+    )
+
+    first, second = await asyncio.gather(
+        client.normalize_address('г. Москва, ул. Тверская, д. 1'),
+        client.normalize_address('Москва, улица Тверская, 1'),
+    )
+
+    assert len(inner.queries) == 1
+    assert first.fias_id == second.fias_id
+    assert second.source_query == 'Москва, улица Тверская, 1'
+    assert client.stats['hits'] == 0
+    assert client.stats['coalesced'] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_client_waiter_survives_cancelled_leader():
+    release = asyncio.Event()
+
+    class _BlockingStub(_FiasClientStub):
+        async def normalize_address(self, query):
+            await release.wait()
+            return await super().normalize_address(query)
+
+    inner = _BlockingStub(_address())
+    client = CachedFiasClient(
+        inner=inner,
+        cache=InMemoryJsonCache(),
+        ttl_seconds=60,
+    )
+
+    leader = asyncio.create_task(
+        client.normalize_address('г. Москва, ул. Тверская, д. 1'),
+    )
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(
+        client.normalize_address('Москва, улица Тверская, 1'),
+    )
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    result = await waiter
+
+    assert leader.cancelled()
+    assert result is not None
+    assert result.source_query == 'Москва, улица Тверская, 1'
+    assert len(inner.queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_client_normalize_many_uses_bulk_cache_calls():
+    class _CountingCache(InMemoryJsonCache):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls: list[str] = []
+
+        async def get(self, *, key):
+            self.calls.append('get')
+            return await super().get(key=key)
+
+        async def set(self, *, key, value, ttl_seconds):
+            self.calls.append('set')
+            await super().set(key=key, value=value, ttl_seconds=ttl_seconds)
+
+        async def get_many(self, *, keys):
+            self.calls.append('get_many')
+            return await super().get_many(keys=keys)
+
+        async def set_many(self, *, items, ttl_seconds):
+            self.calls.append('set_many')
+            await super().set_many(items=items, ttl_seconds=ttl_seconds)
+
+    cache = _CountingCache()
+    client = CachedFiasClient(
+        inner=_BatchFiasClientStub(_address()),
+        cache=cache,
+        ttl_seconds=60,
+    )
+    queries = [f'ул. Ленина, д. {idx}' for idx in range(20)]
+
+    await client.normalize_many(queries)
+    results = await client.normalize_many(queries)
+
+    assert cache.calls == ['get_many', 'set_many', 'get_many']
+    assert all(item.address is not None for item in results)
+    assert client.stats['hits'] == 20
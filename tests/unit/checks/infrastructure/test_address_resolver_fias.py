@@ -4,52 +4,40 @@ import pytest
 
 from checks.domain.value_objects.address import normalize_address_raw
 from checks.infrastructure.address_resolver_fias import FiasAddressResolver
+from checks.infrastructure.fias.client_stub import StubFiasClient
 from checks.infrastructure.fias.errors import FiasError
 
 pytestmark = pytest.mark.asyncio
 
 
-class _BaseDummyClient:
-    def __init__(self, *args, **kwargs):
-        """Поддерживает интерфейс реального клиента."""
+async def test_fias_resolver_marks_source_on_success() -> None:
+    """Найденный в ФИАС адрес получает source=fias."""
 
+    resolver = FiasAddressResolver(StubFiasClient())
+    raw = normalize_address_raw('г. Москва, ул. Тверская, д. 1')
+    normalized = await resolver.normalize(raw)
 
-async def test_fias_resolver_marks_source_on_success(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Успешный вызов клиента должен выставить source=fias."""
+    assert normalized.source == 'fias'
 
-    class DummyClient(_BaseDummyClient):
-        def search_address_item(self, value: str):
-            return {'value': value}
 
-    monkeypatch.setattr(
-        'checks.infrastructure.address_resolver_fias.FiasClient',
-        DummyClient,
-    )
+async def test_fias_resolver_keeps_stub_source_when_not_found() -> None:
+    """Адрес, не найденный в ФИАС, остаётся source=stub."""
 
-    resolver = FiasAddressResolver('https://test', 'token', 1.0)
-    raw = normalize_address_raw('г. Москва, ул. Тверская, д. 1')
+    resolver = FiasAddressResolver(StubFiasClient())
+    raw = normalize_address_raw('г. Казань, ул. Баумана, д. 3')
     normalized = await resolver.normalize(raw)
 
-    assert normalized.source == 'fias'
+    assert normalized.source == 'stub'
 
 
-async def test_fias_resolver_fallback_keeps_stub_source(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+async def test_fias_resolver_fallback_keeps_stub_source() -> None:
     """Ошибка клиента оставляет source=stub."""
 
-    class FailingClient(_BaseDummyClient):
-        def search_address_item(self, value: str):
-            raise FiasError(f'fail on {value}')
-
-    monkeypatch.setattr(
-        'checks.infrastructure.address_resolver_fias.FiasClient',
-        FailingClient,
-    )
+    class FailingClient:
+        async def normalize_address(self, query: str):
+            raise FiasError(f'fail on {query}')
 
-    resolver = FiasAddressResolver('https://test', 'token', 1.0)
+    resolver = FiasAddressResolver(FailingClient())
     raw = normalize_address_raw('г. Москва')
     normalized = await resolver.normalize(raw)
 
@@ -38,3 +38,17 @@ async def test_cache_entry_expires_after_ttl() -> None:
 
     clock.advance(2)
     assert await repo.get(key) is None
+
+
+async def test_cache_drops_expired_entries_on_write() -> None:
+    """Протухшие записи вытесняются без полного обхода на каждом вызове."""
+
+    clock = DummyClock()
+    repo = InMemoryCheckCacheRepo(ttl_seconds=1, now_fn=clock)
+
+    await repo.set('a', uuid4())
+    clock.advance(2)
+    await repo.set('b', uuid4())
+
+    assert repo.stats['size'] == 1
+    assert repo.stats['expirations'] == 1
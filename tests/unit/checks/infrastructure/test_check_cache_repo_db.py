@@ -0,0 +1,23 @@
+"""Проверки запроса кэша проверок в БД."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy.dialects import postgresql
+
+from checks.infrastructure.check_cache_repo_db import CheckCacheRepoDb
+
+
+def test_snapshot_lookup_is_single_joined_statement() -> None:
+    repo = CheckCacheRepoDb(
+        session_factory=None,
+        ttl_seconds=600,
+        cache_version='v2',
+    )
+
+    stmt = repo._snapshot_statement('key', datetime(2024, 1, 1, tzinfo=UTC))
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert 'JOIN check_results ON check_results.id = ' in sql
+    assert 'check_cache.cache_version = ' in sql
+    assert 'check_cache.expires_at > ' in sql
+    assert 'check_results.payload' in sql
@@ -0,0 +1,243 @@
+"""Проверки процессного уровня кэша проверок."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from checks.domain.entities.check_cache import CachedCheckEntry
+from checks.domain.entities.check_result import CheckResultSnapshot
+from checks.domain.value_objects.address import (
+    normalize_address,
+    normalize_address_raw,
+)
+from checks.infrastructure.check_cache_repo_inmemory import (
+    InMemoryCheckCacheRepo,
+)
+from checks.infrastructure.check_cache_tiered import (
+    TieredCheckCacheRepo,
+    TieredCheckResultsRepo,
+)
+from checks.infrastructure.check_results_repo_inmemory import (
+    InMemoryCheckResultsRepo,
+)
+from risks.application.scoring import build_risk_card
+
+pytestmark = pytest.mark.asyncio
+
+
+class DummyClock:
+    """Управляемые часы для тестов."""
+
+    def __init__(self) -> None:
+        self.value = datetime(2024, 1, 1, tzinfo=UTC)
+
+    def advance(self, seconds: int) -> None:
+        """Сместить время вперёд."""
+
+        self.value += timedelta(seconds=seconds)
+
+    def __call__(self) -> datetime:
+        """Вернуть текущее время."""
+
+        return self.value
+
+
+class CountingCacheRepo(InMemoryCheckCacheRepo):
+    """Считает обращения к нижнему уровню."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.gets = 0
+
+    async def get(self, key: str):
+        self.gets += 1
+        return await super().get(key)
+
+
+class CountingResultsRepo(InMemoryCheckResultsRepo):
+    """Считает обращения к нижнему уровню."""
+
+    __slots__ = ('gets',)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets = 0
+
+    async def get(self, check_id):
+        self.gets += 1
+        return await super().get(check_id)
+
+
+async def test_hot_key_is_served_from_memory() -> None:
+    clock = DummyClock()
+    inner = CountingCacheRepo(ttl_seconds=600, now_fn=clock)
+    repo = TieredCheckCacheRepo(
+        inner,
+        max_items=10,
+        ttl_seconds=60,
+        cache_version='v1',
+        now_fn=clock,
+    )
+    check_id = uuid4()
+
+    await repo.set('key', check_id)
+    first = await repo.get('key')
+    second = await repo.get('key')
+
+    assert first.check_id == check_id
+    assert second.check_id == check_id
+    assert inner.gets == 0
+    assert repo.stats['hits'] == 2
+
+
+async def test_local_entry_expires_and_falls_back_to_inner() -> None:
+    clock = DummyClock()
+    inner = CountingCacheRepo(ttl_seconds=600, now_fn=clock)
+    repo = TieredCheckCacheRepo(
+        inner,
+        max_items=10,
+        ttl_seconds=60,
+        cache_version='v1',
+        now_fn=clock,
+    )
+    check_id = uuid4()
+
+    await repo.set('key', check_id)
+    clock.advance(61)
+    entry = await repo.get('key')
+
+    assert entry.check_id == check_id
+    assert inner.gets == 1
+
+
+async def test_cache_version_separates_local_entries() -> None:
+    clock = DummyClock()
+    inner = CountingCacheRepo(ttl_seconds=600, now_fn=clock)
+    old = TieredCheckCacheRepo(
+        inner,
+        max_items=10,
+        ttl_seconds=60,
+        cache_version='v1',
+        now_fn=clock,
+    )
+    new = TieredCheckCacheRepo(
+        inner,
+        max_items=10,
+        ttl_seconds=60,
+        cache_version='v2',
+        now_fn=clock,
+    )
+
+    await old.set('key', uuid4())
+    await new.get('key')
+
+    assert new.stats['misses'] == 1
+    assert inner.gets == 1
+
+
+async def test_results_repo_keeps_bounded_snapshots() -> None:
+    inner = CountingResultsRepo()
+    repo = TieredCheckResultsRepo(inner, max_items=1)
+    normalized = normalize_address(normalize_address_raw('ул мира 7'))
+    snapshot = CheckResultSnapshot(
+        raw_input='ул мира 7',
+        normalized_address=normalized,
+        signals=[],
+        risk_card=build_risk_card(()),
+        created_at=datetime.now(UTC),
+    )
+
+    first_id = await repo.save(snapshot)
+    second_id = await repo.save(snapshot)
+
+    assert await repo.get(second_id) is snapshot
+    assert await repo.get(first_id) is snapshot
+    assert inner.gets == 1
+    assert repo.stats['evictions'] == 2
+
+
+class SnapshotCacheRepo:
+    """Нижний уровень, отдающий снимок одним вызовом."""
+
+    def __init__(self, entry, snapshot) -> None:
+        self._found = (entry, snapshot)
+        self.calls = 0
+
+    async def get_snapshot(self, key: str):
+        self.calls += 1
+        return self._found
+
+
+async def test_snapshot_lookup_is_served_from_memory() -> None:
+    clock = DummyClock()
+    normalized = normalize_address(normalize_address_raw('ул мира 7'))
+    snapshot = CheckResultSnapshot(
+        raw_input='ул мира 7',
+        normalized_address=normalized,
+        signals=[],
+        risk_card=build_risk_card(()),
+        created_at=clock(),
+    )
+    entry = CachedCheckEntry(
+        check_id=uuid4(),
+        created_at=clock(),
+        expires_at=clock() + timedelta(seconds=600),
+    )
+    inner = SnapshotCacheRepo(entry, snapshot)
+    repo = TieredCheckCacheRepo(
+        inner,
+        max_items=10,
+        ttl_seconds=60,
+        cache_version='v1',
+        now_fn=clock,
+    )
+
+    first = await repo.get_snapshot('key')
+    second = await repo.get_snapshot('key')
+
+    assert first == (entry, snapshot)
+    assert second == (entry, snapshot)
+    assert inner.calls == 1
+
+
+class SetOnlyCacheRepo(CountingCacheRepo):
+    """Нижний уровень, считающий чтения снимков."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.snapshot_calls = 0
+
+    async def get_snapshot(self, key: str):
+        self.snapshot_calls += 1
+        return await super().get_snapshot(key)
+
+
+async def test_snapshot_written_on_set_is_served_from_memory() -> None:
+    clock = DummyClock()
+    normalized = normalize_address(normalize_address_raw('ул мира 7'))
+    snapshot = CheckResultSnapshot(
+        raw_input='ул мира 7',
+        normalized_address=normalized,
+        signals=[],
+        risk_card=build_risk_card(()),
+        created_at=clock(),
+    )
+    check_id = uuid4()
+    inner = SetOnlyCacheRepo(ttl_seconds=600, now_fn=clock)
+    repo = TieredCheckCacheRepo(
+        inner,
+        max_items=10,
+        ttl_seconds=60,
+        cache_version='v1',
+        now_fn=clock,
+    )
+
+    await repo.set('key', check_id, snapshot=snapshot)
+    found = await repo.get_snapshot('key')
+
+    assert found is not None
+    assert found[0].check_id == check_id
+    assert found[1] is snapshot
+    assert inner.snapshot_calls == 0
+    assert inner.gets == 0
@@ -23,7 +23,10 @@ pytestmark = pytest.mark.asyncio
 
 
 class _ListingResolverStub:
-    def execute(self, url_text: str):
+    def canonical_key(self, url_text: str) -> None:
+        return None
+
+    async def execute(self, url_text: str):
         raise ListingNotSupportedError(url_text)
 
 
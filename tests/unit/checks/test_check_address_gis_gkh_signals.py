@@ -36,7 +36,7 @@ class _FiasClientStub:
 
 
 class _RosreestrResolverStub:
-    def execute(self, *, cadastral_number: str):
+    async def execute(self, *, cadastral_number: str):
         return None
 
 
@@ -25,7 +25,10 @@ pytestmark = pytest.mark.asyncio
 
 
 class _ListingResolverStub:
-    def execute(self, url_text: str):
+    def canonical_key(self, url_text: str) -> None:
+        return None
+
+    async def execute(self, url_text: str):
         raise ListingNotSupportedError(url_text)
 
 
@@ -46,7 +49,7 @@ class _RosreestrResolverStub:
         self._result = result
         self.calls: list[str] = []
 
-    def execute(self, *, cadastral_number: str):
+    async def execute(self, *, cadastral_number: str):
         self.calls.append(cadastral_number)
         return self._result
 
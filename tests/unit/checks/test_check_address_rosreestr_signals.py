@@ -31,7 +31,10 @@ class _ListingResolverStub:
         self.listing = listing
         self.calls: list[str] = []
 
-    def execute(self, url_text: str):
+    def canonical_key(self, url_text: str) -> None:
+        return None
+
+    async def execute(self, url_text: str):
         self.calls.append(url_text)
         return self.listing
 
@@ -53,7 +56,7 @@ class _RosreestrResolverStub:
     def __init__(self, result):
         self._result = result
 
-    def execute(self, *, cadastral_number: str):
+    async def execute(self, *, cadastral_number: str):
         return self._result
 
 
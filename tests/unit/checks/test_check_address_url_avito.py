@@ -35,7 +35,10 @@ class ListingResolverStub:
         self.listing = listing
         self.calls = 0
 
-    def execute(self, url_text: str) -> ListingNormalized:
+    def canonical_key(self, url_text: str) -> None:
+        return None
+
+    async def execute(self, url_text: str) -> ListingNormalized:
         self.calls += 1
         if self.listing is None:
             raise RuntimeError('no listing configured')
@@ -54,7 +57,7 @@ class FakeAddressRiskCheckUseCase:
         )
         self.called_with = None
 
-    async def execute(self, raw):
+    async def execute(self, raw, *, context=None):
         self.called_with = raw
         return self._result
 
@@ -101,7 +104,10 @@ async def test_listing_error_added_on_fetch_failure(monkeypatch) -> None:
     """Если провайдер падает, в ответе появляется listing_error."""
 
     class ErrorResolver:
-        def execute(self, url_text: str):
+        def canonical_key(self, url_text: str) -> None:
+            return None
+
+        async def execute(self, url_text: str):
             raise ListingFetchError('boom')
 
     resolver = ErrorResolver()
@@ -11,15 +11,15 @@ from checks.infrastructure.listing_resolver_container import (
 
 
 @pytest.fixture(autouse=True)
-def reset_container():
+async def reset_container():
     """Очистить контейнер перед и после теста."""
 
-    close_listing_resolver_container()
+    await close_listing_resolver_container()
     yield
-    close_listing_resolver_container()
+    await close_listing_resolver_container()
 
 
-def test_get_listing_resolver_returns_singleton() -> None:
+async def test_get_listing_resolver_returns_singleton() -> None:
     """Повторный вызов возвращает тот же объект."""
 
     first = get_listing_resolver_use_case()
@@ -27,10 +27,10 @@ def test_get_listing_resolver_returns_singleton() -> None:
     assert first is second
 
 
-def test_close_resets_singleton() -> None:
+async def test_close_resets_singleton() -> None:
     """После закрытия создаётся новый use-case."""
 
     first = get_listing_resolver_use_case()
-    close_listing_resolver_container()
+    await close_listing_resolver_container()
     second = get_listing_resolver_use_case()
     assert first is not second
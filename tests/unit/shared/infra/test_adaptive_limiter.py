@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from shared.infra.adaptive_limiter import AdaptiveConcurrencyLimiter
+
+
+def test_limiter_halves_on_overload_and_grows_back():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, min_limit=2)
+
+    limiter.record_overload()
+    assert limiter.limit == 4
+    limiter.record_overload()
+    limiter.record_overload()
+    assert limiter.limit == 2
+
+    for _ in range(10):
+        limiter.record_success(0.01)
+    assert 2 < limiter.limit <= 8
+
+
+def test_limiter_treats_slow_responses_as_overload():
+    limiter = AdaptiveConcurrencyLimiter(
+        max_limit=4,
+        latency_target_seconds=1.0,
+    )
+
+    limiter.record_success(5.0)
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_decreases_once_per_burst_of_overloads():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+    epochs = []
+
+    async def _work() -> None:
+        async with limiter.slot() as epoch:
+            epochs.append(epoch)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(_work() for _ in range(5)))
+    for epoch in epochs:
+        limiter.record_overload(epoch)
+    assert limiter.limit == 4
+
+    async with limiter.slot() as epoch:
+        pass
+    limiter.record_overload(epoch)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_in_flight_requests():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=2)
+    peak = 0
+
+    async def _work() -> None:
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(_work() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.in_flight == 0
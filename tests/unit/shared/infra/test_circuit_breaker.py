@@ -0,0 +1,80 @@
+from shared.infra.circuit_breaker import CircuitBreaker
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_after_threshold_and_fails_fast():
+    breaker = CircuitBreaker(name='test', failure_threshold=2, now_fn=_Clock())
+
+    breaker.record_failure()
+    assert breaker.allow() is True
+    breaker.record_failure()
+
+    assert breaker.state == 'open'
+    assert breaker.allow() is False
+
+
+def test_breaker_half_opens_and_recovers():
+    clock = _Clock()
+    breaker = CircuitBreaker(
+        name='test',
+        failure_threshold=1,
+        reset_timeout_seconds=10,
+        now_fn=clock,
+    )
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.state == 'half_open'
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    assert breaker.allow() is True
+
+
+def test_breaker_reopens_on_failed_probe():
+    clock = _Clock()
+    breaker = CircuitBreaker(
+        name='test',
+        failure_threshold=1,
+        reset_timeout_seconds=10,
+        now_fn=clock,
+    )
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow() is True
+
+    breaker.record_failure()
+
+    assert breaker.state == 'open'
+    clock.now = 15
+    assert breaker.allow() is False
+
+
+def test_breaker_reopens_on_abandoned_probe_and_ignores_closed_abandon():
+    clock = _Clock()
+    breaker = CircuitBreaker(
+        name='test',
+        failure_threshold=1,
+        reset_timeout_seconds=10,
+        now_fn=clock,
+    )
+    breaker.record_abandoned()
+    assert breaker.state == 'closed'
+
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow() is True
+    breaker.record_abandoned()
+
+    assert breaker.state == 'open'
+    clock.now = 20
+    assert breaker.allow() is True
@@ -0,0 +1,26 @@
+"""Проверка политики кэширования отрицательных ответов."""
+
+from shared.infra.negative_cache import NegativeCachePolicy
+
+
+def test_policy_returns_ttl_per_outcome() -> None:
+    policy = NegativeCachePolicy(
+        not_found_ttl_seconds=600,
+        blocked_ttl_seconds=120,
+        upstream_error_ttl_seconds=30,
+        jitter_ratio=0,
+    )
+
+    assert policy.ttl_for('not_found') == 600
+    assert policy.ttl_for('blocked') == 120
+    assert policy.ttl_for('upstream_error') == 30
+
+
+def test_policy_applies_bounded_jitter() -> None:
+    policy = NegativeCachePolicy(
+        not_found_ttl_seconds=100,
+        jitter_ratio=0.2,
+        jitter_fn=lambda low, high: high,
+    )
+
+    assert policy.ttl_for('not_found') == 120
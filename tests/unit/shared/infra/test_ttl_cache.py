@@ -0,0 +1,72 @@
+"""Проверка общего TTL-кэша."""
+
+from shared.infra.ttl_cache import TtlCache
+
+
+def _cache(now: list[float], **kwargs) -> TtlCache:
+    kwargs.setdefault('max_items', 10)
+    kwargs.setdefault('ttl_seconds', 10)
+    return TtlCache(now_fn=lambda: now[0], **kwargs)
+
+
+def test_expired_entries_are_dropped_without_access() -> None:
+    now = [0.0]
+    cache = _cache(now)
+
+    cache.set('a', 1)
+    cache.set('b', 2, ttl_seconds=100)
+    now[0] = 11.0
+    cache.set('c', 3)
+
+    assert len(cache) == 2
+    assert cache.get('b') == 2
+    assert cache.stats.expirations == 1
+
+
+def test_overwrite_keeps_latest_expiry() -> None:
+    now = [0.0]
+    cache = _cache(now)
+
+    cache.set('a', 1)
+    now[0] = 5.0
+    cache.set('a', 2)
+    now[0] = 12.0
+
+    assert cache.get('a') == 2
+    assert cache.stats.expirations == 0
+
+
+def test_byte_limit_evicts_least_recently_used() -> None:
+    now = [0.0]
+    cache = _cache(now, max_bytes=10)
+
+    cache.set('a', 'xxxx')
+    cache.set('b', 'yyyy')
+    assert cache.get('a') == 'xxxx'
+    cache.set('c', 'zzzz')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 'xxxx'
+    assert cache.size_bytes == 8
+    assert cache.stats.evictions == 1
+
+
+def test_oversized_value_is_rejected() -> None:
+    now = [0.0]
+    cache = _cache(now, max_bytes=4)
+
+    cache.set('a', 'too long')
+
+    assert cache.get('a') is None
+    assert cache.stats.rejections == 1
+
+
+def test_heap_is_compacted_on_repeated_overwrites() -> None:
+    now = [0.0]
+    cache = _cache(now, max_items=2, ttl_seconds=1000)
+
+    for step in range(1000):
+        cache.set(step % 2, step)
+
+    assert len(cache._heap) <= 64
+    assert cache.snapshot_stats()['size'] == 2
@@ -4,7 +4,11 @@ from types import SimpleNamespace
 
 import pytest
 
-from shared.kernel.kad_arbitr_client_factory import build_kad_arbitr_client
+from shared.kernel.kad_arbitr_client_factory import (
+    build_kad_arbitr_client,
+    get_kad_arbitr_client,
+    shutdown_kad_arbitr_client,
+)
 from sources.kad_arbitr.stub_client import StubKadArbitrClient
 
 
@@ -77,3 +81,27 @@ def test_build_unknown_mode_raises_value_error() -> None:
     )
     with pytest.raises(ValueError):
         build_kad_arbitr_client(settings=settings)
+
+
+@pytest.mark.asyncio
+async def test_get_kad_arbitr_client_returns_shared_instance() -> None:
+    settings = SimpleNamespace(
+        KAD_ARBITR_MODE='xhr',
+        KAD_ARBITR_BASE_URL='https://example.com',
+        KAD_ARBITR_TIMEOUT_SECONDS=15,
+        KAD_ARBITR_SSL_VERIFY=True,
+        KAD_ARBITR_USER_AGENT=None,
+        KAD_ARBITR_RATE_LIMIT_SECONDS=0.0,
+        KAD_ARBITR_CACHE_ENABLED=False,
+        KAD_ARBITR_CACHE_MAX_ITEMS=16,
+        KAD_ARBITR_CACHE_TTL_SECONDS=60,
+    )
+
+    first = get_kad_arbitr_client(settings=settings)
+    second = get_kad_arbitr_client(settings=settings)
+    await shutdown_kad_arbitr_client()
+    third = get_kad_arbitr_client(settings=settings)
+    await shutdown_kad_arbitr_client()
+
+    assert first is second
+    assert third is not first
@@ -0,0 +1,60 @@
+"""Тест кэша отрицательных ответов GIS ЖКХ."""
+
+import pytest
+
+from shared.infra.negative_cache import NegativeCachePolicy
+from sources.gis_gkh.cached_client import CachedGisGkhClient
+from sources.gis_gkh.exceptions import GisGkhBlockedError
+from sources.gis_gkh.models import GisGkhHouseNormalized
+
+pytestmark = pytest.mark.asyncio
+
+
+class _CountingClient:
+    def __init__(self, result=None, error: Exception | None = None) -> None:
+        self._result = result or []
+        self._error = error
+        self.calls = 0
+
+    async def search_by_cadnum(self, *, cadnum: str, region_code: str):
+        self.calls += 1
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+def _cached(inner: _CountingClient) -> CachedGisGkhClient:
+    return CachedGisGkhClient(
+        inner=inner,
+        policy=NegativeCachePolicy(jitter_ratio=0),
+        max_items=10,
+    )
+
+
+async def test_cached_client_remembers_empty_result():
+    inner = _CountingClient()
+    client = _cached(inner)
+
+    assert await client.search_by_cadnum(cadnum='1:2', region_code='77') == []
+    assert await client.search_by_cadnum(cadnum='1:2', region_code='77') == []
+    assert inner.calls == 1
+
+
+async def test_cached_client_replays_blocked_error():
+    inner = _CountingClient(error=GisGkhBlockedError('challenge'))
+    client = _cached(inner)
+
+    for _ in range(2):
+        with pytest.raises(GisGkhBlockedError):
+            await client.search_by_cadnum(cadnum='1:2', region_code='77')
+    assert inner.calls == 1
+
+
+async def test_cached_client_does_not_cache_found_houses():
+    house = GisGkhHouseNormalized(cadastral_number='1:2')
+    inner = _CountingClient(result=[house])
+    client = _cached(inner)
+
+    await client.search_by_cadnum(cadnum='1:2', region_code='77')
+    await client.search_by_cadnum(cadnum='1:2', region_code='77')
+    assert inner.calls == 2
@@ -25,4 +25,17 @@ def test_factory_returns_playwright_client() -> None:
         GIS_GKH_SSL_VERIFY=True,
     )
     client = build_gis_gkh_client(settings)
+    assert client.__class__.__name__ == 'CachedGisGkhClient'
+    assert client.inner.__class__.__name__ == 'PlaywrightGisGkhClient'
+
+
+def test_factory_skips_negative_cache_when_disabled() -> None:
+    settings = SimpleNamespace(
+        GIS_GKH_MODE='playwright',
+        GIS_GKH_TIMEOUT_SECONDS=60,
+        GIS_GKH_HEADLESS=True,
+        GIS_GKH_SSL_VERIFY=True,
+        NEGATIVE_CACHE_ENABLED=False,
+    )
+    client = build_gis_gkh_client(settings)
     assert client.__class__.__name__ == 'PlaywrightGisGkhClient'
@@ -0,0 +1,239 @@
+"""Тест пула контекстов Playwright-клиента GIS ЖКХ."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from sources.gis_gkh import playwright_client
+from sources.gis_gkh.playwright_client import PlaywrightGisGkhClient
+
+pytestmark = pytest.mark.asyncio
+
+_CHALLENGE = '<html>Challenge=1 ChallengeId=2</html>'
+
+
+class _FakeResponse:
+    def __init__(self, body: str) -> None:
+        self.status = 200
+        self._body = body
+
+    async def text(self) -> str:
+        return self._body
+
+
+class _FakeRequest:
+    def __init__(self, browser: '_FakeBrowser') -> None:
+        self._browser = browser
+
+    async def post(self, url, **kwargs) -> _FakeResponse:
+        self._browser.posts += 1
+        self._browser.active += 1
+        self._browser.max_active = max(
+            self._browser.max_active,
+            self._browser.active,
+        )
+        await asyncio.sleep(0.01)
+        self._browser.active -= 1
+        if self._browser.bodies:
+            return _FakeResponse(self._browser.bodies.pop(0))
+        return _FakeResponse(json.dumps({'items': []}))
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def goto(self, url, **kwargs) -> None:
+        return None
+
+    async def wait_for_timeout(self, timeout) -> None:
+        return None
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self, browser: '_FakeBrowser') -> None:
+        self.request = _FakeRequest(browser)
+        self.closed = False
+
+    async def new_page(self) -> _FakePage:
+        return _FakePage()
+
+    async def cookies(self, url) -> list[dict[str, str]]:
+        return [{'name': 'session', 'value': str(id(self))}]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.contexts: list[_FakeContext] = []
+        self.bodies: list[str] = []
+        self.posts = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def new_context(self, **kwargs) -> _FakeContext:
+        context = _FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        return None
+
+
+class _FakePlaywright:
+    def __init__(self, browser: _FakeBrowser) -> None:
+        self.chromium = self
+        self._browser = browser
+
+    async def launch(self, **kwargs) -> _FakeBrowser:
+        return self._browser
+
+    async def stop(self) -> None:
+        return None
+
+
+@pytest.fixture
+def browser(monkeypatch) -> _FakeBrowser:
+    browser = _FakeBrowser()
+
+    class _Starter:
+        async def start(self) -> _FakePlaywright:
+            return _FakePlaywright(browser)
+
+    monkeypatch.setattr(playwright_client, 'async_playwright', _Starter)
+    return browser
+
+
+async def test_warmup_prepares_every_context(browser) -> None:
+    client = PlaywrightGisGkhClient(pool_size=3, settle_ms=0)
+
+    await client.warmup()
+
+    assert len(browser.contexts) == 3
+    await client.close()
+
+
+async def test_warmup_requeues_slots_after_all_recycles_finish(
+    browser,
+    monkeypatch,
+) -> None:
+    client = PlaywrightGisGkhClient(pool_size=2, settle_ms=0)
+    recycle = client._recycle
+    finished: list[object] = []
+
+    async def _recycle(slot) -> None:
+        if not finished:
+            finished.append(None)
+            raise RuntimeError('landing failed')
+        await asyncio.sleep(0.01)
+        await recycle(slot)
+        finished.append(slot)
+
+    monkeypatch.setattr(client, '_recycle', _recycle)
+
+    with pytest.raises(RuntimeError):
+        await client.warmup()
+
+    assert len(finished) == 2
+    assert client._pool.qsize() == 2
+    assert [slot.stale for slot in client._slots].count(True) == 1
+    await client.close()
+
+
+async def test_concurrent_searches_use_separate_contexts(browser) -> None:
+    client = PlaywrightGisGkhClient(pool_size=2, settle_ms=0)
+
+    await asyncio.gather(
+        *(
+            client.search_by_cadnum(cadnum='77:01:1', region_code='77')
+            for _ in range(4)
+        ),
+    )
+
+    assert browser.posts == 4
+    assert browser.max_active == 2
+    assert len(browser.contexts) == 2
+    await client.close()
+
+
+async def test_context_is_recycled_after_request_limit(browser) -> None:
+    client = PlaywrightGisGkhClient(
+        pool_size=1,
+        max_requests_per_context=2,
+        settle_ms=0,
+    )
+
+    for _ in range(3):
+        await client.search_by_cadnum(cadnum='77:01:1', region_code='77')
+
+    assert len(browser.contexts) == 2
+    assert browser.contexts[0].closed is True
+    await client.close()
+
+
+async def test_context_is_recycled_after_challenge(browser) -> None:
+    browser.bodies = [_CHALLENGE]
+    client = PlaywrightGisGkhClient(pool_size=1, settle_ms=0)
+
+    await client.search_by_cadnum(cadnum='77:01:1', region_code='77')
+    await client.search_by_cadnum(cadnum='77:01:1', region_code='77')
+
+    assert len(browser.contexts) == 2
+    await client.close()
+
+
+async def test_direct_http_uses_browser_cookies(browser) -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={'items': [{'cadastreNumber': '1'}]})
+
+    client = PlaywrightGisGkhClient(
+        pool_size=1,
+        settle_ms=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    result = await client.search_by_cadnum(cadnum='77:01:1', region_code='77')
+
+    assert len(result) == 1
+    assert browser.posts == 0
+    assert seen[0].headers['Cookie'].startswith('session=')
+    await client.close()
+
+
+async def test_direct_http_falls_back_to_browser_on_challenge(browser) -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(200, text=_CHALLENGE)
+        return httpx.Response(200, json={'items': []})
+
+    client = PlaywrightGisGkhClient(
+        pool_size=1,
+        settle_ms=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    await client.search_by_cadnum(cadnum='77:01:1', region_code='77')
+    await client.search_by_cadnum(cadnum='77:01:1', region_code='77')
+
+    assert browser.posts == 1
+    assert len(calls) == 2
+    await client.close()
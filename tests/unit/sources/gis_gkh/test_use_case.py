@@ -1,7 +1,10 @@
 """Тест use-case GIS ЖКХ."""
 
+import asyncio
+
 import pytest
 
+from shared.infra.json_cache import InMemoryJsonCache
 from sources.gis_gkh.models import GisGkhHouseNormalized
 from sources.gis_gkh.stub_client import StubGisGkhClient
 from sources.gis_gkh.use_cases.resolve_house_by_cadastral import (
@@ -43,3 +46,82 @@ async def test_use_case_returns_none_for_miss():
     )
 
     assert result is None
+
+
+class _CountingClient:
+    def __init__(self, houses: list[GisGkhHouseNormalized]) -> None:
+        self.houses = houses
+        self.calls = 0
+
+    async def search_by_cadnum(
+        self,
+        *,
+        cadnum: str,
+        region_code: str,
+    ) -> list[GisGkhHouseNormalized]:
+        self.calls += 1
+        return [self.houses[min(self.calls, len(self.houses)) - 1]]
+
+
+async def test_use_case_serves_cached_house():
+    house = GisGkhHouseNormalized(
+        cadastral_number='77:01:000101:1',
+        address='г. Москва, ул. Тверская, д. 1',
+        floors=9,
+    )
+    client = _CountingClient([house])
+    use_case = ResolveGisGkhHouseByCadastralUseCase(
+        client=client,
+        cache=InMemoryJsonCache(),
+        ttl_seconds=60,
+    )
+
+    first = await use_case.execute(
+        cadastral_number='77:01:000101:1',
+        region_code='77',
+    )
+    second = await use_case.execute(
+        cadastral_number='77:01:000101:1',
+        region_code='77',
+    )
+
+    assert client.calls == 1
+    assert first is house
+    assert second == house
+
+
+async def test_use_case_refreshes_stale_house_in_background():
+    now = [1000.0]
+    old = GisGkhHouseNormalized(
+        cadastral_number='77:01:000101:1', address='old'
+    )
+    new = GisGkhHouseNormalized(
+        cadastral_number='77:01:000101:1', address='new'
+    )
+    client = _CountingClient([old, new])
+    cache = InMemoryJsonCache(now_fn=lambda: now[0])
+    use_case = ResolveGisGkhHouseByCadastralUseCase(
+        client=client,
+        cache=cache,
+        ttl_seconds=60,
+        stale_seconds=60,
+        now_fn=lambda: now[0],
+    )
+    await use_case.execute(cadastral_number='77:01:000101:1', region_code='77')
+
+    now[0] += 90
+    stale = await use_case.execute(
+        cadastral_number='77:01:000101:1',
+        region_code='77',
+    )
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    fresh = await use_case.execute(
+        cadastral_number='77:01:000101:1',
+        region_code='77',
+    )
+
+    assert stale.address == 'old'
+    assert fresh.address == 'new'
+    assert client.calls == 2
+    await use_case.close()
@@ -0,0 +1,208 @@
+"""Проверка извлечения текста PDF в пуле процессов."""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from sources.kad_arbitr.exceptions import KadArbitrPdfExtractionError
+from sources.kad_arbitr.pdf import process_pool_extractor
+from sources.kad_arbitr.pdf.process_pool_extractor import (
+    ProcessPoolPdfTextExtractor,
+)
+
+
+@pytest.mark.asyncio
+async def test_extractor_passes_max_pages_to_worker(monkeypatch) -> None:
+    seen: list[tuple[bytes, int | None]] = []
+
+    def _worker(
+        pdf_bytes: bytes,
+        max_pages: int | None,
+        timeout_seconds: float | None,
+    ) -> str:
+        seen.append((pdf_bytes, max_pages))
+        return 'текст'
+
+    monkeypatch.setattr(
+        process_pool_extractor, 'extract_text_in_worker', _worker
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        extractor = ProcessPoolPdfTextExtractor(
+            max_pages=3,
+            executor=executor,
+        )
+        text = await extractor.extract_text(pdf_bytes=b'pdf')
+
+    assert text == 'текст'
+    assert seen == [(b'pdf', 3)]
+    assert extractor.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_extractor_times_out_and_counts_job_until_it_finishes(
+    monkeypatch,
+) -> None:
+    release = threading.Event()
+    finished = threading.Event()
+
+    def _worker(
+        pdf_bytes: bytes,
+        max_pages: int | None,
+        timeout_seconds: float | None,
+    ) -> str:
+        release.wait(timeout=1.0)
+        finished.set()
+        return ''
+
+    monkeypatch.setattr(
+        process_pool_extractor, 'extract_text_in_worker', _worker
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        extractor = ProcessPoolPdfTextExtractor(
+            timeout_seconds=0.01,
+            max_queue_depth=1,
+            executor=executor,
+        )
+        with pytest.raises(KadArbitrPdfExtractionError, match='timed out'):
+            await extractor.extract_text(pdf_bytes=b'pdf')
+
+        assert extractor.pending == 1
+        with pytest.raises(KadArbitrPdfExtractionError, match='queue'):
+            await extractor.extract_text(pdf_bytes=b'pdf')
+        release.set()
+
+    assert finished.is_set()
+    assert extractor.pending == 0
+
+
+def test_worker_enforces_its_own_deadline(monkeypatch) -> None:
+    class _HangingExtractor:
+        def __init__(self, **kwargs) -> None:
+            pass
+
+        def extract_text(self, *, pdf_bytes: bytes) -> str:
+            try:
+                time.sleep(5)
+            except Exception:
+                return 'swallowed'
+            return 'late'
+
+    monkeypatch.setattr(
+        process_pool_extractor,
+        'CompositePdfTextExtractor',
+        _HangingExtractor,
+    )
+
+    started = time.monotonic()
+    with pytest.raises(KadArbitrPdfExtractionError, match='worker'):
+        process_pool_extractor.extract_text_in_worker(b'pdf', 1, 0.05)
+
+    assert time.monotonic() - started < 2
+
+
+@pytest.mark.asyncio
+async def test_extractor_rebuilds_broken_pool(monkeypatch) -> None:
+    created: list[object] = []
+
+    class _Pool(ThreadPoolExecutor):
+        def __init__(self, max_workers: int, mp_context=None) -> None:
+            super().__init__(max_workers=max_workers)
+            self.broken = not created
+            created.append(self)
+
+        def submit(self, fn, /, *args, **kwargs):
+            if self.broken:
+                raise BrokenProcessPool('worker died')
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(process_pool_extractor, 'ProcessPoolExecutor', _Pool)
+    monkeypatch.setattr(
+        process_pool_extractor,
+        'extract_text_in_worker',
+        lambda pdf_bytes, max_pages, timeout_seconds: 'текст',
+    )
+    extractor = ProcessPoolPdfTextExtractor(max_workers=1)
+    try:
+        with pytest.raises(KadArbitrPdfExtractionError, match='broken'):
+            await extractor.extract_text(pdf_bytes=b'pdf')
+
+        text = await extractor.extract_text(pdf_bytes=b'pdf')
+    finally:
+        extractor.shutdown()
+
+    assert text == 'текст'
+    assert len(created) == 2
+    assert extractor.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_extractor_pool_does_not_fork(monkeypatch) -> None:
+    contexts: list[object] = []
+
+    class _Pool(ThreadPoolExecutor):
+        def __init__(self, max_workers: int, mp_context=None) -> None:
+            super().__init__(max_workers=max_workers)
+            contexts.append(mp_context)
+
+    monkeypatch.setattr(process_pool_extractor, 'ProcessPoolExecutor', _Pool)
+    monkeypatch.setattr(
+        process_pool_extractor,
+        'extract_text_in_worker',
+        lambda pdf_bytes, max_pages, timeout_seconds: 'текст',
+    )
+    extractor = ProcessPoolPdfTextExtractor(max_workers=1)
+    try:
+        await extractor.extract_text(pdf_bytes=b'pdf')
+    finally:
+        extractor.shutdown()
+
+    assert len(contexts) == 1
+    assert contexts[0].get_start_method() in {'forkserver', 'spawn'}
+
+
+@pytest.mark.asyncio
+async def test_extractor_rejects_when_queue_is_full() -> None:
+    extractor = ProcessPoolPdfTextExtractor(max_queue_depth=0)
+
+    with pytest.raises(KadArbitrPdfExtractionError):
+        await extractor.extract_text(pdf_bytes=b'pdf')
+
+
+def test_worker_returns_empty_text_for_broken_pdf() -> None:
+    text = process_pool_extractor.extract_text_in_worker(b'not a pdf', 1)
+
+    assert text == ''
+
+
+@pytest.mark.asyncio
+async def test_extractor_rebuilds_pool_after_worker_crash(monkeypatch) -> None:
+    created: list[object] = []
+
+    class _CrashingPool(ThreadPoolExecutor):
+        def __init__(self, max_workers: int, mp_context=None) -> None:
+            super().__init__(max_workers=max_workers)
+            created.append(self)
+
+        def submit(self, fn, /, *args, **kwargs):
+            future = Future()
+            future.set_exception(BrokenProcessPool('worker died'))
+            return future
+
+    monkeypatch.setattr(
+        process_pool_extractor,
+        'ProcessPoolExecutor',
+        _CrashingPool,
+    )
+    extractor = ProcessPoolPdfTextExtractor(max_workers=1)
+    try:
+        for _ in range(2):
+            with pytest.raises(KadArbitrPdfExtractionError, match='crashed'):
+                await extractor.extract_text(pdf_bytes=b'pdf')
+    finally:
+        extractor.shutdown()
+
+    assert len(created) == 2
+    assert extractor.pending == 0
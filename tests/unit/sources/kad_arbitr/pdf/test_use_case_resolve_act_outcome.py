@@ -2,6 +2,7 @@
 
 import pytest
 
+from sources.kad_arbitr.exceptions import KadArbitrPdfExtractionError
 from sources.kad_arbitr.models import KadArbitrJudicialActNormalized
 from sources.kad_arbitr.use_cases.resolve_act_outcome import (
     ResolveKadArbitrActOutcome,
@@ -80,3 +81,44 @@ async def test_resolve_act_outcome_truncates_text() -> None:
     assert result.outcome == 'denied'
     assert result.extracted_text is not None
     assert len(result.extracted_text) <= 30_000
+
+
+async def test_resolve_act_outcome_with_async_extractor() -> None:
+    class _AsyncExtractor:
+        async def extract_text(self, *, pdf_bytes: bytes) -> str:
+            return 'В удовлетворении отказать. ' + ('текст ' * 50)
+
+    act = KadArbitrJudicialActNormalized(
+        act_id='act-4',
+        act_type='decision',
+        pdf_url='https://kad.arbitr.ru/Document/Pdf/4',
+    )
+    use_case = ResolveKadArbitrActOutcome(
+        fetcher=_StubFetcher(),
+        text_extractor=_AsyncExtractor(),
+    )
+
+    result = await use_case.execute(act=act)
+
+    assert result.outcome == 'denied'
+
+
+async def test_resolve_act_outcome_extraction_failure_is_unknown() -> None:
+    class _FailingExtractor:
+        async def extract_text(self, *, pdf_bytes: bytes) -> str:
+            raise KadArbitrPdfExtractionError('pdf extraction timed out')
+
+    act = KadArbitrJudicialActNormalized(
+        act_id='act-5',
+        act_type='decision',
+        pdf_url='https://kad.arbitr.ru/Document/Pdf/5',
+    )
+    use_case = ResolveKadArbitrActOutcome(
+        fetcher=_StubFetcher(),
+        text_extractor=_FailingExtractor(),
+    )
+
+    result = await use_case.execute(act=act)
+
+    assert result.outcome == 'unknown'
+    assert result.reason == 'pdf extraction timed out'
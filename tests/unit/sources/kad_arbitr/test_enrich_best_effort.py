@@ -1,5 +1,6 @@
 """Проверка best-effort обогащения дел kad.arbitr.ru."""
 
+import asyncio
 from datetime import date
 
 import pytest
@@ -125,3 +126,28 @@ async def test_enrich_best_effort_blocked() -> None:
 
     assert result.facts.status == 'blocked'
     assert result.facts.cases == []
+
+
+async def test_enrich_blocked_cancels_in_flight_cases() -> None:
+    cancelled: list[str] = []
+
+    class _SlowOutcomeStub(_OutcomeStub):
+        async def execute(self, *, case_id: str):
+            try:
+                await asyncio.sleep(1.0)
+            except asyncio.CancelledError:
+                cancelled.append(case_id)
+                raise
+            return await super().execute(case_id=case_id)
+
+    use_case = EnrichKadArbitrCasesForParticipant(
+        search_uc=_SearchStub(),
+        details_uc=_ParticipantsBlockedStub(),
+        case_outcome_uc=_SlowOutcomeStub(),
+        max_concurrency=3,
+    )
+
+    result = await use_case.execute(participant='ООО Ромашка', max_cases=3)
+
+    assert result.facts.status == 'blocked'
+    assert sorted(cancelled) == ['1', '3']
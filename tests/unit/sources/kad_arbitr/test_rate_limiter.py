@@ -1,5 +1,7 @@
 """Проверка ограничителя частоты запросов."""
 
+import asyncio
+
 import pytest
 
 from sources.kad_arbitr.throttling import RateLimiter
@@ -41,3 +43,24 @@ async def test_rate_limiter_waits_when_needed() -> None:
     await limiter.wait()
 
     assert calls == [0.9]
+
+
+async def test_rate_limiter_serializes_concurrent_waits() -> None:
+    calls: list[float] = []
+    clock = {'now': 0.0}
+
+    async def _sleep(value: float) -> None:
+        calls.append(value)
+        await asyncio.sleep(0)
+        clock['now'] += value
+
+    limiter = RateLimiter(
+        min_interval_seconds=1.0,
+        now_fn=lambda: clock['now'],
+        sleep_fn=_sleep,
+    )
+
+    await asyncio.gather(limiter.wait(), limiter.wait(), limiter.wait())
+
+    assert calls == [1.0, 1.0]
+    assert clock['now'] == 2.0
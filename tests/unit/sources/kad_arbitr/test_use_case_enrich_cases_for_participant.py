@@ -1,5 +1,6 @@
 """Проверка use-case обогащения дел kad.arbitr.ru."""
 
+import asyncio
 from datetime import date
 
 import pytest
@@ -149,3 +150,30 @@ async def test_enrich_cases_selects_debtor_role() -> None:
 
     assert result.facts.cases[0].target_role == 'debtor'
     assert result.facts.cases[0].target_role_group == 'defendant_like'
+
+
+async def test_enrich_cases_runs_concurrently_and_keeps_order() -> None:
+    class _SlowFirstOutcomeStub(_OutcomeStub):
+        def __init__(self) -> None:
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def execute(self, *, case_id: str):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.02 if case_id == '2' else 0)
+            self.in_flight -= 1
+            return await super().execute(case_id=case_id)
+
+    outcome_stub = _SlowFirstOutcomeStub()
+    use_case = EnrichKadArbitrCasesForParticipant(
+        search_uc=_SearchStub(),
+        details_uc=_ParticipantsStub(),
+        case_outcome_uc=outcome_stub,
+        max_concurrency=2,
+    )
+
+    result = await use_case.execute(participant='ООО Ромашка', max_cases=2)
+
+    assert outcome_stub.max_in_flight == 2
+    assert [case.case_id for case in result.facts.cases] == ['2', '1']
@@ -1,5 +1,7 @@
 """Проверка XHR клиента kad.arbitr.ru."""
 
+import asyncio
+
 import httpx
 import pytest
 
@@ -92,3 +94,69 @@ async def test_search_instances_html_raises_unexpected_response() -> None:
             await client.search_instances(payload=KadArbitrSearchPayload())
 
     assert 'snippet=' in str(exc.value)
+
+
+async def test_concurrent_requests_share_single_warmup() -> None:
+    calls = {'get': 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == 'GET':
+            calls['get'] += 1
+            return httpx.Response(200, text='ok')
+        return httpx.Response(
+            200,
+            json={'Items': [], 'Total': 0, 'Page': 1, 'Pages': 1},
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(
+        base_url='https://kad.arbitr.ru',
+        transport=transport,
+    ) as http_client:
+        client = XhrKadArbitrClient(client=http_client)
+        await asyncio.gather(
+            *(
+                client.search_instances(payload=KadArbitrSearchPayload())
+                for _ in range(3)
+            )
+        )
+
+    assert calls['get'] == 1
+
+
+async def test_warmup_repeats_after_block_and_expiry() -> None:
+    calls = {'get': 0}
+    responses = iter([403, 200, 200])
+    clock = {'now': 0.0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == 'GET':
+            calls['get'] += 1
+            return httpx.Response(200, text='ok')
+        status = next(responses)
+        if status == 403:
+            return httpx.Response(403, text='blocked')
+        return httpx.Response(
+            200,
+            json={'Items': [], 'Total': 0, 'Page': 1, 'Pages': 1},
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(
+        base_url='https://kad.arbitr.ru',
+        transport=transport,
+    ) as http_client:
+        client = XhrKadArbitrClient(
+            client=http_client,
+            warmup_ttl_seconds=60,
+            now_fn=lambda: clock['now'],
+        )
+        with pytest.raises(KadArbitrBlockedError):
+            await client.search_instances(payload=KadArbitrSearchPayload())
+        await client.search_instances(payload=KadArbitrSearchPayload())
+        assert calls['get'] == 2
+
+        clock['now'] = 120.0
+        await client.search_instances(payload=KadArbitrSearchPayload())
+
+    assert calls['get'] == 3
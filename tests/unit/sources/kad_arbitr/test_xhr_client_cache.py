@@ -1,9 +1,13 @@
 """Проверка кэширования в XhrKadArbitrClient."""
 
+import asyncio
+
 import httpx
 import pytest
 
+from shared.infra.negative_cache import NegativeCachePolicy
 from sources.kad_arbitr.cache import LruTtlCache
+from sources.kad_arbitr.exceptions import KadArbitrBlockedError
 from sources.kad_arbitr.models import KadArbitrSearchPayload
 from sources.kad_arbitr.throttling import RateLimiter
 from sources.kad_arbitr.xhr_client import XhrKadArbitrClient
@@ -63,3 +67,107 @@ async def test_xhr_client_uses_cache_for_card_and_search() -> None:
     assert calls['/Kad/SearchInstances'] == 1
 
     await async_client.aclose()
+
+
+async def test_xhr_client_shares_case_page_between_card_and_acts() -> None:
+    calls = {'/': 0, '/Card/123': 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.path] = calls.get(request.url.path, 0) + 1
+        if request.url.path == '/':
+            return httpx.Response(200, text='ok')
+        body = '<html>' + ('x' * 220) + '</html>'
+        return httpx.Response(200, text=body)
+
+    transport = httpx.MockTransport(handler)
+    async_client = httpx.AsyncClient(
+        base_url='https://kad.arbitr.ru',
+        transport=transport,
+    )
+    client = XhrKadArbitrClient(
+        client=async_client,
+        cache=LruTtlCache(max_items=10, ttl_seconds=60),
+    )
+
+    card_html = await client.get_case_card_html(case_id='123')
+    acts_html = await client.get_case_acts_html(case_id='123')
+
+    assert card_html == acts_html
+    assert calls['/Card/123'] == 1
+
+    await async_client.aclose()
+
+
+async def test_xhr_client_coalesces_concurrent_case_page_requests() -> None:
+    calls = {'/Card/123': 0}
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == '/':
+            return httpx.Response(200, text='ok')
+        calls['/Card/123'] += 1
+        await release.wait()
+        body = '<html>' + ('x' * 220) + '</html>'
+        return httpx.Response(200, text=body)
+
+    transport = httpx.MockTransport(handler)
+    async_client = httpx.AsyncClient(
+        base_url='https://kad.arbitr.ru',
+        transport=transport,
+    )
+    client = XhrKadArbitrClient(client=async_client)
+
+    pending = asyncio.gather(
+        client.get_case_card_html(case_id='123'),
+        client.get_case_acts_html(case_id='123'),
+    )
+    await asyncio.sleep(0.01)
+    release.set()
+    card_html, acts_html = await pending
+
+    assert card_html == acts_html
+    assert calls['/Card/123'] == 1
+
+    await async_client.aclose()
+
+
+async def test_xhr_client_caches_empty_search_and_block_briefly() -> None:
+    now = [0.0]
+    calls = {'/Kad/SearchInstances': 0}
+    status = [200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == '/':
+            return httpx.Response(200, text='ok')
+        calls['/Kad/SearchInstances'] += 1
+        if status[0] == 403:
+            return httpx.Response(403, text='blocked')
+        return httpx.Response(200, json={'Items': []})
+
+    async_client = httpx.AsyncClient(
+        base_url='https://kad.arbitr.ru',
+        transport=httpx.MockTransport(handler),
+    )
+    client = XhrKadArbitrClient(
+        client=async_client,
+        cache=LruTtlCache(max_items=10, ttl_seconds=900, now_fn=lambda: now[0]),
+        negative_cache_policy=NegativeCachePolicy(
+            not_found_ttl_seconds=60,
+            blocked_ttl_seconds=30,
+            jitter_ratio=0,
+        ),
+    )
+
+    payload = KadArbitrSearchPayload()
+    await client.search_instances(payload=payload)
+    await client.search_instances(payload=payload)
+    assert calls['/Kad/SearchInstances'] == 1
+
+    now[0] = 61.0
+    status[0] = 403
+    for _ in range(2):
+        with pytest.raises(KadArbitrBlockedError):
+            await client.search_instances(payload=payload)
+    assert calls['/Kad/SearchInstances'] == 2
+
+    await async_client.aclose()
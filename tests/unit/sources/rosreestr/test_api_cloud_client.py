@@ -1,5 +1,8 @@
 """Проверка ApiCloudRosreestrClient."""
 
+import asyncio
+
+import httpx
 import pytest
 
 from sources.rosreestr.api_cloud_client import ApiCloudRosreestrClient
@@ -9,3 +12,53 @@ from sources.rosreestr.exceptions import RosreestrClientError
 def test_api_cloud_client_requires_token():
     with pytest.raises(RosreestrClientError):
         ApiCloudRosreestrClient(token=None)
+
+
+def _client(handler, **kwargs) -> ApiCloudRosreestrClient:
+    kwargs.setdefault('retries', 2)
+    return ApiCloudRosreestrClient(
+        token='token',
+        retry_backoff_seconds=0.0,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+async def test_api_cloud_client_retries_retryable_status():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={'status': 200, 'found': False})
+
+    response = await _client(handler).get_object(
+        cadastral_number='77:01:000101:1',
+    )
+
+    assert len(calls) == 2
+    assert calls[0].headers['Token'] == 'token'
+    assert response.status == 200
+    assert response.found is False
+
+
+async def test_api_cloud_client_raises_after_retries_exhausted():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError('boom', request=request)
+
+    with pytest.raises(RosreestrClientError):
+        await _client(handler, retries=1).get_object(
+            cadastral_number='77:01:000101:1',
+        )
+
+
+async def test_api_cloud_client_enforces_call_deadline():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1.0)
+        return httpx.Response(200, json={})
+
+    with pytest.raises(RosreestrClientError, match='deadline'):
+        await _client(handler, deadline_seconds=0.05).get_object(
+            cadastral_number='77:01:000101:1',
+        )
@@ -4,9 +4,11 @@ import time
 
 import pytest
 
+from shared.infra.negative_cache import NegativeCachePolicy
 from sources.rosreestr.cache.in_memory import InMemoryTtlRosreestrCache
 from sources.rosreestr.cached_client import CachedRosreestrClient
 from sources.rosreestr.dto import RosreestrApiResponse
+from sources.rosreestr.exceptions import RosreestrClientError
 from sources.rosreestr.ports import RosreestrClientPort
 
 
@@ -15,26 +17,30 @@ class _FakeClient(RosreestrClientPort):
         self.response = response
         self.calls = 0
 
-    def get_object(self, *, cadastral_number: str) -> RosreestrApiResponse:
+    async def get_object(
+        self,
+        *,
+        cadastral_number: str,
+    ) -> RosreestrApiResponse:
         self.calls += 1
         return self.response
 
 
 @pytest.mark.parametrize('ttl', [60])
-def test_cached_client_returns_cached_response(ttl: int):
+async def test_cached_client_returns_cached_response(ttl: int):
     response = RosreestrApiResponse(status=200, found=True)
     inner = _FakeClient(response)
     cache = InMemoryTtlRosreestrCache()
     client = CachedRosreestrClient(inner=inner, cache=cache, ttl_seconds=ttl)
 
-    first = client.get_object(cadastral_number='77:01:000101:1')
-    second = client.get_object(cadastral_number='77:01:000101:1')
+    first = await client.get_object(cadastral_number='77:01:000101:1')
+    second = await client.get_object(cadastral_number='77:01:000101:1')
 
     assert first is not second
     assert inner.calls == 1
 
 
-def test_cached_client_expires(monkeypatch):
+async def test_cached_client_expires(monkeypatch):
     response = RosreestrApiResponse(status=200, found=True)
     inner = _FakeClient(response)
     monotonic = time.monotonic
@@ -47,8 +53,60 @@ def test_cached_client_expires(monkeypatch):
     cache = InMemoryTtlRosreestrCache(now_fn=fake_now)
     client = CachedRosreestrClient(inner=inner, cache=cache, ttl_seconds=1)
 
-    client.get_object(cadastral_number='77:01:000101:1')
+    await client.get_object(cadastral_number='77:01:000101:1')
     fake_now.value = current + 2
-    client.get_object(cadastral_number='77:01:000101:1')
+    await client.get_object(cadastral_number='77:01:000101:1')
 
     assert inner.calls == 2
+
+
+async def test_cached_client_caches_not_found_with_negative_policy():
+    response = RosreestrApiResponse(status=200, found=False)
+    inner = _FakeClient(response)
+    client = CachedRosreestrClient(
+        inner=inner,
+        cache=InMemoryTtlRosreestrCache(),
+        ttl_seconds=60,
+        negative_policy=NegativeCachePolicy(jitter_ratio=0),
+    )
+
+    await client.get_object(cadastral_number='77:01:000101:1')
+    second = await client.get_object(cadastral_number='77:01:000101:1')
+
+    assert second.found is False
+    assert inner.calls == 1
+
+
+async def test_cached_client_skips_not_found_without_negative_policy():
+    inner = _FakeClient(RosreestrApiResponse(status=200, found=False))
+    client = CachedRosreestrClient(
+        inner=inner,
+        cache=InMemoryTtlRosreestrCache(),
+        ttl_seconds=60,
+    )
+
+    await client.get_object(cadastral_number='77:01:000101:1')
+    await client.get_object(cadastral_number='77:01:000101:1')
+
+    assert inner.calls == 2
+
+
+async def test_cached_client_replays_cached_upstream_error():
+    class _FailingClient(_FakeClient):
+        async def get_object(self, *, cadastral_number: str):
+            self.calls += 1
+            raise RosreestrClientError('boom')
+
+    inner = _FailingClient(RosreestrApiResponse())
+    client = CachedRosreestrClient(
+        inner=inner,
+        cache=InMemoryTtlRosreestrCache(),
+        ttl_seconds=60,
+        negative_policy=NegativeCachePolicy(jitter_ratio=0),
+    )
+
+    for _ in range(2):
+        with pytest.raises(RosreestrClientError):
+            await client.get_object(cadastral_number='77:01:000101:1')
+
+    assert inner.calls == 1
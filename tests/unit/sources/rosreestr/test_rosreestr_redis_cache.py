@@ -0,0 +1,107 @@
+"""Unit-тесты кэша Росреестра в Redis."""
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from sources.rosreestr.cache.redis_cache import RedisRosreestrCache
+
+
+class _FakePipeline:
+    def __init__(self, redis: '_FakeRedis') -> None:
+        self._redis = redis
+        self._calls: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> '_FakePipeline':
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def __getattr__(self, name: str):
+        def _queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+
+        return _queue
+
+    async def execute(self) -> list:
+        results = []
+        for name, args, kwargs in self._calls:
+            results.append(await getattr(self._redis, name)(*args, **kwargs))
+        return results
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+        self.index: dict[str, float] = {}
+        self.fail = False
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def get(self, name: str) -> bytes | None:
+        if self.fail:
+            raise RedisConnectionError('down')
+        return self.values.get(name)
+
+    async def set(self, name: str, value: bytes, ex: int) -> bool:
+        self.values[name] = value
+        self.ttls[name] = ex
+        return True
+
+    async def zadd(self, name: str, mapping: dict[str, float]) -> int:
+        self.index.update(mapping)
+        return len(mapping)
+
+    async def zremrangebyscore(self, name: str, low, high: float) -> int:
+        stale = [key for key, score in self.index.items() if score <= high]
+        for key in stale:
+            self.index.pop(key)
+        return len(stale)
+
+    async def zcard(self, name: str) -> int:
+        return len(self.index)
+
+    async def zpopmin(self, name: str, count: int) -> list:
+        popped = sorted(self.index.items(), key=lambda item: item[1])[:count]
+        for key, _ in popped:
+            self.index.pop(key)
+        return popped
+
+    async def delete(self, *names: str) -> int:
+        for name in names:
+            self.values.pop(name, None)
+        return len(names)
+
+
+async def test_redis_cache_round_trips_compressed_payload():
+    redis = _FakeRedis()
+    cache = RedisRosreestrCache(redis, max_items=10, now_fn=lambda: 0.0)
+    value = {'status': 200, 'found': True, 'object': {'cadNumber': '1:2'}}
+
+    await cache.set(key='k', value=value, ttl_seconds=60)
+
+    assert redis.ttls['flaffy:rosreestr:k'] == 60
+    assert b'cadNumber' not in redis.values['flaffy:rosreestr:k']
+    assert await cache.get(key='k') == value
+
+
+async def test_redis_cache_evicts_entries_over_limit():
+    redis = _FakeRedis()
+    cache = RedisRosreestrCache(redis, max_items=2, now_fn=lambda: 0.0)
+
+    await cache.set(key='a', value={'n': 1}, ttl_seconds=10)
+    await cache.set(key='b', value={'n': 2}, ttl_seconds=30)
+    await cache.set(key='c', value={'n': 3}, ttl_seconds=20)
+
+    assert await cache.get(key='a') is None
+    assert await cache.get(key='b') == {'n': 2}
+    assert await cache.get(key='c') == {'n': 3}
+
+
+async def test_redis_cache_treats_errors_as_miss():
+    redis = _FakeRedis()
+    redis.fail = True
+    cache = RedisRosreestrCache(redis, max_items=10)
+
+    assert await cache.get(key='k') is None
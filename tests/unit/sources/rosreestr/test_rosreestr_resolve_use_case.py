@@ -10,33 +10,33 @@ from sources.rosreestr.use_cases.resolve_house_by_cadastral import (
 )
 
 
-def test_resolve_returns_normalized_object_for_known_cadastral():
+async def test_resolve_returns_normalized_object_for_known_cadastral():
     use_case = ResolveRosreestrHouseByCadastralUseCase(
         client=StubRosreestrClient(),
     )
-    result = use_case.execute(cadastral_number='77:01:000101:1')
+    result = await use_case.execute(cadastral_number='77:01:000101:1')
     assert result is not None
     assert result.cad_number == '77:01:000101:1'
 
 
-def test_resolve_returns_none_when_not_found():
+async def test_resolve_returns_none_when_not_found():
     use_case = ResolveRosreestrHouseByCadastralUseCase(
         client=StubRosreestrClient(),
     )
-    assert use_case.execute(cadastral_number='77:01:999999:9') is None
+    assert await use_case.execute(cadastral_number='77:01:999999:9') is None
 
 
-def test_resolve_raises_value_error_on_invalid_cadastral():
+async def test_resolve_raises_value_error_on_invalid_cadastral():
     use_case = ResolveRosreestrHouseByCadastralUseCase(
         client=StubRosreestrClient(),
     )
     with pytest.raises(ValueError):
-        use_case.execute(cadastral_number='invalid')
+        await use_case.execute(cadastral_number='invalid')
 
 
-def test_resolve_raises_bad_response_on_status_error():
+async def test_resolve_raises_bad_response_on_status_error():
     class FailingClient(StubRosreestrClient):
-        def get_object(
+        async def get_object(
             self,
             *,
             cadastral_number: str,
@@ -45,4 +45,4 @@ def test_resolve_raises_bad_response_on_status_error():
 
     use_case = ResolveRosreestrHouseByCadastralUseCase(client=FailingClient())
     with pytest.raises(RosreestrBadResponseError):
-        use_case.execute(cadastral_number='77:01:000101:1')
+        await use_case.execute(cadastral_number='77:01:000101:1')
@@ -3,9 +3,9 @@
 from sources.rosreestr.stub_client import ROSREESTR_FIXTURE, StubRosreestrClient
 
 
-def test_stub_get_object_found():
+async def test_stub_get_object_found():
     client = StubRosreestrClient()
-    response = client.get_object(
+    response = await client.get_object(
         cadastral_number=list(ROSREESTR_FIXTURE.keys())[0]
     )
     assert response.found is True
@@ -13,8 +13,8 @@ def test_stub_get_object_found():
     assert response.object.cadNumber == list(ROSREESTR_FIXTURE.keys())[0]
 
 
-def test_stub_get_object_not_found():
+async def test_stub_get_object_not_found():
     client = StubRosreestrClient()
-    response = client.get_object(cadastral_number='random')
+    response = await client.get_object(cadastral_number='random')
     assert response.found is False
     assert response.object is None
@@ -4,7 +4,7 @@ import pytest
 
 from sources.domain.exceptions import ListingParseError
 from sources.domain.value_objects import ListingUrl
-from sources.infrastructure.avito import parse_avito_listing
+from sources.infrastructure.avito import listing_parser, parse_avito_listing
 
 
 def test_parse_avito_listing_populates_fields() -> None:
@@ -89,3 +89,71 @@ def test_find_value_limits_nodes_and_returns_none():
             url=url,
             preloaded_state={'tracking': big},
         )
+
+
+def _offbeat_state(listing_id: str) -> dict[str, object]:
+    """Состояние, где поля лежат вне статических путей."""
+
+    return {
+        'page': {
+            'card': {
+                'itemId': listing_id,
+                'title': 'Квартира 30 м², 2/5 эт.',
+                'address': 'Казань',
+                'priceValue': 4_100_000,
+                'coordinates': {'lat': 55.8, 'lon': 49.1},
+            },
+        },
+    }
+
+
+def test_parse_collects_fallback_fields_in_one_walk(monkeypatch):
+    """Поля вне путей находятся одним обходом на страницу."""
+
+    calls = []
+    find_values = listing_parser._find_values
+
+    def _counting_find_values(*args, **kwargs):
+        calls.append(args[1])
+        return find_values(*args, **kwargs)
+
+    monkeypatch.setattr(
+        listing_parser,
+        '_find_values',
+        _counting_find_values,
+    )
+    url = ListingUrl('https://www.avito.ru/item/1')
+
+    first = parse_avito_listing(url=url, preloaded_state=_offbeat_state('1'))
+    second = parse_avito_listing(url=url, preloaded_state=_offbeat_state('2'))
+
+    assert len(calls) == 2
+    assert set(calls[0]) == {
+        'listing_id',
+        'title',
+        'address',
+        'price',
+        'coords',
+    }
+    assert first.address_text == 'Казань'
+    assert first.price == 4_100_000
+    assert first.coords_lat == 55.8
+    assert second.listing_id.value == '2'
+    assert second.coords_lon == 49.1
+
+
+def test_parse_result_does_not_depend_on_previous_pages():
+    """Разбор одной страницы не зависит от ранее разобранных."""
+
+    url = ListingUrl('https://www.avito.ru/item/1')
+    page = {'blob': {'id': 222, 'item': {'id': 111}}}
+
+    fresh = parse_avito_listing(url=url, preloaded_state=page)
+    parse_avito_listing(
+        url=url,
+        preloaded_state={'blob': {'item': {'id': 111}}},
+    )
+    again = parse_avito_listing(url=url, preloaded_state=page)
+
+    assert fresh.listing_id.value == '222'
+    assert again.listing_id.value == '222'
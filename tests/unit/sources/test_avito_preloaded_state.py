@@ -1,9 +1,14 @@
 """Проверки извлечения window.__preloadedState__."""
 
+import orjson
 import pytest
 
 from sources.domain.exceptions import ListingParseError
-from sources.infrastructure.avito import extract_preloaded_state_json
+from sources.infrastructure.avito import (
+    PreloadedStateScanner,
+    extract_preloaded_state_bytes,
+    extract_preloaded_state_json,
+)
 
 
 def test_extract_preloaded_state_returns_json() -> None:
@@ -37,3 +42,35 @@ def test_extract_preloaded_state_not_found() -> None:
     html = '<html><body>No state here</body></html>'
     with pytest.raises(ListingParseError):
         extract_preloaded_state_json(html)
+
+
+def test_scanner_assembles_state_across_chunks() -> None:
+    """Маркер, строки и экранирование могут рваться на стыке чанков."""
+
+    html = (
+        b'<html><script>window.__preloadedState__ = '
+        b'{"a": "x\\\\\\"}{", "b": {"c": [1, 2]}};</script>'
+        b'<div>tail</div>'
+    )
+    expected = extract_preloaded_state_bytes(html)
+
+    for size in (1, 2, 3, 7):
+        scanner = PreloadedStateScanner()
+        chunks = [html[i : i + size] for i in range(0, len(html), size)]
+        for chunk in chunks:
+            if scanner.feed(chunk):
+                break
+        assert scanner.result() == expected
+
+    assert orjson.loads(expected) == {'a': 'x\\"}{', 'b': {'c': [1, 2]}}
+
+
+def test_scanner_reports_unterminated_state() -> None:
+    """Незакрытый JSON не отдаётся как результат."""
+
+    scanner = PreloadedStateScanner()
+    scanner.feed(b'window.__preloadedState__ = {"a": {"b": 1}')
+
+    assert scanner.done is False
+    with pytest.raises(ListingParseError):
+        scanner.result()
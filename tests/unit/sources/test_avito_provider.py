@@ -1,5 +1,6 @@
 """Тесты провайдера AvitoListingProvider."""
 
+import asyncio
 from datetime import UTC, datetime
 
 import httpx
@@ -9,38 +10,48 @@ from sources.domain.exceptions import ListingFetchError
 from sources.domain.value_objects import ListingUrl
 from sources.infrastructure.avito import AvitoListingProvider
 
+_LISTING_HTML = """
+<script>
+window.__preloadedState__ = {"data":{"item":{"id":"A-1",
+"title":"Квартира 50 м² 10/16 эт.","fullAddress":"Москва",
+"price":{"value":"5 000 000 ₽"},
+"coordinates":{"latitude":55.5,"longitude":37.5}}}};
+</script>
+"""
 
-def _client_factory(html: str, status: int = 200):
-    """Вернуть фабрику клиентов с MockTransport."""
 
-    def factory() -> httpx.Client:
-        def handler(_: httpx.Request) -> httpx.Response:
-            return httpx.Response(
-                status_code=status,
-                text=html,
-            )
+def _client(html: str, status: int = 200) -> httpx.AsyncClient:
+    """Вернуть async клиент с MockTransport."""
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status_code=status,
+            text=html,
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
 
-        transport = httpx.MockTransport(handler)
-        return httpx.Client(transport=transport)
 
-    return factory
+class _ChunkedStream(httpx.AsyncByteStream):
+    """Отдаёт тело частями и считает прочитанные части."""
 
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.read = 0
 
-def test_provider_fetch_and_normalize_success(monkeypatch) -> None:
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+
+async def test_provider_fetch_and_normalize_success() -> None:
     """Провайдер возвращает нормализованное объявление."""
 
-    html = """
-    <script>
-    window.__preloadedState__ = {"data":{"item":{"id":"A-1",
-    "title":"Квартира 50 м² 10/16 эт.","fullAddress":"Москва",
-    "price":{"value":"5 000 000 ₽"},
-    "coordinates":{"latitude":55.5,"longitude":37.5}}}};
-    </script>
-    """
-    provider = AvitoListingProvider(client_factory=_client_factory(html))
+    provider = AvitoListingProvider(client=_client(_LISTING_HTML))
     url = ListingUrl('https://www.avito.ru/item/1')
 
-    snapshot = provider.fetch_snapshot(url)
+    snapshot = await provider.fetch_snapshot(url)
     assert snapshot.source == 'avito'
     assert snapshot.url == url
     assert isinstance(snapshot.fetched_at, datetime)
@@ -51,13 +62,156 @@ def test_provider_fetch_and_normalize_success(monkeypatch) -> None:
     assert listing.price == 5_000_000
 
 
-def test_provider_fetch_snapshot_bad_status() -> None:
+async def test_provider_fetch_snapshot_bad_status() -> None:
     """HTTP != 200 вызывает ListingFetchError."""
 
     provider = AvitoListingProvider(
-        client_factory=_client_factory('<html></html>', status=500),
+        client=_client('<html></html>', status=500),
     )
     url = ListingUrl('https://www.avito.ru/item/2')
 
     with pytest.raises(ListingFetchError):
-        provider.fetch_snapshot(url)
+        await provider.fetch_snapshot(url)
+
+
+async def test_provider_stops_reading_after_preloaded_state() -> None:
+    """По HTTP/2 остаток страницы после preloaded state не скачивается."""
+
+    head, tail = _LISTING_HTML.encode().split(b'"price"')
+    stream = _ChunkedStream(
+        [
+            b'<html>' + head,
+            b'"price"' + tail,
+            b'<div>' + b'x' * 1024 + b'</div>',
+            b'</html>',
+        ],
+    )
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            stream=stream,
+            extensions={'http_version': b'HTTP/2'},
+        )
+
+    provider = AvitoListingProvider(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    snapshot = await provider.fetch_snapshot(
+        ListingUrl('https://www.avito.ru/item/3'),
+    )
+
+    assert stream.read == 2
+    assert provider.normalize(snapshot).listing_id.value == 'A-1'
+
+
+class _LocalTransport(httpx.AsyncBaseTransport):
+    """Направляет запросы на локальный сервер, сохраняя пул соединений."""
+
+    def __init__(self, port: int) -> None:
+        self._port = port
+        self._inner = httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(
+        self,
+        request: httpx.Request,
+    ) -> httpx.Response:
+        request.url = request.url.copy_with(
+            scheme='http',
+            host='127.0.0.1',
+            port=self._port,
+        )
+        return await self._inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+async def test_provider_reuses_http11_connection() -> None:
+    """По HTTP/1.1 остаток тела дочитывается, и соединение переиспользуется."""
+
+    body = (_LISTING_HTML + '<div>' + 'x' * 64 * 1024 + '</div>').encode()
+    response = (
+        b'HTTP/1.1 200 OK\r\n'
+        b'Content-Type: text/html\r\n'
+        b'Content-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body
+    )
+    connections = 0
+
+    async def serve(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        nonlocal connections
+        connections += 1
+        try:
+            while await reader.readuntil(b'\r\n\r\n'):
+                writer.write(response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(serve, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    provider = AvitoListingProvider(
+        client=httpx.AsyncClient(transport=_LocalTransport(port)),
+    )
+    try:
+        for item in range(5):
+            snapshot = await provider.fetch_snapshot(
+                ListingUrl(f'https://www.avito.ru/item/{item}'),
+            )
+            assert provider.normalize(snapshot).listing_id.value == 'A-1'
+    finally:
+        await provider._client.aclose()
+        server.close()
+        await server.wait_closed()
+
+    assert connections == 1
+
+
+async def test_provider_rejects_oversized_page() -> None:
+    """Страница без preloaded state сверх лимита обрывается."""
+
+    provider = AvitoListingProvider(
+        client=_client('<html>' + 'x' * 4096 + '</html>'),
+        max_bytes=1024,
+    )
+
+    with pytest.raises(ListingFetchError):
+        await provider.fetch_snapshot(ListingUrl('https://www.avito.ru/item/4'))
+
+
+@pytest.mark.parametrize(
+    'url',
+    [
+        'https://www.avito.ru/moskva/kvartiry/2-k._kvartira_54m_1234567890',
+        'https://m.avito.ru/moskva/kvartiry/2-k._kvartira_54m_1234567890/',
+        'https://www.avito.ru/moskva/kvartiry/x_1234567890?context=abc&utm=1',
+        'https://avito.ru/1234567890',
+    ],
+)
+def test_provider_canonical_key_ignores_host_and_query(url: str) -> None:
+    """URL-варианты одного объявления дают один ключ."""
+
+    provider = AvitoListingProvider(client=_client(''))
+
+    key = provider.canonical_key(ListingUrl(url))
+
+    assert key is not None
+    assert key[0] == 'avito'
+    assert key[1].value == '1234567890'
+
+
+def test_provider_canonical_key_without_id() -> None:
+    """Без id в пути ключа нет."""
+
+    provider = AvitoListingProvider(client=_client(''))
+
+    assert (
+        provider.canonical_key(ListingUrl('https://www.avito.ru/moskva'))
+        is None
+    )
@@ -6,23 +6,31 @@ from datetime import UTC, datetime
 
 import pytest
 
+from shared.infra.ttl_cache import TtlCache
 from sources.application.ports import ListingProviderPort
 from sources.application.use_cases import ResolveListingFromUrlUseCase
 from sources.domain.entities import ListingNormalized, ListingSnapshotRaw
 from sources.domain.exceptions import ListingNotSupportedError
 from sources.domain.value_objects import ListingId, ListingUrl
 
+pytestmark = pytest.mark.asyncio
+
 
 class _FakeProvider(ListingProviderPort):
     """Простой провайдер для тестов."""
 
     def __init__(self, expected_host: str) -> None:
         self._expected_host = expected_host
+        self.fetches = 0
 
     def is_supported(self, url: ListingUrl) -> bool:
         return self._expected_host in url.value
 
-    def fetch_snapshot(self, url: ListingUrl) -> ListingSnapshotRaw:
+    def canonical_key(self, url: ListingUrl) -> tuple[str, ListingId] | None:
+        return 'fake', ListingId(url.value.split('?')[0].rsplit('/', 1)[-1])
+
+    async def fetch_snapshot(self, url: ListingUrl) -> ListingSnapshotRaw:
+        self.fetches += 1
         return ListingSnapshotRaw(
             source='fake',
             url=url,
@@ -38,22 +46,42 @@ class _FakeProvider(ListingProviderPort):
         )
 
 
-def test_resolve_listing_success() -> None:
+async def test_resolve_listing_success() -> None:
     """Use-case выбирает подходящего провайдера."""
 
     provider = _FakeProvider('example.com')
     use_case = ResolveListingFromUrlUseCase((provider,))
 
-    listing = use_case.execute('https://example.com/listing/1')
+    listing = await use_case.execute('https://example.com/listing/1')
 
     assert listing.listing_id.value == 'fake-1'
     assert listing.source == 'fake'
 
 
-def test_resolve_listing_no_provider() -> None:
+async def test_resolve_listing_no_provider() -> None:
     """Если нет провайдера, поднимается ListingNotSupportedError."""
 
     use_case = ResolveListingFromUrlUseCase(())
 
     with pytest.raises(ListingNotSupportedError):
-        use_case.execute('https://unsupported.com/item')
+        await use_case.execute('https://unsupported.com/item')
+
+
+async def test_resolve_listing_caches_by_canonical_key() -> None:
+    """Варианты одной ссылки обслуживаются из кэша без загрузки."""
+
+    provider = _FakeProvider('example.com')
+    cache = TtlCache(max_items=16, ttl_seconds=60)
+    use_case = ResolveListingFromUrlUseCase((provider,), cache=cache)
+
+    first = await use_case.execute('https://example.com/listing/1?utm=a')
+    second = await use_case.execute('https://m.example.com/listing/1?ctx=b')
+
+    assert provider.fetches == 1
+    assert second is first
+    assert len(cache) == 1
+    assert ('fake', ListingId('1')) in cache
+    assert use_case.canonical_key('https://example.com/listing/1?x=1') == (
+        'fake:1'
+    )
+    assert use_case.canonical_key('not a url') is None